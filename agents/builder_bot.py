@@ -1,10 +1,52 @@
 from mcpi.minecraft import Minecraft
 from core.base_agent import BaseAgent
+from core.fsm import AgentState
 from core.messaging import Message
 from core.utils import load_classes
 from strategies import BuildingStrategy
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional
+import collections
+import itertools
+import logging
+import sys
+import threading
 import time
 
+# One thread formats every BuilderBot's placement log records, off the build path
+_PLACEMENT_LOG_WRITER = ThreadPoolExecutor(
+    max_workers=1, thread_name_prefix="placement-log"
+)
+
+
+@dataclass(slots=True)
+class BuildJob:
+    """
+    A queued construction job.
+
+    Attributes:
+        location: The (x, z, y) build site.
+        strategy: The BuildingStrategy instance that will execute the build.
+        bom (Dict[str, int]): The Bill of Materials for the build.
+        checker (Callable): Compiled BOM completion predicate (see _compile_bom_checker).
+        collected (Counter): Materials received so far.
+        status (str): 'waiting_for_materials' or 'READY_TO_BUILD'.
+        retry_count (int): Inventory updates received without completing the BOM.
+        job_id (int): Sent with the job's requirements and echoed back by
+            deliveries, so materials are credited to this job.
+    """
+
+    location: Any
+    strategy: Optional[BuildingStrategy]
+    bom: Dict[str, int]
+    checker: Callable
+    collected: collections.Counter = field(default_factory=collections.Counter)
+    status: str = "waiting_for_materials"
+    retry_count: int = 0
+    job_id: int = 0
+
 
 class BuilderBot(BaseAgent):
     """
@@ -22,62 +64,132 @@ class BuilderBot(BaseAgent):
         self.strategies = []
         # Store strategies as a dict for lookup: name -> instance
         self.strategy_map = {}
+        # Reverse lookup: id(strategy instance) -> key, used when checkpointing
+        self._strategy_to_key = {}
+        # key -> BOM computed once at load time. BOMs are shared with the
+        # published requirement payloads, so treat them as read-only.
+        self._bom_cache = {}
         self.load_strategies()
-        self.pending_builds = []
-        self.current_scan_results = []
+        self.pending_builds = collections.deque()
+        # Bus workers and the agent thread both touch the build queue; hold
+        # this while reading or changing pending_builds and its indexes
+        self._builds_lock = threading.RLock()
+        # tuple(location) -> BuildJob in pending_builds, for O(1) duplicate checks
+        self._pending_index = {}
+        # job_id -> job in pending_builds, for deliveries that name their job
+        self._jobs_by_id = {}
+        self._job_ids = itertools.count(1)
+        # Decision for the head of pending_builds, refreshed whenever it changes
+        self._next_action = "IDLE"
+        # Flat (x, z, y) build sites, packed 3 ints per site
+        self.current_scan_results = array("i")
         self.selected_strategy_key = None
+        # Seconds build strategies pause between layers for a visible
+        # build-up effect; 0 builds at full speed (set e.g. 1.0 for demos)
+        self.build_delay = 0.0
+
+        # Suffix of "control.builderbot.<suffix>" -> handler
+        self._control_handlers = {
+            "plan.list": self.on_list_plans,
+            "plan.set": self.on_set_plan,
+            "bom": self.on_bom_request,
+            "build": self.on_build_command,
+        }
         
         # Layer tracking
         self.current_layer_y = None
-        self.current_layer_stats = {}
+        # Packed (block_id << 8) | meta -> count for the layer being placed
+        self.current_layer_stats = collections.Counter()
+
+        # Buffered (x, y, z, block_id, meta) placements, flushed via setBlocks
+        self._pending_placements = []
+
+        # Outgoing chat lines, coalesced into one postToChat per flush window
+        self._chat_buf = []
+        self._chat_lock = threading.Lock()
+        self._chat_last_flush = 0.0
+
+        # (x, y, z, block_id, meta) placement log records since the last flush;
+        # each flush hands them to the shared log writer as one batch
+        self._log_batch = []
+        self._log_future = None
 
         if self.bus:
             self.bus.subscribe("map.v1", self.on_map_received)
             self.bus.subscribe("inventory.v1", self.on_inventory_received)
-            self.bus.subscribe("control.builderbot.plan.list", self.on_list_plans)
-            self.bus.subscribe("control.builderbot.plan.set", self.on_set_plan)
-            self.bus.subscribe("control.builderbot.bom", self.on_bom_request)
-            self.bus.subscribe("control.builderbot.build", self.on_build_command)
+            self.bus.subscribe("control.builderbot.*", self._dispatch_control)
             self.bus.subscribe("control.workflow.run", self.on_workflow_run)
 
+    def stop(self):
+        """Stops the agent once its queued placement log records are written."""
+        super().stop()
+        future = self._log_future
+        if future is not None:
+            future.result()
+
+    def transition_state(self, new_state, reason):
+        super().transition_state(new_state, reason)
+        if new_state != AgentState.RUNNING:
+            # act() no longer runs to release lines buffered while RUNNING
+            self._chat_flush()
+
     def _get_checkpoint_data(self):
         # We can't easily serialize 'strategy' objects in pending_builds.
-        # So we'll save the 'template_key' and recreate it.
-        serializable_builds = []
-        for b in self.pending_builds:
-            item = b.copy()
-            if "strategy" in item:
-                # Save the key name instead of object
-                # We need to find the key for this strategy instance
-                for key, val in self.strategy_map.items():
-                    if val == item["strategy"]:
-                        item["strategy_key"] = key
-                        break
-                del item["strategy"]
-            serializable_builds.append(item)
+        # So we save the strategy key instead and recreate it on restore;
+        # compiled BOM checkers are rebuilt on restore as well.
+        with self._builds_lock:
+            serializable_builds = [
+                {
+                    "location": b.location,
+                    "bom": b.bom,
+                    "status": b.status,
+                    "retry_count": b.retry_count,
+                    "collected": dict(b.collected),
+                    "strategy_key": self._strategy_to_key.get(id(b.strategy)),
+                    "job_id": b.job_id,
+                }
+                for b in self.pending_builds
+            ]
 
         return {
             "pending_builds": serializable_builds,
             "selected_strategy_key": self.selected_strategy_key,
-            "current_scan_results": self.current_scan_results,  # Assuming tuples/lists
+            "current_scan_results": [
+                list(self.current_scan_results[i : i + 3])
+                for i in range(0, len(self.current_scan_results), 3)
+            ],
         }
 
     def _apply_checkpoint_data(self, data):
         self.selected_strategy_key = data.get("selected_strategy_key")
-        self.current_scan_results = data.get("current_scan_results", [])
-
-        saved_builds = data.get("pending_builds", [])
-        restored_builds = []
-        for b in saved_builds:
-            item = b.copy()
-            if "strategy_key" in item:
-                key = item["strategy_key"]
-                if key in self.strategy_map:
-                    item["strategy"] = self.strategy_map[key]
-                del item["strategy_key"]
-            restored_builds.append(item)
-
-        self.pending_builds = restored_builds
+        self._store_scan_results(data.get("current_scan_results", []))
+
+        restored_builds = [
+            BuildJob(
+                location=b["location"],
+                strategy=self.strategy_map.get(b.get("strategy_key")),
+                bom=b["bom"],
+                checker=self._compile_bom_checker(b["bom"]),
+                collected=collections.Counter(b.get("collected", {})),
+                status=b["status"],
+                retry_count=b.get("retry_count", 0),
+                job_id=b.get("job_id", 0),
+            )
+            for b in data.get("pending_builds", [])
+        ]
+
+        with self._builds_lock:
+            self.pending_builds = collections.deque(restored_builds)
+            self._pending_index = {tuple(b.location): b for b in restored_builds}
+            # Jobs from older checkpoints have no id yet; they get fresh ones
+            self._job_ids = itertools.count(
+                max((b.job_id for b in restored_builds), default=0) + 1
+            )
+            for b in restored_builds:
+                if not b.job_id:
+                    b.job_id = next(self._job_ids)
+            self._jobs_by_id = {b.job_id: b for b in restored_builds}
+            self._refresh_next_action()
 
     def load_strategies(self):
         """
@@ -92,14 +204,69 @@ class BuilderBot(BaseAgent):
                 self.strategies.append(strategy)
                 # Key: Class name lower, e.g. "simplehutstrategy", "simplehut", "stonetower"
                 # Let's map "SimpleHutStrategy" -> simplehut, "StoneTower" -> stonetower
-                key = strat_cls.__name__.lower().replace("strategy", "")
+                # Keys are short identifiers, interned so lookups compare by identity
+                key = sys.intern(strat_cls.__name__.lower().replace("strategy", ""))
                 self.strategy_map[key] = strategy
+                self._strategy_to_key[id(strategy)] = key
+                self._bom_cache[key] = strategy.get_bom()
                 self.logger.info(f"Loaded strategy: {strat_cls.__name__} as '{key}'")
             except Exception as e:
                 self.logger.error(
                     f"Failed to instantiate strategy {strat_cls.__name__}: {e}"
                 )
 
+    def _chat(self, text, max_lines=8, window=0.1):
+        """
+        Queues a chat line, sending the buffer once it is full or stale.
+
+        Only act() flushes the buffer on its own, so outside RUNNING the line
+        is sent straight away.
+
+        Args:
+            text (str): The line to post.
+            max_lines (int): Flush as soon as this many lines are buffered.
+            window (float): Flush if the last flush is older than this (seconds).
+        """
+        with self._chat_lock:
+            self._chat_buf.append(text)
+            due = (
+                len(self._chat_buf) >= max_lines
+                or time.monotonic() - self._chat_last_flush > window
+                or self.state != AgentState.RUNNING
+            )
+        if due:
+            self._chat_flush()
+
+    def _chat_flush(self):
+        """Sends all buffered chat lines as a single postToChat call."""
+        with self._chat_lock:
+            if not self._chat_buf:
+                return
+            lines = self._chat_buf
+            self._chat_buf = []
+            self._chat_last_flush = time.monotonic()
+
+        # The mcpi protocol is newline-terminated, so lines are joined inline
+        if self.mc:
+            self.mc.postToChat(" | ".join(lines))
+
+    def _dispatch_control(self, message: Message):
+        """Routes a 'control.builderbot.*' message to its handler by suffix."""
+        handler = self._control_handlers.get(message.type[len("control.builderbot."):])
+        if handler:
+            handler(message)
+
+    def _store_scan_results(self, flat_spots):
+        """
+        Packs (x, z, y) build sites into a flat int array.
+
+        Args:
+            flat_spots: Iterable of (x, z, y) sequences from ExplorerBot.
+        """
+        self.current_scan_results = array(
+            "i", [int(c) for spot in flat_spots for c in spot[:3]]
+        )
+
     def on_map_received(self, message: Message):
         """
         Handles map data from the ExplorerBot.
@@ -111,7 +278,7 @@ class BuilderBot(BaseAgent):
         flat_spots = message.payload.get("flat_spots", [])
 
         if flat_spots:
-            self.current_scan_results = flat_spots
+            self._store_scan_results(flat_spots)
             self.logger.info(f"Stored {len(flat_spots)} build sites.")
 
             if getattr(self, "auto_build_next_map", False):
@@ -119,16 +286,15 @@ class BuilderBot(BaseAgent):
                 self.logger.info("Auto-building due to workflow.")
                 self.on_build_command(message)
             else:
-                if self.mc:
-                    self.mc.postToChat(
-                        "[Builder] Sites found. Use '/builder plan set' then '/builder build'."
-                    )
+                self._chat(
+                    "[Builder] Sites found. Use '/builder plan set' then '/builder build'."
+                )
         else:
             self.logger.warning("No flat spots received.")
 
     def on_workflow_run(self, msg):
         payload = msg.payload or {}
-        template = payload.get("template", "simplehut").lower()
+        template = sys.intern(str(payload.get("template", "simplehut")).lower())
 
         # Determine strategy
         if template in self.strategy_map:
@@ -137,218 +303,234 @@ class BuilderBot(BaseAgent):
             self.selected_strategy_key = list(self.strategy_map.keys())[0]
 
         self.auto_build_next_map = True
-        if self.mc:
-            self.mc.postToChat(
-                f"[Builder] Workflow active. Will build {self.selected_strategy_key} when map arrives."
-            )
+        self._chat(
+            f"[Builder] Workflow active. Will build {self.selected_strategy_key} when map arrives."
+        )
 
     def on_list_plans(self, msg):
         plans = ", ".join(self.strategy_map.keys())
-        if self.mc:
-            self.mc.postToChat(f"[Builder] Plans: {plans}")
+        self._chat(f"[Builder] Plans: {plans}")
 
     def on_set_plan(self, msg):
-        template = msg.payload.get("template", "").lower()
+        template = sys.intern(str(msg.payload.get("template", "")).lower())
         if template in self.strategy_map:
             self.selected_strategy_key = template
-            if self.mc:
-                self.mc.postToChat(f"[Builder] Selected: {template}")
+            self._chat(f"[Builder] Selected: {template}")
         else:
-            if self.mc:
-                self.mc.postToChat(f"[Builder] Unknown: {template}")
+            self._chat(f"[Builder] Unknown: {template}")
 
     def on_bom_request(self, msg):
         if not self.selected_strategy_key:
-            if self.mc:
-                self.mc.postToChat("[Builder] No plan selected.")
+            self._chat("[Builder] No plan selected.")
             return
 
-        strat = self.strategy_map[self.selected_strategy_key]
-        bom = strat.get_bom()
-        if self.mc:
-            self.mc.postToChat(f"[Builder] BOM: {bom}")
+        bom = self._bom_cache[self.selected_strategy_key]
+        self._chat(f"[Builder] BOM: {bom}")
 
     def on_build_command(self, msg):
         """
         Triggered when user types '/builder build'
         """
         if not self.selected_strategy_key:
-            if self.mc:
-                self.mc.postToChat("[Builder] Select a plan first!")
+            self._chat("[Builder] Select a plan first!")
             return
 
         if not self.current_scan_results:
             self.logger.warning("Cannot build: No site selected/scanned yet.")
-            if self.mc:
-                self.mc.postToChat("[Builder] Scan required first.")
+            self._chat("[Builder] Scan required first.")
             return
 
         strategy = self.strategy_map[self.selected_strategy_key]
-        target = self.current_scan_results[0]
+        target = tuple(self.current_scan_results[0:3])
 
         # BOM Recalculation & Republishing Logic
         # Check if we already have a pending build at this location
-        existing_idx = -1
-        for i, b in enumerate(self.pending_builds):
-            # Compare locations (Vec3 or tuple)
-            # target is likely a tuple or Vec3 from Explorer
-            # Let's assume strict equality or close proximity
-            loc = b["location"]
-            if loc == target:  # Simple equality check
-                existing_idx = i
-                break
-
-        bom = strategy.get_bom()
-
-        if existing_idx != -1:
-            self.logger.info(
-                f"Updating existing build plan at {target} to {self.selected_strategy_key}"
-            )
-            if self.mc:
-                self.mc.postToChat(
+        # Locations may arrive as tuples, lists (checkpoints) or Vec3, so key by tuple
+        target_key = tuple(target)
+
+        bom = self._bom_cache[self.selected_strategy_key]
+
+        # Chat is posted once the lock is released, since posting can block
+        chat = []
+        with self._builds_lock:
+            existing = self._pending_index.get(target_key)
+
+            if existing is not None:
+                self.logger.info(
+                    f"Updating existing build plan at {target} to {self.selected_strategy_key}"
+                )
+                chat.append(
                     f"[Builder] Updating plan to {self.selected_strategy_key}. Re-sending BOM."
                 )
 
-            # Update the entry
-            self.pending_builds[existing_idx]["strategy"] = strategy
-            self.pending_builds[existing_idx]["bom"] = bom
-            self.pending_builds[existing_idx]["status"] = "waiting_for_materials"
-            # Reset status to ensure we wait for new mats if needed
-            self.pending_builds[existing_idx]["retry_count"] = 0
-        else:
-            self.logger.info(
-                f"Initiating build of {self.selected_strategy_key} at {target}"
-            )
-            if self.mc:
-                self.mc.postToChat(
+                # Update the entry
+                existing.strategy = strategy
+                existing.bom = bom
+                existing.checker = self._compile_bom_checker(bom)
+                existing.status = "waiting_for_materials"
+                # Reset status to ensure we wait for new mats if needed
+                existing.retry_count = 0
+                job_id = existing.job_id
+            else:
+                self.logger.info(
+                    f"Initiating build of {self.selected_strategy_key} at {target}"
+                )
+                chat.append(
                     f"BuilderBot: Calculating BOM for {self.selected_strategy_key}..."
                 )
-            if self.mc:
-                self.mc.postToChat(f"BuilderBot: Need {bom}")
-
-            self.pending_builds.append(
-                {
-                    "location": target,
-                    "strategy": strategy,
-                    "bom": bom,
-                    "status": "waiting_for_materials",
-                    "retry_count": 0,
-                }
+                chat.append(f"BuilderBot: Need {bom}")
+
+                build_job = BuildJob(
+                    location=target,
+                    strategy=strategy,
+                    bom=bom,
+                    checker=self._compile_bom_checker(bom),
+                    job_id=next(self._job_ids),
+                )
+                self.pending_builds.append(build_job)
+                self._pending_index[target_key] = build_job
+                self._jobs_by_id[build_job.job_id] = build_job
+                job_id = build_job.job_id
+            self._refresh_next_action()
+
+        for line in chat:
+            self._chat(line)
+
+        # Publish requirements (always republish on update).
+        # A fresh Message is needed each time: the bus keeps published messages
+        # in its history and MinerBot queues the payload by reference.
+        if self.bus:
+            self.bus.publish(
+                Message(
+                    type="materials.requirements.v1",
+                    source=self.name,
+                    target="MinerBot",
+                    payload={"requirements": bom, "job_id": job_id},
+                )
             )
 
-        # Publish requirements (always republish on update)
-        req_msg = Message(
-            type="materials.requirements.v1",
-            source=self.name,
-            target="MinerBot",
-            payload={"requirements": bom},
-        )
-        if self.bus:
-            self.bus.publish(req_msg)
+    @staticmethod
+    def _compile_bom_checker(bom):
+        """
+        Compiles a completion predicate for a fixed Bill of Materials.
 
-    def on_inventory_received(self, message: Message):
-        self.logger.info(f"Received inventory update from {message.source}")
-        inventory = message.payload.get("inventory", {})
+        The special cases (interchangeable STONE/COBBLESTONE, WOOD -> WOOD_PLANKS,
+        COAL_ORE + WOOD -> TORCH) are resolved once here, so each inventory update
+        only evaluates straight-line comparisons.
 
-        if not self.pending_builds:
-            self.logger.warning("Received inventory but no pending builds.")
-            return
+        Args:
+            bom (dict): Material name -> quantity needed.
+
+        Returns:
+            Callable: checker(collected) -> (complete, missing_items)
+        """
+        stone_items = [
+            (item, needed) for item, needed in bom.items() if item in ("STONE", "COBBLESTONE")
+        ]
+        needed_planks = bom.get("WOOD_PLANKS")
+        needed_torch = bom.get("TORCH")
+        plain_items = [
+            (item, needed)
+            for item, needed in bom.items()
+            if item not in ("STONE", "COBBLESTONE", "WOOD_PLANKS", "TORCH")
+        ]
+
+        def checker(collected):
+            get = collected.get
+            missing = []
 
-        build_job = self.pending_builds[0]
+            # Interchangeable Stone/Cobblestone
+            if stone_items:
+                stone_pool = get("STONE", 0) + get("COBBLESTONE", 0)
+                for item, needed in stone_items:
+                    if stone_pool < needed:
+                        missing.append(item)
 
-        # Initialize collected if new
-        if "collected" not in build_job:
-            build_job["collected"] = {}
+            # Special conversion for Wood -> Planks (1 Wood gives 4 Planks)
+            if needed_planks is not None:
+                if get("WOOD_PLANKS", 0) + get("WOOD", 0) * 4 < needed_planks:
+                    missing.append("WOOD_PLANKS")
 
-        # Accumulate materials
-        for item, count in inventory.items():
-            current = build_job["collected"].get(item, 0)
-            build_job["collected"][item] = current + count
+            # Simplification: 1 Coal + 1 Wood -> 4 Torches
+            if needed_torch is not None:
+                potential_torches = get("TORCH", 0) + min(get("COAL_ORE", 0), get("WOOD", 0)) * 4
+                if potential_torches < needed_torch:
+                    missing.append("TORCH")
 
-        self.logger.info(
-            f"Current Job Status: Collected {build_job['collected']} / Needed {build_job['bom']}"
-        )
+            for item, needed in plain_items:
+                if get(item, 0) < needed:
+                    missing.append(item)
 
-        # Check against BOM
-        bom = build_job["bom"]
-        complete = True
+            return not missing, missing
 
-        for item, needed in bom.items():
-            have = build_job["collected"].get(item, 0)
+        return checker
 
-            # Interchangeable Stone/Cobblestone
-            if item in ["STONE", "COBBLESTONE"]:
-                stone = build_job["collected"].get("STONE", 0)
-                cobble = build_job["collected"].get("COBBLESTONE", 0)
-                if (stone + cobble) < needed:
-                    complete = False
-                    break
-
-            # Special conversion for Wood -> Planks
-            elif item == "WOOD_PLANKS":
-                wood_have = build_job["collected"].get("WOOD", 0)
-                # 1 Wood gives 4 Planks
-                # So total planks available = planks_have + (wood_have * 4)
-                total_planks = have + (wood_have * 4)
-                if total_planks < needed:
-                    complete = False
-                    break
-            # Logic for TORCH crafting from COAL_ORE and WOOD
-            elif item == "TORCH":
-                coal_have = build_job["collected"].get("COAL_ORE", 0)
-                wood_have = build_job["collected"].get("WOOD", 0)
-                # 1 Coal + 1 Stick (~0.5 Wood) = 4 Torches
-                # Simplification: 1 Coal + 1 Wood -> 4 Torches
-                potential_torches = have + (min(coal_have, wood_have) * 4)
-                if potential_torches < needed:
-                    complete = False
-                    break
-            elif have < needed:
-                complete = False
-                break
-
-        if complete:
-            self.logger.info("All materials collected. Ready to build.")
-            if self.mc:
-                self.mc.postToChat(
-                    "BuilderBot: All materials collected! Ready to start construction..."
-                )
-            # Update status instead of building immediately
-            build_job["status"] = "READY_TO_BUILD"
-        else:
-            # Check for retry limit simulation
-            build_job["retry_count"] = build_job.get("retry_count", 0) + 1
-            if build_job["retry_count"] >= 10:
-                self.logger.warning(
-                    "Retry limit reached (10). Simulating remaining materials."
+    def on_inventory_received(self, message: Message):
+        self.logger.info(f"Received inventory update from {message.source}")
+        inventory = message.payload.get("inventory", {})
+
+        # Status flips and the cached decision change together, so a refresh
+        # on another worker cannot overwrite BUILD with a stale WAIT. Chat is
+        # posted after the lock is released, since posting can block.
+        chat = None
+        with self._builds_lock:
+            if not self.pending_builds:
+                self.logger.warning("Received inventory but no pending builds.")
+                return
+
+            # Deliveries naming a job may arrive in any order; others go to the
+            # oldest job, which is the order they were requested in
+            job_id = message.payload.get("job_id")
+            if job_id is None:
+                build_job = self.pending_builds[0]
+            else:
+                build_job = self._jobs_by_id.get(job_id)
+                if build_job is None:
+                    self.logger.warning(f"Received inventory for unknown job {job_id}.")
+                    return
+
+            # Accumulate materials
+            build_job.collected.update(inventory)
+
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(
+                    "Current Job Status: Collected %s / Needed %s",
+                    dict(build_job.collected),
+                    build_job.bom,
                 )
-                if self.mc:
-                    self.mc.postToChat(
-                        "[Builder] Material collection failed 10 times. Simulating..."
+
+            # Check against BOM
+            complete, missing = build_job.checker(build_job.collected)
+
+            if complete:
+                self.logger.info("All materials collected. Ready to build.")
+                chat = "BuilderBot: All materials collected! Ready to start construction..."
+                # Update status instead of building immediately
+                build_job.status = "READY_TO_BUILD"
+                self._next_action = "BUILD"
+            elif message.payload.get("partial"):
+                # More of the same delivery is on its way; not a failed try
+                self.logger.info("Partial delivery. Still missing %s.", missing)
+            else:
+                # Check for retry limit simulation
+                build_job.retry_count += 1
+                if build_job.retry_count >= 10:
+                    self.logger.warning(
+                        "Retry limit reached (10). Simulating remaining materials."
+                    )
+                    chat = "[Builder] Material collection failed 10 times. Simulating..."
+                    build_job.status = "READY_TO_BUILD"
+                    self._next_action = "BUILD"
+                else:
+                    # Missing items come from the checker; no second pass over the BOM
+                    self.logger.info(
+                        "Still missing %s. Waiting for more. (Try %d/10)",
+                        missing,
+                        build_job.retry_count,
                     )
-                build_job["status"] = "READY_TO_BUILD"
-                return
 
-            self.logger.info(
-                f"Still missing materials. Waiting for more. (Try {build_job['retry_count']}/10)"
-            )
-            if self.mc:
-                missing_str = []
-                for item, needed in bom.items():
-                    have = build_job["collected"].get(item, 0)
-                    # Quick approximate check for user info
-                    if item in ["STONE", "COBBLESTONE"]:
-                        if (
-                            build_job["collected"].get("STONE", 0)
-                            + build_job["collected"].get("COBBLESTONE", 0)
-                        ) < needed:
-                            missing_str.append(f"{item}")
-                    elif have < needed:
-                        missing_str.append(f"{item}")
-
-                # Only post if strict missing to avoid spamming "WOOD_PLANKS" when we have wood
-                # self.mc.postToChat(f"BuilderBot: Missing {missing_str}")
-                pass
+        if chat:
+            self._chat(chat)
 
     def perceive(self):
         """
@@ -358,27 +540,47 @@ class BuilderBot(BaseAgent):
         """
         pass
 
+    def _refresh_next_action(self):
+        """Re-derives the cached decision from the head of pending_builds."""
+        with self._builds_lock:
+            if not self.pending_builds:
+                self._next_action = "IDLE"
+                return
+
+            # Any job whose materials are in can go ahead of older ones
+            if self._next_ready_job() is not None:
+                self._next_action = "BUILD"
+            elif self.pending_builds[0].status == "waiting_for_materials":
+                # We already check for materials in on_inventory_received
+                self._next_action = "WAIT"
+            else:
+                self._next_action = "IDLE"
+
+    def _next_ready_job(self):
+        """Returns the oldest job that is READY_TO_BUILD, or None."""
+        with self._builds_lock:
+            for job in self.pending_builds:
+                if job.status == "READY_TO_BUILD":
+                    return job
+        return None
+
     def decide(self):
         """
         Decide the next action based on current state.
-        """
-        if not self.pending_builds:
-            return "IDLE"
-
-        current_job = self.pending_builds[0]
-        if current_job["status"] == "READY_TO_BUILD":
-            return "BUILD"
-        elif current_job["status"] == "waiting_for_materials":
-            # Check if we have materials again? or just wait
-            # We already check in on_inventory_received
-            return "WAIT"
 
-        return "IDLE"
+        The decision is maintained by the handlers that change pending_builds
+        (see _refresh_next_action), so this is a plain read.
+        """
+        return self._next_action
 
     def act(self):
         """
         Execute the decided action.
         """
+        # Release any chat lines left behind by the last flush window
+        if self._chat_buf:
+            self._chat_flush()
+
         decision = self.decide()
 
         if decision == "BUILD":
@@ -393,6 +595,9 @@ class BuilderBot(BaseAgent):
         """
         Places a block in the world and logs the action for compliance.
 
+        The placement is buffered and sent on the next flush_placements() call
+        (at each layer change and at the end of build_structure).
+
         Args:
             x, y, z: Coordinates.
             block_id: The ID of the block to place.
@@ -406,13 +611,18 @@ class BuilderBot(BaseAgent):
             self.current_layer_y = y
 
         if y != self.current_layer_y:
+            # Push the finished layer to the world before summarising it
+            self.flush_placements()
             try:
                 # Log Summary for the completed layer
                 summary_payload = {
                     "event": "layer_summary",
                     "agent": self.name,
                     "layer_y": self.current_layer_y,
-                    "materials_used": self.current_layer_stats,
+                    "materials_used": {
+                        f"{k >> 8}:{k & 0xFF}": v
+                        for k, v in self.current_layer_stats.items()
+                    },
                     "timestamp": time.time()
                 }
                 self.logger.info(f"Layer Complete: {summary_payload}")
@@ -421,46 +631,157 @@ class BuilderBot(BaseAgent):
             
             # Reset for new layer
             self.current_layer_y = y
-            self.current_layer_stats = {}
+            self.current_layer_stats = collections.Counter()
 
         # Update stats
-        key = f"{block_id}:{meta}"
-        self.current_layer_stats[key] = self.current_layer_stats.get(key, 0) + 1
-
-        self.mc.setBlock(x, y, z, block_id, meta)
-
-        # Structured Logging of Placement
-        log_payload = {
-            "event": "block_placement",
-            "agent": self.name,
-            "x": x,
-            "y": y,
-            "z": z,
-            "block_id": block_id,
-            "meta": meta,
-            "timestamp": time.time(),
-        }
-        self.logger.info(f"Block Placed: {log_payload}")
+        self.current_layer_stats[(block_id << 8) | (meta & 0xFF)] += 1
+
+        self._pending_placements.append((x, y, z, block_id, meta))
+
+        # Structured Logging of Placement (formatted by _log_placements)
+        if self.logger.isEnabledFor(logging.INFO):
+            self._log_batch.append((x, y, z, block_id, meta))
+
+    def _log_placements(self, ts, batch):
+        """
+        Log writer thread: turns one flushed batch into log output.
+
+        The batch is emitted as a single log record so the logger lock is taken
+        once per batch instead of once per block.
+
+        Args:
+            ts (float): When the batch was sent to the world.
+            batch (list): (x, y, z, block_id, meta) records, in placement order.
+        """
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        lines = []
+        for x, y, z, block_id, meta in batch:
+            log_payload = {
+                "event": "block_placement",
+                "agent": self.name,
+                "x": x,
+                "y": y,
+                "z": z,
+                "block_id": block_id,
+                "meta": meta,
+                "timestamp": ts,
+            }
+            lines.append(f"Block Placed: {log_payload}")
+        self.logger.info("\n".join(lines))
+
+    def place_blocks_bulk(self, region_blocks):
+        """
+        Places several blocks at once and flushes them as cuboid RPCs.
+
+        Args:
+            region_blocks: Iterable of (x, y, z, block_id) or (x, y, z, block_id, meta).
+        """
+        for entry in region_blocks:
+            self.place_block(*entry)
+        self.flush_placements()
+
+    def flush_placements(self):
+        """
+        Sends all buffered placements to the world.
+
+        Placements are coalesced into axis-aligned boxes of identical block/meta,
+        so a uniform region costs a single setBlocks call instead of one setBlock
+        per block.
+        """
+        if not self._pending_placements:
+            return
+
+        placements = self._pending_placements
+        self._pending_placements = []
+
+        if not self.mc:
+            return
+
+        for box in self._coalesce_placements(placements):
+            self.mc.setBlocks(*box)
+
+        # One timestamp per flush: the moment this batch reached the world
+        batch = self._log_batch
+        self._log_batch = []
+        if batch:
+            self._log_future = _PLACEMENT_LOG_WRITER.submit(
+                self._log_placements, time.time(), batch
+            )
+
+    @staticmethod
+    def _coalesce_placements(placements):
+        """
+        Merges single-block placements into axis-aligned boxes.
+
+        Args:
+            placements: List of (x, y, z, block_id, meta), in placement order.
+
+        Returns:
+            list: (x1, y1, z1, x2, y2, z2, block_id, meta) tuples for setBlocks.
+        """
+        # Later placements at the same coordinate win
+        latest = {}
+        for x, y, z, block_id, meta in placements:
+            latest[(x, y, z)] = (block_id, meta)
+
+        # Bucket x coordinates per (block, meta, y, z) row so only rows are sorted
+        rows = {}
+        for (x, y, z), (block_id, meta) in latest.items():
+            row = rows.get((block_id, meta, y, z))
+            if row is None:
+                rows[(block_id, meta, y, z)] = [x]
+            else:
+                row.append(x)
+
+        # Greedy x-run merge
+        runs = []
+        for row_key in sorted(rows):
+            block_id, meta, y, z = row_key
+            xs = rows[row_key]
+            xs.sort()
+            x1 = x2 = xs[0]
+            for x in xs[1:]:
+                if x == x2 + 1:
+                    x2 = x
+                else:
+                    runs.append((block_id, meta, y, z, x1, x2))
+                    x1 = x2 = x
+            runs.append((block_id, meta, y, z, x1, x2))
+
+        # Merge consecutive z-rows sharing the same x-span
+        boxes = []
+        open_boxes = {}
+        for block_id, meta, y, z, x1, x2 in runs:
+            span = (block_id, meta, y, x1, x2)
+            idx = open_boxes.get(span)
+            if idx is not None and boxes[idx][4] == z - 1:
+                boxes[idx][4] = z
+            else:
+                open_boxes[span] = len(boxes)
+                boxes.append([block_id, meta, y, z, z, x1, x2])
+
+        return [
+            (x1, y, z1, x2, y, z2, block_id, meta)
+            for block_id, meta, y, z1, z2, x1, x2 in boxes
+        ]
 
     def build_structure(self):
         """
         Executes the building process for the current task.
         Advances the FSM and consumes materials as blocks are placed.
         """
-        if not self.pending_builds:
-            return
-
-        build_task = self.pending_builds[0]
-        # Check status explicitly
-        if build_task["status"] == "READY_TO_BUILD":
+        build_task = self._next_ready_job()
+        if build_task is not None:
             self.logger.info("Starting construction...")
-            if self.mc:
-                self.mc.postToChat(
-                    f"BuilderBot: Building {build_task.get('strategy_name', 'Structure')}..."
-                )
+            self._chat(
+                f"BuilderBot: Building {self._strategy_to_key.get(id(build_task.strategy), 'Structure')}..."
+            )
+            # Strategies post progress directly, so send ours before they start
+            self._chat_flush()
 
             # Unpack
-            target = build_task["location"]
+            target = build_task.location
             # Explorer sent (x, z, height)
             # Our strategy expects (x, z, height) or (x, z, y)?
             # In explorer_bot.py: (c[0], c[1], self.mc.getHeight(c[0], c[1]))
@@ -470,12 +791,23 @@ class BuilderBot(BaseAgent):
             # Wait, explorer sends (x, z, y_height).
             # So unpacking x, z, y = target works perfect.
 
-            strategy = build_task["strategy"]
+            strategy = build_task.strategy
 
             self.logger.info(f"Executing {strategy.__class__.__name__} at {target}")
-            strategy.execute(self, target)
+            try:
+                strategy.execute(self, target)
+            finally:
+                self.flush_placements()
 
             self.logger.info("Construction complete.")
-            if self.mc:
-                self.mc.postToChat("BuilderBot: Build Complete!")
-            self.pending_builds.pop(0)
+            self._chat("BuilderBot: Build Complete!")
+            self._chat_flush()
+            with self._builds_lock:
+                # Match by job_id: BuildJob equality compares every field
+                self.pending_builds = collections.deque(
+                    job for job in self.pending_builds
+                    if job.job_id != build_task.job_id
+                )
+                self._pending_index.pop(tuple(build_task.location), None)
+                self._jobs_by_id.pop(build_task.job_id, None)
+                self._refresh_next_action()
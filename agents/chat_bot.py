@@ -1,20 +1,140 @@
 from mcpi.minecraft import Minecraft
-from core.base_agent import BaseAgent
+from mcpi.util import flatten_parameters_to_bytestring
+from core.base_agent import BaseAgent, AgentState
 from core.messaging import Message
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+import sys
 import time
 
 
+# Help text per topic; None is the general overview
+HELP_TOPICS = {
+    "explorer": (
+        "--- ExplorerBot Commands ---",
+        "/explorer start [range=20] : Start scanning",
+        "/explorer stop : Stop scanning",
+        "/explorer set range <N> : Set scan range",
+        "/explorer status : Check queue/state",
+    ),
+    "miner": (
+        "--- MinerBot Commands ---",
+        "/miner start : Start default mining",
+        "/miner set strategy <name|auto> : Change strategy",
+        "/miner fulfill : Force inventory delivery",
+        "/miner pause|resume : Control execution",
+    ),
+    "builder": (
+        "--- BuilderBot Commands ---",
+        "/builder plan list : List available buildings",
+        "/builder plan set <template> : Select building",
+        "/builder bom : Check material needs",
+        "/builder build : Start construction",
+    ),
+    "workflow": (
+        "--- Workflow Commands ---",
+        "/workflow run : Start full lifecycle",
+    ),
+    None: (
+        "--- Available Agents ---",
+        "Cmds: /agent, /explorer, /miner, /builder, /workflow",
+        "Type '/agent help <name>' for details.",
+        "e.g., '/agent help builder'",
+    ),
+}
+
+
+def _chat_frames(lines):
+    """Encodes chat lines as concatenated mcpi chat.post frames."""
+    return b"".join(
+        b"chat.post(" + flatten_parameters_to_bytestring((line,)) + b")\n"
+        for line in lines
+    )
+
+
+# Help output pre-encoded at import, so posting it is a single socket write
+HELP_FRAMES = {topic: _chat_frames(lines) for topic, lines in HELP_TOPICS.items()}
+
+# Commands that publish one control message and confirm in chat:
+# (cmd, subcmd) -> (control type, chat confirmation, forward kwargs as payload)
+SIMPLE_COMMANDS = {
+    ("agent", "pause"): ("control.agent.pause", "[System] Pausing all agents.", False),
+    ("agent", "resume"): (
+        "control.agent.resume",
+        "[System] Resuming all agents.",
+        False,
+    ),
+    ("agent", "stop"): ("control.agent.stop", "[System] Stopping all agents.", False),
+    ("agent", "status"): (
+        "control.agent.status.request",
+        "[System] Requesting status...",
+        False,
+    ),
+    ("workflow", "run"): (
+        "control.workflow.run",
+        "[Workflow] Run sequence initiated.",
+        True,
+    ),
+    ("explorer", "start"): (
+        "control.explorerbot.start",
+        "[Explorer] Start sent.",
+        True,
+    ),
+    ("explorer", "stop"): ("control.explorerbot.stop", "[Explorer] Stop sent.", False),
+    ("miner", "start"): ("control.minerbot.start", "[Miner] Start sent.", True),
+    ("miner", "fulfill"): (
+        "control.minerbot.fulfill",
+        "[Miner] Fulfill requested.",
+        False,
+    ),
+    ("miner", "pause"): ("control.minerbot.pause", "[Miner] Paused.", False),
+    ("miner", "resume"): ("control.minerbot.resume", "[Miner] Resumed.", False),
+    ("builder", "build"): ("control.builderbot.build", "[Builder] Build sent.", False),
+    ("builder", "pause"): ("control.builderbot.pause", "[Builder] Paused.", False),
+    ("builder", "resume"): ("control.builderbot.resume", "[Builder] Resumed.", False),
+}
+
+# First words that can start a command without a leading slash, including the
+# plural and "builer" typo forms handle_chat normalizes
+_COMMAND_WORDS = ("help", "agent", "workflow", "explorer", "miner", "builder", "builer")
+COMMAND_HEADS = frozenset(word + s for word in _COMMAND_WORDS for s in ("", "s"))
+
+# Optional status report fields, in display order: (payload key, label)
+STATUS_FIELDS = (
+    ("strategy", "Strat"),
+    ("queue_length", "Q"),
+    ("inventory", "Inv"),
+    ("current_job", "Job"),
+)
+
+# str.translate table stripping dict braces from inventory reprs
+_STRIP_BRACES = str.maketrans("", "", "{}")
+
+
 class ChatBot(BaseAgent):
     """
     Agent responsible for listening to in-game chat commands and issuing control messages.
     """
 
+    # With BaseAgent's slots, instances have no __dict__ at all
+    __slots__ = (
+        "mc",
+        "_mc_pool",
+        "_poll_future",
+        "_chat_poll_every",
+        "_ticks_until_poll",
+        "_batch_chat",
+        "last_processed_signature",
+        "last_processed_time",
+        "_dispatch",
+    )
+
     def __init__(self, name, message_bus=None):
         super().__init__(name, message_bus)
         try:
             self.mc = Minecraft.create()
         except Exception as e:
-            self.logger.error(f"Failed to connect to Minecraft: {e}")
+            self.logger.error("Failed to connect to Minecraft: %s", e)
             self.mc = None
 
         if self.bus:
@@ -23,50 +143,130 @@ class ChatBot(BaseAgent):
             self.bus.subscribe("inventory.v1", self.on_inventory_event)
             self.bus.subscribe("control.agent.status.report", self.on_status_report)
 
-        self.last_processed_signature = ""
-        self.last_processed_time = 0
+        # Every round-trip on this bot's connection goes through one worker, so
+        # the agent tick never blocks on the socket and calls never interleave
+        self._mc_pool = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix=f"{name}-mc"
+        )
+        self._poll_future = None
+
+        # Poll chat every Nth tick. The server buffers posts between polls,
+        # and mcpi only replies to requests, so nothing is lost by skipping.
+        self._chat_poll_every = 3
+        self._ticks_until_poll = 0
+
+        # Send multi-line chat output as one socket write of N chat.post frames
+        self._batch_chat = True
+
+        # (entity_id, interned message) of the last command, and when it ran (monotonic)
+        self.last_processed_signature = None
+        self.last_processed_time = 0.0
+
+        # cmd -> subcmd -> handler(positional, kwargs); "*" matches any subcmd
+        self._dispatch = {
+            "help": {"*": self._cmd_help},
+            "agent": {"help": self._cmd_agent_help},
+            "explorer": {
+                "set": self._cmd_explorer_set,
+                "status": self._cmd_status,
+            },
+            "miner": {
+                "set": self._cmd_miner_set,
+                "status": self._cmd_status,
+            },
+            "builder": {
+                "plan": self._cmd_builder_plan,
+                "bom": self._cmd_builder_bom,
+            },
+        }
+        for (cmd, subcmd), spec in SIMPLE_COMMANDS.items():
+            self._dispatch.setdefault(cmd, {})[subcmd] = partial(
+                self._cmd_simple, *spec
+            )
+
+    def transition_state(self, new_state, reason):
+        super().transition_state(new_state, reason)
+        if new_state == AgentState.STOPPED:
+            # Queued chat/poll calls are dropped; one already running finishes
+            self._mc_pool.shutdown(wait=False, cancel_futures=True)
+
+    def _submit(self, fn, *args):
+        """
+        Queues a Minecraft call on this bot's connection worker.
+
+        Returns:
+            Future: The queued call, or None once the bot has stopped.
+        """
+        try:
+            future = self._mc_pool.submit(fn, *args)
+        except RuntimeError:  # Worker shut down by a stop
+            self.logger.debug("Dropped Minecraft call after stop: %s", fn)
+            return None
+        future.add_done_callback(self._log_mc_failure)
+        return future
+
+    def _log_mc_failure(self, future):
+        e = future.exception()
+        if e is not None:
+            self.logger.error("Minecraft call failed: %s", e)
+
+    def _post(self, text):
+        """Posts one chat line without waiting for the socket write."""
+        self._submit(self.mc.postToChat, text)
 
     def post_help_message(self, topic=None):
         """Posts help syntax to the chat."""
         if not self.mc:
             return
 
-        if topic == "explorer":
-            self.mc.postToChat("--- ExplorerBot Commands ---")
-            self.mc.postToChat("/explorer start [range=20] : Start scanning")
-            self.mc.postToChat("/explorer stop : Stop scanning")
-            self.mc.postToChat("/explorer set range <N> : Set scan range")
-            self.mc.postToChat("/explorer status : Check queue/state")
-        elif topic == "miner":
-            self.mc.postToChat("--- MinerBot Commands ---")
-            self.mc.postToChat("/miner start : Start default mining")
-            self.mc.postToChat("/miner set strategy <name> : Change strategy")
-            self.mc.postToChat("/miner fulfill : Force inventory delivery")
-            self.mc.postToChat("/miner pause|resume : Control execution")
-        elif topic == "builder":
-            self.mc.postToChat("--- BuilderBot Commands ---")
-            self.mc.postToChat("/builder plan list : List available buildings")
-            self.mc.postToChat("/builder plan set <template> : Select building")
-            self.mc.postToChat("/builder bom : Check material needs")
-            self.mc.postToChat("/builder build : Start construction")
-        elif topic == "workflow":
-            self.mc.postToChat("--- Workflow Commands ---")
-            self.mc.postToChat("/workflow run : Start full lifecycle")
-        else:
-            self.mc.postToChat("--- Available Agents ---")
-            self.mc.postToChat("Cmds: /agent, /explorer, /miner, /builder, /workflow")
-            self.mc.postToChat("Type '/agent help <name>' for details.")
-            self.mc.postToChat("e.g., '/agent help builder'")
+        if topic not in HELP_TOPICS:
+            topic = None
+        self._post_lines(HELP_TOPICS[topic], HELP_FRAMES[topic])
+
+    def _post_lines(self, lines, frames=None):
+        """
+        Posts several chat lines with a single write to the Minecraft socket.
+
+        The mcpi protocol is one newline-terminated command per line, so the
+        chat.post frames are concatenated and sent together instead of
+        issuing one postToChat round per line.
+
+        Args:
+            lines (tuple): The chat lines to post.
+            frames (bytes): Optional pre-encoded frames for ``lines``.
+        """
+        if not self.mc:
+            return
+
+        if self._batch_chat and len(lines) > 1 and frames is None:
+            frames = _chat_frames(lines)
+        self._submit(self._send_lines, lines, frames)
+
+    def _send_lines(self, lines, frames):
+        """Worker side of _post_lines; runs on the connection's executor."""
+        if self._batch_chat and len(lines) > 1:
+            try:
+                self.mc.conn._send(frames)
+                return
+            except Exception as e:
+                self.logger.warning("Batched chat send failed, posting per line: %s", e)
+
+        for line in lines:
+            self.mc.postToChat(line)
 
     def on_map_event(self, message: Message):
         if not self.mc:
             return
         flat_spots = message.payload.get("flat_spots", [])
         if flat_spots:
-            self.mc.postToChat(f"[Explorer] Found {len(flat_spots)} sites.")
-            self.mc.postToChat("Scan complete. Ready for construction.")
+            self._post_lines(
+                (
+                    f"[Explorer] Found {len(flat_spots)} sites.",
+                    "Scan complete. Ready for construction.",
+                )
+            )
         else:
-            self.mc.postToChat(
+            self._post(
                 "[Explorer] partial scan complete - no flat spots found."
             )
 
@@ -75,12 +275,12 @@ class ChatBot(BaseAgent):
             return
         reqs = message.payload.get("requirements", {})
         count = sum(reqs.values())
-        self.mc.postToChat(f"[Builder] Order placed: {count} blocks needed.")
+        self._post(f"[Builder] Order placed: {count} blocks needed.")
 
     def on_inventory_event(self, message: Message):
-        if not self.mc:
+        if not self.mc or message.payload.get("partial"):
             return
-        self.mc.postToChat("[Miner] Delivery complete. Materials sent to Builder.")
+        self._post("[Miner] Delivery complete. Materials sent to Builder.")
 
     def on_status_report(self, message: Message):
         if not self.mc:
@@ -89,24 +289,20 @@ class ChatBot(BaseAgent):
         payload = message.payload
         state = payload.get("state", "UNKNOWN")
 
-        # Format basics
-        info = f"[{sender}] State: {state}"
-
-        # Add details if available
-        if "strategy" in payload:
-            info += f" | Strat: {payload['strategy']}"
-        if "queue_length" in payload:
-            info += f" | Q: {payload['queue_length']}"
-        if "inventory" in payload:
-            # Inventory might be long, so maybe truncate?
-            inv = str(payload["inventory"]).replace("{", "").replace("}", "")
-            if len(inv) > 30:
-                inv = inv[:25] + "..."
-            info += f" | Inv: {inv}"
-        if "current_job" in payload:
-            info += f" | Job: {payload['current_job']}"
-
-        self.mc.postToChat(info)
+        # Format basics, then add details if available
+        parts = [f"[{sender}] State: {state}"]
+        for key, label in STATUS_FIELDS:
+            if key not in payload:
+                continue
+            val = payload[key]
+            if key == "inventory":
+                # Inventory might be long, so truncate
+                val = str(val).translate(_STRIP_BRACES)
+                if len(val) > 30:
+                    val = val[:25] + "..."
+            parts.append(f"{label}: {val}")
+
+        self._post(" | ".join(parts))
 
     def on_pause_command(self, message: Message):
         # Override BaseAgent behavior: ChatBot must NOT pause, or it waits forever and can't hear "resume"
@@ -119,24 +315,47 @@ class ChatBot(BaseAgent):
         self.logger.info("ChatBot broadcasting resume.")
 
     def perceive(self):
-        if not self.mc:
+        mc = self.mc
+        if not mc:
             return
 
+        # Drain the previous poll once it lands; skip the tick while in flight
+        future = self._poll_future
+        if future is not None:
+            if not future.done():
+                return
+            self._poll_future = None
+            try:
+                chat_events = future.result()
+                if chat_events:
+                    now = time.monotonic()
+                    # Signatures seen in this poll, so repeats are dropped even
+                    # when not back to back
+                    seen = set()
+                    handle_chat = self.handle_chat
+                    for event in chat_events:
+                        handle_chat(event, now, seen)
+            except Exception as e:
+                self.logger.error("Error polling chat: %s", e)
+
+        if self._ticks_until_poll:
+            self._ticks_until_poll -= 1
+            return
+        self._ticks_until_poll = self._chat_poll_every - 1
+
         # Poll chat posts
         try:
-            chat_events = self.mc.events.pollChatPosts()
-            for event in chat_events:
-                self.handle_chat(event)
-        except Exception as e:
-            self.logger.error(f"Error polling chat: {e}")
+            self._poll_future = self._mc_pool.submit(mc.events.pollChatPosts)
+        except RuntimeError:  # Stopped between the state check and here
+            pass
 
     def parse_command_args(self, args_list):
         """Parses a list of strings into positional args and a kwargs dictionary."""
         positional = []
         kwargs = {}
         for arg in args_list:
-            if "=" in arg:
-                key, val = arg.split("=", 1)
+            key, sep, val = arg.partition("=")
+            if sep:
                 # Try to convert to int if possible
                 try:
                     val = int(val)
@@ -147,30 +366,56 @@ class ChatBot(BaseAgent):
                 positional.append(arg)
         return positional, kwargs
 
-    def handle_chat(self, event):
+    def handle_chat(self, event, now=None, seen=None):
+        """
+        Parses one chat event and dispatches it as a command.
+
+        Args:
+            event: The mcpi ChatEvent.
+            now (float): Optional time.monotonic() value shared by one poll.
+            seen (set): Optional signatures already handled in the same poll.
+        """
+        if now is None:
+            now = time.monotonic()
         raw_message = event.message.strip()
 
+        # Plain chat that does not open with a command word is not for us
+        if not raw_message.startswith("/"):
+            head = raw_message.split(None, 1)[0].lower() if raw_message else ""
+            if head not in COMMAND_HEADS:
+                return
+        raw_message = sys.intern(raw_message)
+
         # Debounce: Ignore identical commands from same entity within 1 second
-        # event might differ in structure, checking attributes
-        entity_id = getattr(event, "entityId", 0)
-        signature = f"{entity_id}:{raw_message}"
+        # mcpi's ChatEvent always carries entityId; tolerate other event shapes
+        try:
+            entity_id = event.entityId
+        except AttributeError:
+            entity_id = 0
+        signature = (entity_id, raw_message)
+        if seen is not None:
+            if signature in seen:
+                self.logger.debug("Ignored duplicate command: %s", raw_message)
+                return
+            seen.add(signature)
         if (
             signature == self.last_processed_signature
-            and (time.time() - self.last_processed_time) < 1.0
+            and (now - self.last_processed_time) < 1.0
         ):
-            self.logger.debug(f"Ignored duplicate command: {raw_message}")
+            self.logger.debug("Ignored duplicate command: %s", raw_message)
             return
 
         self.last_processed_signature = signature
-        self.last_processed_time = time.time()
+        self.last_processed_time = now
 
         # Clean up leading slash
-        message = raw_message.lstrip("/")
+        # Lowercased once here; handlers compare tokens as-is
+        message = raw_message.removeprefix("/").lower()
         parts = message.split()
         if not parts:
             return
 
-        cmd = parts[0].lower()
+        cmd = parts[0]
         # Handle common plurals/typos
         if cmd.endswith("s"):
             cmd = cmd[:-1]  # agents -> agent
@@ -180,142 +425,100 @@ class ChatBot(BaseAgent):
         args = parts[1:]
 
         positional, kwargs = self.parse_command_args(args)
-        self.logger.info(f"Processing command: {cmd} {args}")
+        self.logger.info("Processing command: %s %s", cmd, args)
 
-        # 0. Help Command
-        if cmd == "help":
-            topic = positional[0].lower() if positional else None
-            self.post_help_message(topic)
+        table = self._dispatch.get(cmd)
+        if table is None:
+            return
 
-        # 1. Common Commands
-        elif cmd == "agent":
-            if not positional:
-                return
-            subcmd = positional[0].lower()
-
-            if subcmd == "pause":
-                self.publish_control("control.agent.pause")
-                self.mc.postToChat("[System] Pausing all agents.")
-            elif subcmd == "resume":
-                self.publish_control("control.agent.resume")
-                self.mc.postToChat("[System] Resuming all agents.")
-            elif subcmd == "stop":
-                self.publish_control("control.agent.stop")
-                self.mc.postToChat("[System] Stopping all agents.")
-            elif subcmd == "status":
-                self.publish_control("control.agent.status.request")
-                self.mc.postToChat("[System] Requesting status...")
-            elif subcmd == "help":
-                topic = positional[1].lower() if len(positional) > 1 else None
-                self.post_help_message(topic)
-
-        # 2. Workflow
-        elif cmd == "workflow":
-            if positional and positional[0].lower() == "run":
-                self.publish_control("control.workflow.run", payload=kwargs)
-                self.mc.postToChat("[Workflow] Run sequence initiated.")
-
-        # 3. ExplorerBot
-        elif cmd == "explorer":
-            if not positional:
-                return
-            subcmd = positional[0].lower()
-            if subcmd == "start":
-                self.publish_control("control.explorerbot.start", payload=kwargs)
-                self.mc.postToChat("[Explorer] Start sent.")
-            elif subcmd == "stop":
-                self.publish_control("control.explorerbot.stop")
-                self.mc.postToChat("[Explorer] Stop sent.")
-            elif subcmd == "set":
-                if len(positional) > 1 and positional[1].lower() == "range":
-                    # Support "range=X" or "range X"
-                    val = kwargs.get("range")
-                    if val is None and len(positional) > 2:
-                        try:
-                            val = int(positional[2])
-                        except ValueError:
-                            pass
-                    if val:
-                        self.publish_control(
-                            "control.explorerbot.config", payload={"range": val}
-                        )
-                        self.mc.postToChat(f"[Explorer] Range set: {val}")
-            elif subcmd == "status":
-                self.publish_control("control.agent.status.request")
-
-        # 4. MinerBot
-        elif cmd == "miner":
-            if not positional:
-                return
-            subcmd = positional[0].lower()
-            if subcmd == "start":
-                self.publish_control("control.minerbot.start", payload=kwargs)
-                self.mc.postToChat("[Miner] Start sent.")
-            elif (
-                subcmd == "set"
-                and len(positional) > 1
-                and positional[1].lower() == "strategy"
-            ):
-                strat = kwargs.get("strategy")
-                if not strat and len(positional) > 2:
-                    strat = positional[2]
-                if strat:
-                    self.publish_control(
-                        "control.minerbot.strategy", payload={"strategy": strat}
+        subcmd = positional[0] if positional else None
+        handler = table.get(subcmd) or table.get("*")
+        if handler:
+            handler(positional, kwargs)
+
+    # --- Command handlers: positional[0] is the subcommand ---
+
+    def _cmd_help(self, positional, kwargs):
+        topic = positional[0] if positional else None
+        self.post_help_message(topic)
+
+    def _cmd_status(self, positional, kwargs):
+        self.publish_control("control.agent.status.request")
+
+    def _cmd_simple(self, control_type, chat_text, forward_kwargs, positional, kwargs):
+        # Bound per SIMPLE_COMMANDS entry via functools.partial
+        self._act(control_type, chat_text, kwargs if forward_kwargs else None)
+
+    # 1. Common Commands
+    def _cmd_agent_help(self, positional, kwargs):
+        topic = positional[1] if len(positional) > 1 else None
+        self.post_help_message(topic)
+
+    # 2. ExplorerBot
+    def _cmd_explorer_set(self, positional, kwargs):
+        if len(positional) > 1 and positional[1] == "range":
+            # Support "range=X" or "range X"
+            val = kwargs.get("range")
+            if val is None and len(positional) > 2:
+                try:
+                    val = int(positional[2])
+                except ValueError:
+                    pass
+            if val:
+                self._act(
+                    "control.explorerbot.config",
+                    f"[Explorer] Range set: {val}",
+                    payload={"range": val},
+                )
+
+    # 3. MinerBot
+    def _cmd_miner_set(self, positional, kwargs):
+        if len(positional) > 1 and positional[1] == "strategy":
+            strat = kwargs.get("strategy")
+            if not strat and len(positional) > 2:
+                strat = positional[2]
+            if strat:
+                self._act(
+                    "control.minerbot.strategy",
+                    f"[Miner] Strategy: {strat}",
+                    payload={"strategy": strat},
+                )
+
+    # 4. BuilderBot
+    def _cmd_builder_plan(self, positional, kwargs):
+        if len(positional) > 1:
+            action = positional[1]
+            if action == "list":
+                self.publish_control("control.builderbot.plan.list")
+            elif action == "set":
+                template = kwargs.get("template")
+                if not template and len(positional) > 2:
+                    template = positional[2]
+                if template:
+                    self._act(
+                        "control.builderbot.plan.set",
+                        f"[Builder] Plan: {template}",
+                        payload={"template": template},
                     )
-                    self.mc.postToChat(f"[Miner] Strategy: {strat}")
-            elif subcmd == "fulfill":
-                self.publish_control("control.minerbot.fulfill")
-                self.mc.postToChat("[Miner] Fulfill requested.")
-            elif subcmd == "pause":
-                self.publish_control("control.minerbot.pause")
-                self.mc.postToChat("[Miner] Paused.")
-            elif subcmd == "resume":
-                self.publish_control("control.minerbot.resume")
-                self.mc.postToChat("[Miner] Resumed.")
-            elif subcmd == "status":
-                self.publish_control("control.agent.status.request")
-
-        # 5. BuilderBot
-        elif cmd == "builder":
-            if not positional:
-                return
-            subcmd = positional[0].lower()
-            if subcmd == "plan":
-                if len(positional) > 1:
-                    action = positional[1].lower()
-                    if action == "list":
-                        self.publish_control("control.builderbot.plan.list")
-                    elif action == "set":
-                        template = kwargs.get("template")
-                        if not template and len(positional) > 2:
-                            template = positional[2]
-                        if template:
-                            self.publish_control(
-                                "control.builderbot.plan.set",
-                                payload={"template": template},
-                            )
-                            self.mc.postToChat(f"[Builder] Plan: {template}")
-            elif subcmd == "bom":
-                self.publish_control("control.builderbot.bom")
-            elif subcmd == "build":
-                self.publish_control("control.builderbot.build")
-                self.mc.postToChat("[Builder] Build sent.")
-            elif subcmd == "pause":
-                self.publish_control("control.builderbot.pause")
-                self.mc.postToChat("[Builder] Paused.")
-            elif subcmd == "resume":
-                self.publish_control("control.builderbot.resume")
-                self.mc.postToChat("[Builder] Resumed.")
+
+    def _cmd_builder_bom(self, positional, kwargs):
+        self.publish_control("control.builderbot.bom")
+
+    def _act(self, control_type, chat_text, payload=None):
+        """Publishes a control message and confirms it in chat."""
+        self.publish_control(control_type, payload)
+        if self.mc:
+            self._post(chat_text)
 
     def publish_control(self, msg_type, payload=None):
-        if self.bus:
+        bus = self.bus
+        if bus:
             if payload is None:
                 payload = {}
             msg = Message(
                 type=msg_type, source=self.name, target="all", payload=payload
             )
-            self.bus.publish(msg)
+            bus.publish(msg)
 
     def decide(self):
         pass
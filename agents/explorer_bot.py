@@ -1,9 +1,10 @@
 from mcpi.minecraft import Minecraft
 from core.base_agent import BaseAgent
 from core.messaging import Message
-from core.utils import load_classes, log_execution
+from core.utils import connection_lock, load_classes, log_execution
 from strategies import ExplorationStrategy
 from mcpi.vec3 import Vec3
+from collections import deque
 import time
 
 
@@ -12,22 +13,36 @@ class ExplorerBot(BaseAgent):
     Agent responsible for scanning the terrain and identifying build sites.
     """
 
+    # With BaseAgent's slots, instances have no __dict__ at all
+    __slots__ = (
+        "mc",
+        "strategies",
+        "_strategies_loaded",
+        "scan_range",
+        "scan_target",
+        "scan_queue",
+        "is_scanning",
+        "last_scan_time",
+        "_cancel_scan",
+    )
+
     def __init__(self, name, message_bus=None):
         super().__init__(name, message_bus)
         try:
             self.mc = Minecraft.create()
         except Exception as e:
-            self.logger.error(f"Failed to connect to Minecraft: {e}")
+            self.logger.error("Failed to connect to Minecraft: %s", e)
             self.mc = None
 
+        # Strategies are imported on the first scan, not at startup
         self.strategies = []
-        self.load_strategies()
+        self._strategies_loaded = False
 
         self.scan_range = 20
         self.scan_target = None
 
-        # New: Queue for incoming scan requests
-        self.scan_queue = []
+        # New: Queue for incoming scan requests, as plain (x, z) int pairs
+        self.scan_queue = deque()
         self.is_scanning = False
 
         if self.bus:
@@ -46,9 +61,7 @@ class ExplorerBot(BaseAgent):
             "scan_range": self.scan_range,
             "scan_target_x": self.scan_target.x if self.scan_target else None,
             "scan_target_z": self.scan_target.z if self.scan_target else None,
-            "scan_queue": [
-                (v.x, v.z) for v in self.scan_queue
-            ],  # Simple tuple serialization
+            "scan_queue": list(self.scan_queue),  # Simple tuple serialization
         }
 
     def _apply_checkpoint_data(self, data):
@@ -56,13 +69,11 @@ class ExplorerBot(BaseAgent):
         tx = data.get("scan_target_x")
         tz = data.get("scan_target_z")
 
-        from mcpi.vec3 import Vec3
-
         if tx is not None and tz is not None:
             self.scan_target = Vec3(tx, 0, tz)
 
         queue_data = data.get("scan_queue", [])
-        self.scan_queue = [Vec3(q[0], 0, q[1]) for q in queue_data]
+        self.scan_queue = deque(map(tuple, queue_data))
 
     def on_start_scan(self, message: Message):
         """
@@ -103,14 +114,12 @@ class ExplorerBot(BaseAgent):
                     return
                 else:
                     self.logger.warning("Interruption requested but NOT confirmed. Queuing request instead.")
-                    if self.mc:
-                        self.mc.postToChat("[Explorer] Interruption requires 'confirm=True'. Queuing.")
+                    self._post_chat("[Explorer] Interruption requires 'confirm=True'. Queuing.")
 
             if target:
-                self.logger.info(f"Scan already in progress. Queuing target: {target}")
-                self.scan_queue.append(target)
-                if self.mc:
-                    self.mc.postToChat("[Explorer] Scan queued.")
+                self.logger.info("Scan already in progress. Queuing target: %s", target)
+                self.scan_queue.append((target.x, target.z))
+                self._post_chat("[Explorer] Scan queued.")
             else:
                 self.logger.warning(
                     "Scan in progress and no specific target provided to queue."
@@ -120,6 +129,17 @@ class ExplorerBot(BaseAgent):
             self.logger.info("Starting scan.")
             self.scan_terrain()
 
+    def _post_chat(self, text):
+        """
+        Posts a chat line without breaking a scan's pipelined requests.
+
+        Scans run on a bus worker and other handlers post while they are in
+        flight, so the post waits for the connection lock.
+        """
+        if self.mc:
+            with connection_lock(self.mc.conn):
+                self.mc.postToChat(text)
+
     def on_stop_scan(self, message: Message):
         self.logger.info("Acknowledged stop request.")
         self._cancel_scan = True
@@ -131,7 +151,7 @@ class ExplorerBot(BaseAgent):
         payload = message.payload or {}
         if "range" in payload:
             self.scan_range = int(payload["range"])
-            self.logger.info(f"Scan range set to {self.scan_range}")
+            self.logger.info("Scan range set to %s", self.scan_range)
 
     def get_additional_status(self):
         return {
@@ -151,10 +171,10 @@ class ExplorerBot(BaseAgent):
             try:
                 strategy = strat_cls()
                 self.strategies.append(strategy)
-                self.logger.info(f"Loaded strategy: {strat_cls.__name__}")
+                self.logger.info("Loaded strategy: %s", strat_cls.__name__)
             except Exception as e:
                 self.logger.error(
-                    f"Failed to instantiate strategy {strat_cls.__name__}: {e}"
+                    "Failed to instantiate strategy %s: %s", strat_cls.__name__, e
                 )
 
     def perceive(self):
@@ -175,6 +195,10 @@ class ExplorerBot(BaseAgent):
         if not self.mc:
             return
 
+        if not self._strategies_loaded:
+            self.load_strategies()
+            self._strategies_loaded = True
+
         if not self.strategies:
             self.logger.error("No exploration strategies loaded!")
             return
@@ -182,48 +206,51 @@ class ExplorerBot(BaseAgent):
         self.is_scanning = True
         self._cancel_scan = False
 
-        # Determine actual target to scan (Current request OR player pos)
-        center = self.scan_target or self.mc.player.getTilePos()
-
         # Execute the first available strategy
         strategy = self.strategies[0]
-        self.logger.info(
-            f"Executing exploration strategy: {strategy.__class__.__name__}"
-        )
 
         try:
-            result = strategy.execute(self)
-
-            if result and result.get("flat_spots"):
-                flat_spots = result["flat_spots"]
+            # Scan the current target (or the player position, resolved by the
+            # strategy), then keep draining queued targets until cancelled.
+            while True:
                 self.logger.info(
-                    f"Found {len(flat_spots)} flat spots at {flat_spots[0]}"
+                    "Executing exploration strategy: %s", strategy.__class__.__name__
                 )
 
-                # Publish map data
-                msg = Message(
-                    type="map.v1", source=self.name, target="all", payload=result
-                )
-                if self.bus:
-                    self.bus.publish(msg)
-            else:
-                self.logger.warning(
-                    f"No flat spots found using {strategy.__class__.__name__}."
-                )
-
-            self.last_scan_time = time.time()
-
-        except Exception as e:
-            self.logger.error(f"Error during scanning: {e}")
+                try:
+                    result = strategy.execute(self)
+
+                    if result and result.get("flat_spots"):
+                        flat_spots = result["flat_spots"]
+                        self.logger.info(
+                            "Found %d flat spots at %s", len(flat_spots), flat_spots[0]
+                        )
+
+                        # Publish map data
+                        msg = Message(
+                            type="map.v1",
+                            source=self.name,
+                            target="all",
+                            payload=result,
+                        )
+                        if self.bus:
+                            self.bus.publish(msg)
+                    else:
+                        self.logger.warning(
+                            "No flat spots found using %s.",
+                            strategy.__class__.__name__,
+                        )
+
+                    self.last_scan_time = time.time()
+
+                except Exception as e:
+                    self.logger.error("Error during scanning: %s", e)
+
+                # Check queue!
+                if self._cancel_scan or not self.scan_queue:
+                    break
+                x, z = self.scan_queue.popleft()
+                self.scan_target = Vec3(x, 0, z)
+                self.logger.info("Processing queued scan target: %s", self.scan_target)
         finally:
             self.is_scanning = False
-
-            # Check queue!
-            if self.scan_queue:
-                next_target = self.scan_queue.pop(0)
-                self.logger.info(f"Processing queued scan target: {next_target}")
-                self.scan_target = next_target
-                # Recursive call to process next item?
-                # Safer to let the main loop handle it, but we are event driven here.
-                # Let's call scan_terrain again immediately.
-                self.scan_terrain()
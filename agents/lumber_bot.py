@@ -1,9 +1,20 @@
 from mcpi.minecraft import Minecraft
 from core.base_agent import BaseAgent, AgentState
 from core.messaging import Message
+from core.utils import pipeline_requests
+import threading
 import time
 import mcpi.block as block
 
+# Tallest trunk _chop_tree will clear, and the first read before any tree has
+# been seen (oak trunks run 4-6 blocks)
+MAX_TRUNK_HEIGHT = 10
+INITIAL_TRUNK_PROBE = 7
+WOOD_ID = block.WOOD.id
+
+# Wood is streamed downstream in batches of this size while a request is open
+PARTIAL_DELIVERY_SIZE = 10
+
 
 class LumberBot(BaseAgent):
     """
@@ -20,6 +31,18 @@ class LumberBot(BaseAgent):
 
         self.wood_inventory = 0
         self.pending_req = 0
+        # Part of wood_inventory already published by partial deliveries
+        self.delivered_wood = 0
+
+        # Tallest trunk chopped so far; sizes the first column read per tree
+        self._tallest_trunk = INITIAL_TRUNK_PROBE - 1
+
+        # (sector_x, sector_z) -> (timestamp, ground y) from sparse getHeight samples
+        self._height_cache = {}
+        self._height_ttl = 2.0
+
+        # Set by new requirements (or a stop) to cut the idle rescan wait short
+        self._wake_event = threading.Event()
 
         if self.bus:
             self.bus.subscribe(
@@ -40,6 +63,12 @@ class LumberBot(BaseAgent):
         if needed > 0:
             self.logger.info(f"LumberBot activated. Need approx {needed} wood blocks.")
             self.pending_req += needed
+            self._wake_event.set()
+
+    def transition_state(self, new_state, reason):
+        super().transition_state(new_state, reason)
+        if new_state == AgentState.STOPPED:
+            self._wake_event.set()
 
     def perceive(self):
         pass
@@ -52,74 +81,171 @@ class LumberBot(BaseAgent):
     def act(self):
         decision = self.decide()
         if decision == "chop":
-            self.harvest_wood()
+            # Trees were found but the request is still open: rescan at once
+            return self.harvest_wood()
 
     def _check_pause(self):
         """Helper to pause execution."""
-        while self.state == AgentState.PAUSED:
-            time.sleep(1)
+        self.wait_while_paused()
         if self.state == AgentState.STOPPED:
             raise InterruptedError("Agent stopped")
 
+    def _ground_level(self, x0, z0, width):
+        """
+        Estimates the ground height under a square search area.
+
+        Samples getHeight on a 4x4 grid and takes the minimum, so canopy hits
+        are ignored. Results are cached per 16x16 sector of the area's centre.
+
+        Args:
+            x0 (int): Minimum x of the area.
+            z0 (int): Minimum z of the area.
+            width (int): Side length of the area.
+
+        Returns:
+            int: The y of the lowest sampled surface block.
+        """
+        key = ((x0 + width // 2) // 16, (z0 + width // 2) // 16)
+        now = time.monotonic()
+        cached = self._height_cache.get(key)
+        if cached and now - cached[0] < self._height_ttl:
+            return cached[1]
+
+        # All 16 getHeight probes go out in one write
+        offsets = [(2 * i + 1) * width // 8 for i in range(4)]
+        replies = pipeline_requests(
+            self.mc.conn,
+            b"world.getHeight",
+            [(x0 + dx, z0 + dz) for dx in offsets for dz in offsets],
+        )
+        ground = min(map(int, replies))
+        self._height_cache[key] = (now, ground)
+        return ground
+
     def harvest_wood(self):
+        """
+        Scans around the player once and chops every trunk found.
+
+        Returns:
+            bool: True if trees were chopped and more wood is still needed.
+        """
         if not self.mc:
-            return
+            return False
 
         # Strategy: Look for wood blocks above ground
         # Scan a wide area around player
         pos = self.mc.player.getTilePos()
+        px, pz = pos.x, pos.z
         search_radius = 20
         height_search = 10
 
         self.logger.info("Scanning for trees...")
 
         try:
-            found_tree = False
-            for x in range(-search_radius, search_radius):
-                for z in range(-search_radius, search_radius):
-                    for y in range(0, height_search):
-                        self._check_pause()
+            self._check_pause()
 
-                        target_x = pos.x + x
-                        target_y = pos.y + y
-                        target_z = pos.z + z
+            # One world.getBlocks round-trip for the height_search layers just
+            # above the ground, where trunks start, instead of a slab anchored
+            # at the player
+            x0, z0 = px - search_radius, pz - search_radius
+            width = 2 * search_radius
+            y0 = self._ground_level(x0, z0, width) + 1
+            blocks = list(
+                self.mc.getBlocks(
+                    x0, y0, z0, x0 + width - 1, y0 + height_search - 1, z0 + width - 1
+                )
+            )
 
-                        block_id = self.mc.getBlock(target_x, target_y, target_z)
+            # The cuboid comes back y-major, then x, then z. Keep the lowest wood
+            # block per column; _chop_tree walks the trunk up from there.
+            # list.index does the search in C and only wood hits reach Python.
+            trunks = {}
+            layer = width * width
+            wood_id = WOOD_ID
+            i = -1
+            while True:
+                try:
+                    i = blocks.index(wood_id, i + 1)
+                except ValueError:
+                    break
+                dy, rem = divmod(i, layer)
+                dx, dz = divmod(rem, width)
+                trunks.setdefault((x0 + dx, z0 + dz), y0 + dy)
 
-                        if block_id == 17:  # Wood ID
-                            self.logger.info(f"Tree found at {target_x}, {target_z}!")
-                            self._chop_tree(target_x, target_y, target_z)
-                            found_tree = True
+            found_tree = False
+            for (target_x, target_z), target_y in trunks.items():
+                self._check_pause()
+
+                self.logger.info(f"Tree found at {target_x}, {target_z}!")
+                self._chop_tree(target_x, target_y, target_z)
+                found_tree = True
 
-                            # Check if we have enough
-                            if self.wood_inventory >= self.pending_req:
-                                self._deliver_wood()
-                                return
+                # Check if we have enough
+                if self.wood_inventory >= self.pending_req:
+                    self._deliver_wood()
+                    return False
+
+                # Hand over what we have so far so building can start early
+                if self.wood_inventory - self.delivered_wood >= PARTIAL_DELIVERY_SIZE:
+                    self._deliver_partial()
 
             if not found_tree:
                 self.logger.warning(
                     "No trees found in immediate area. Waiting before rescanning..."
                 )
-                time.sleep(5)
+                self._wake_event.wait(5.0)
+                self._wake_event.clear()
+                self._check_pause()
+            return found_tree
 
         except InterruptedError:
             self.logger.info("Lumbering stopped.")
+            return False
 
     def _chop_tree(self, x, y, z):
         """Chops a vertical column of wood."""
-        # Check up to 10 blocks high for the tree trunk
-        for i in range(10):
-            current_y = y + i
-            bid = self.mc.getBlock(x, current_y, z)
-
-            if bid == 17:  # Wood
-                self.mc.setBlock(x, current_y, z, block.AIR.id)
-                self.wood_inventory += 1
-                self.logger.info(f"Chopped wood. Total: {self.wood_inventory}")
-                time.sleep(0.5)
-            else:
-                # Top of trunk reached
+        # Read a column one taller than the tallest trunk seen so far. Only a
+        # trunk that fills the whole probe needs a second read for the rest.
+        probe = min(MAX_TRUNK_HEIGHT, self._tallest_trunk + 1)
+        height = self._count_wood(x, y, z, probe)
+        if height == probe < MAX_TRUNK_HEIGHT:
+            height += self._count_wood(x, y + probe, z, MAX_TRUNK_HEIGHT - probe)
+        if height > self._tallest_trunk:
+            self._tallest_trunk = height
+
+        if height:
+            self.mc.setBlocks(x, y, z, x, y + height - 1, z, block.AIR.id)
+            self.wood_inventory += height
+            self.logger.info(
+                "Chopped %d wood at (%d, %d). Total: %d",
+                height,
+                x,
+                z,
+                self.wood_inventory,
+            )
+            time.sleep(0.1)
+
+    def _count_wood(self, x, y, z, span):
+        """Counts contiguous wood blocks upward from (x, y, z), reading span blocks."""
+        wood_id = WOOD_ID
+        height = 0
+        for bid in self.mc.getBlocks(x, y, z, x, y + span - 1, z):
+            if bid != wood_id:  # Top of trunk reached
                 break
+            height += 1
+        return height
+
+    def _deliver_partial(self):
+        """Publishes the wood chopped since the last delivery, keeping the request open."""
+        delta = self.wood_inventory - self.delivered_wood
+        self.logger.info(
+            "Delivering %d wood blocks early (%d/%d).",
+            delta,
+            self.wood_inventory,
+            self.pending_req,
+        )
+        self._publish_wood(delta, partial=True)
+        self.delivered_wood = self.wood_inventory
 
     def _deliver_wood(self):
         self.logger.info(f"Delivering {self.wood_inventory} wood blocks.")
@@ -128,26 +254,27 @@ class LumberBot(BaseAgent):
                 f"LumberBot: Harvesting complete. Delivering {self.wood_inventory} Wood."
             )
 
+        # Only the part not already streamed by _deliver_partial
+        remaining = self.wood_inventory - self.delivered_wood
+        if remaining > 0:
+            self._publish_wood(remaining)
+
+        self.wood_inventory = 0
+        self.pending_req = 0
+        self.delivered_wood = 0
+
+    def _publish_wood(self, amount, partial=False):
         # We send what we have as raw WOOD
-        payload = {"WOOD": self.wood_inventory}
+        payload = {"WOOD": amount}
 
         msg = Message(
             type="inventory.v1",
             source=self.name,
-            target="MinerBot",  # Send to MinerBot so it can craft/distribute? Or Builder directly?
-            # Actually, let's send to MinerBot so MinerBot can merge it into his inventory logic
-            # OR send to BuilderBot directly.
-            # But the system expectation is MinerBot fulfills BOM.
-            # Let's effectively "give" it to the MinerBot's inventory by sending a special internal update
-            # OR just send to BuilderBot and hope BuilderBot aggregates.
-            # The cleanest way given current architecture:
-            payload={"inventory": payload},
+            # Routing is by topic: BuilderBot and ChatBot both receive this.
+            # Partial deliveries are flagged so receivers do not treat them
+            # as a finished delivery (retry counts, completion chat)
+            target="all",
+            payload={"inventory": payload, "partial": partial},
         )
         if self.bus:
-            # We publish to BuilderBot just like MinerBot does.
-            # Use same message type so BuilderBot accepts it.
-            # BuilderBot receives inventory.v1 and logs/stores it.
             self.bus.publish(msg)
-
-        self.wood_inventory = 0
-        self.pending_req = 0
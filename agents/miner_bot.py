@@ -1,11 +1,39 @@
 from mcpi.minecraft import Minecraft
 from core.base_agent import BaseAgent, AgentState
-from core.utils import load_classes, CRAFTING_RECIPES
+from core.utils import BatchedMinecraft, load_classes, CRAFTING_RECIPES
 from core.messaging import Message
 from strategies import MiningStrategy
-from functools import reduce
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+import heapq
+import itertools
+import math
+import re
+import sys
+import threading
 import time
 
+# Class-name suffixes dropped to form strategy keys ("GridSearch" -> "grid")
+_STRATEGY_SUFFIX = re.compile(r"(search|strategy)$")
+
+# Lock broadcast types, interned so the type checks in on_lock_activity
+# usually succeed on identity
+LOCK_ACQUIRE = sys.intern("lock.acquire")
+LOCK_RELEASE = sys.intern("lock.release")
+
+
+def _pack_sector(sx, sz):
+    """Packs a (x // 16, z // 16) sector into one int lock key."""
+    return (sx << 32) | (sz & 0xFFFFFFFF)
+
+
+def _unpack_sector(key):
+    """Inverse of _pack_sector; returns the (sx, sz) sector tuple."""
+    sz = key & 0xFFFFFFFF
+    if sz >= 0x80000000:
+        sz -= 0x100000000
+    return (key >> 32, sz)
+
 
 class MinerBot(BaseAgent):
     """
@@ -15,25 +43,65 @@ class MinerBot(BaseAgent):
     def __init__(self, name, message_bus=None):
         super().__init__(name, message_bus)
         try:
-            self.mc = Minecraft.create()
+            # Block edits from a strategy cycle are sent in one write on flush()
+            self.mc = BatchedMinecraft(Minecraft.create())
         except Exception as e:
             self.logger.error(f"Failed to connect to Minecraft: {e}")
             self.mc = None
 
         self.strategies = []
         self.strategy_map = {}
+        # Material name -> strategy declaring it in supported_materials()
+        self._strategy_by_material = {}
         self.selected_strategy = None
+        # Set by "/miner set strategy auto": the user authorized mining and
+        # leaves the pick to _strategy_by_material per request
+        self.strategy_auto = False
         self.auto_mine = False  # Default to False to prevent destruction
+        # Seconds VerticalSearch pauses per shaft depth; only paces the mining
+        # worker, since the shaft is cleared in one buffered write at the end
+        self.dig_delay = 0.0
+        self._last_announce = 0
 
         self.load_strategies()
 
+        # Heap of (priority, seq, requirements, job_id); lower priority runs
+        # first and seq keeps equal priorities FIFO. Requests without a job id
+        # all get priority 0, so they are served strictly in arrival order.
         self.mining_queue = []
+        # Guards mining_queue: bus handlers push, the mining worker pops
+        self._queue_lock = threading.Lock()
+        self._request_seq = itertools.count()
+        self._queue_version = 0
         # Current inventory of gathered resources
-        self.inventory = {}
+        self.inventory = Counter()
+        # Bumped on every inventory change; keys the _shortfall memo
+        self._inv_version = 0
+        self._req_cache = None
+        # (inventory version, queue version, strategy) -> last checkpoint data
+        self._checkpoint_cache = None
+        # Sector locks are held as _pack_sector ints rather than tuples
         self.locked_sectors = set()
+        # Guards locked_sectors: claims happen on the agent thread, force
+        # releases can arrive from bus handler threads
+        self._sector_guard = threading.Lock()
         self.global_locks = set()
         self.force_delivery = False
 
+        # Player tile position cached briefly; the player rarely changes
+        # sector between mine() ticks
+        self._player_pos = None
+        self._player_pos_ts = 0.0
+        self._player_pos_ttl = 0.25
+
+        # mine() and free_mine() run on a single worker so act() returns at
+        # once and the agent loop keeps ticking; one job at a time since jobs
+        # share the inventory, the queue head and the mc connection
+        self._mining_pool = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix=f"{name}-mine"
+        )
+        self._mining_job = None
+
         if self.bus:
             self.bus.subscribe(
                 "materials.requirements.v1", self.on_requirements_received
@@ -41,8 +109,13 @@ class MinerBot(BaseAgent):
             self.bus.subscribe("control.minerbot.start", self.on_manual_start)
             self.bus.subscribe("control.minerbot.strategy", self.on_set_strategy)
             self.bus.subscribe("control.minerbot.fulfill", self.on_fulfill)
-            self.bus.subscribe("lock.acquire", self.on_lock_activity)
-            self.bus.subscribe("lock.release", self.on_lock_activity)
+            # Our own lock broadcasts are dropped by the bus, never dispatched
+            self.bus.subscribe(
+                LOCK_ACQUIRE, self.on_lock_activity, exclude_source=self.name
+            )
+            self.bus.subscribe(
+                LOCK_RELEASE, self.on_lock_activity, exclude_source=self.name
+            )
             self.bus.subscribe("control.minerbot.automine", self.on_automine_toggle)
 
     def on_automine_toggle(self, message: Message):
@@ -56,35 +129,76 @@ class MinerBot(BaseAgent):
 
     def transition_state(self, new_state, reason):
         super().transition_state(new_state, reason)
+        if new_state == AgentState.STOPPED:
+            # A running mine() sees the stop at its next pause check
+            self._mining_pool.shutdown(wait=False, cancel_futures=True)
         if new_state in [AgentState.STOPPED, AgentState.ERROR]:
-            if self.locked_sectors:
+            released = self._release_all_sectors()
+            if released:
                 self.logger.warning(
-                    f"Force releasing {len(self.locked_sectors)} sector locks due to {new_state.name} state."
+                    f"Force releasing {len(released)} sector locks due to {new_state.name} state."
                 )
-                # Broadcast release of all owned locks
-                for sector in self.locked_sectors:
-                     self._publish_lock_event("lock.release", sector)
-                self.locked_sectors.clear()
+                # Broadcast release of all owned locks in one message
+                self._publish_lock_event_bulk(LOCK_RELEASE, released)
 
     def on_lock_activity(self, message: Message):
         """
         Maintains the global lock registry based on broadcasts from other miners.
-        """
-        # Ignore our own messages
-        if message.source == self.name:
-            return
+        The bus never delivers this agent's own broadcasts (exclude_source).
 
+        A payload carries either one "sector" or a bulk list of "sectors".
+        """
         payload = message.payload
-        sector = tuple(payload.get("sector", []))
-        if not sector:
-            return
+        sector = payload.get("sector")
+        if sector:
+            sectors = (sector,)
+        else:
+            sectors = payload.get("sectors")
+            if not sectors:
+                return
+        keys = [_pack_sector(sx, sz) for sx, sz in sectors]
+
+        if message.type == LOCK_ACQUIRE:
+            self.global_locks.update(keys)
+            self.logger.debug(
+                "Registered global lock on sectors %s by %s", sectors, message.source
+            )
+        elif message.type == LOCK_RELEASE:
+            self.global_locks.difference_update(keys)
+            self.logger.debug(
+                "Released global lock on sectors %s by %s", sectors, message.source
+            )
+
+    def _claim_sector(self, sector):
+        """
+        Atomically claims a sector for this agent.
+
+        Args:
+            sector (int): The _pack_sector key of the (x // 16, z // 16) sector.
 
-        if message.type == "lock.acquire":
-            self.global_locks.add(sector)
-            self.logger.debug(f"Registered global lock on sector {sector} by {message.source}")
-        elif message.type == "lock.release":
-            self.global_locks.discard(sector)
-            self.logger.debug(f"Released global lock on sector {sector} by {message.source}")
+        Returns:
+            bool: True if the sector was free and is now held by this agent.
+        """
+        with self._sector_guard:
+            if sector in self.locked_sectors or sector in self.global_locks:
+                return False
+            self.locked_sectors.add(sector)
+            return True
+
+    def _release_sector(self, sector):
+        """Drops a claim; returns True if this agent was holding it."""
+        with self._sector_guard:
+            if sector not in self.locked_sectors:
+                return False
+            self.locked_sectors.remove(sector)
+            return True
+
+    def _release_all_sectors(self):
+        """Drops every claim and returns the sectors that were held."""
+        with self._sector_guard:
+            released = list(self.locked_sectors)
+            self.locked_sectors.clear()
+        return released
 
     def _publish_lock_event(self, event_type, sector):
         if self.bus:
@@ -92,26 +206,65 @@ class MinerBot(BaseAgent):
                 type=event_type,
                 source=self.name,
                 target="all",
-                payload={"sector": sector}
+                payload={"sector": list(_unpack_sector(sector))}
+            )
+            self.bus.publish(msg)
+
+    def _publish_lock_event_bulk(self, event_type, sectors):
+        """Broadcasts one lock event covering several packed sector keys."""
+        if self.bus:
+            msg = Message(
+                type=event_type,
+                source=self.name,
+                target="all",
+                payload={"sectors": [list(_unpack_sector(key)) for key in sectors]},
             )
             self.bus.publish(msg)
 
     def _get_checkpoint_data(self):
-        return {
-            "inventory": self.inventory,
-            "mining_queue": self.mining_queue,
+        # Rebuilt only when the inventory, queue or strategy changed since the
+        # last save. The inventory is snapshotted so serialization never walks
+        # the live Counter while the mining worker updates it.
+        key = (
+            self._inv_version,
+            self._queue_version,
+            self.selected_strategy,
+            self.strategy_auto,
+        )
+        cached = self._checkpoint_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        with self._queue_lock:
+            queue = sorted(self.mining_queue)
+        data = {
+            "inventory": dict(self.inventory),
+            "mining_queue": [entry[2] for entry in queue],
+            # [priority, job_id] per mining_queue entry, in the same order
+            "mining_queue_meta": [[entry[0], entry[3]] for entry in queue],
             "selected_strategy": (
                 self.selected_strategy.__class__.__name__
                 if self.selected_strategy
                 else None
             ),
+            "strategy_auto": self.strategy_auto,
         }
+        self._checkpoint_cache = (key, data)
+        return data
 
     def _apply_checkpoint_data(self, data):
-        self.inventory = data.get("inventory", {})
-        self.mining_queue = data.get("mining_queue", [])
+        self.inventory = Counter(data.get("inventory", {}))
+        self._inventory_changed()
+        with self._queue_lock:
+            self.mining_queue = []
+            self._queue_version += 1
+        queue = data.get("mining_queue", [])
+        meta = data.get("mining_queue_meta") or [[None, None]] * len(queue)
+        for reqs, (priority, job_id) in zip(queue, meta):
+            self._enqueue_request(reqs, priority, job_id)
 
         # Restore strategy if possible
+        self.strategy_auto = data.get("strategy_auto", False)
         strat_name = data.get("selected_strategy")
         if strat_name:
             # Map class name back to instance?
@@ -135,13 +288,12 @@ class MinerBot(BaseAgent):
                 strategy = strat_cls()
                 self.strategies.append(strategy)
 
-                # Create a simple key (e.g., "vertical")
-                key = (
-                    strat_cls.__name__.lower()
-                    .replace("search", "")
-                    .replace("strategy", "")
-                )
+                # Create a simple key (e.g., "vertical"), interned so lookups
+                # compare by identity
+                key = sys.intern(_STRATEGY_SUFFIX.sub("", strat_cls.__name__.lower()))
                 self.strategy_map[key] = strategy
+                for material in strategy.supported_materials():
+                    self._strategy_by_material.setdefault(material, strategy)
 
                 self.logger.info(f"Loaded strategy: {strat_cls.__name__} as '{key}'")
             except Exception as e:
@@ -149,6 +301,35 @@ class MinerBot(BaseAgent):
                     f"Failed to instantiate strategy {strat_cls.__name__}: {e}"
                 )
 
+        # The strategy set is fixed from here on, so the prompt is built once
+        self._wait_msg = (
+            "MinerBot: Waiting for strategy. "
+            f"Type 'mine <{', '.join([*self.strategy_map, 'auto'])}>' to start."
+        )
+
+    def _strategy_for(self, reqs):
+        """
+        Picks the strategy for a request: the user's selection if any. In
+        "auto" mode it is the first strategy that specializes in a requested
+        material, falling back to the first loaded strategy.
+
+        Args:
+            reqs (dict): Item name -> quantity.
+
+        Returns:
+            MiningStrategy: The strategy to run, or None while mining has not
+                been authorized by the user.
+        """
+        if self.selected_strategy:
+            return self.selected_strategy
+        if not self.strategy_auto:
+            return None
+        for item in reqs:
+            strategy = self._strategy_by_material.get(item)
+            if strategy:
+                return strategy
+        return self.strategies[0] if self.strategies else None
+
     def on_set_strategy(self, message: Message):
         """
         Handles requests to switch the mining strategy.
@@ -156,12 +337,21 @@ class MinerBot(BaseAgent):
         Args:
             message (Message): The control message containing the strategy name.
         """
-        strat_name = message.payload.get("strategy", "").lower()
-        if strat_name in self.strategy_map:
+        strat_name = sys.intern(str(message.payload.get("strategy", "")).lower())
+        if strat_name == "auto":
+            self.selected_strategy = None
+            self.strategy_auto = True
+            self.logger.info("Switched strategy: auto (per material)")
+            if self.mc:
+                self.mc.postToChat("[Miner] Switched to auto (per material)")
+            self.wake()
+        elif strat_name in self.strategy_map:
             self.selected_strategy = self.strategy_map[strat_name]
+            self.strategy_auto = False
             self.logger.info(f"Switched strategy: {strat_name}")
             if self.mc:
                 self.mc.postToChat(f"[Miner] Switched to {strat_name}")
+            self.wake()
         else:
             if self.mc:
                 self.mc.postToChat(f"[Miner] Unknown strategy: {strat_name}")
@@ -169,12 +359,16 @@ class MinerBot(BaseAgent):
     def on_manual_start(self, message: Message):
         self.transition_state(AgentState.RUNNING, "Manual start override command")
         # Default strategy if needed
-        if not self.selected_strategy and "grid" in self.strategy_map:
+        if (
+            not self.selected_strategy
+            and not self.strategy_auto
+            and "grid" in self.strategy_map
+        ):
             self.selected_strategy = self.strategy_map["grid"]
 
         # Add generic task if empty
         if not self.mining_queue:
-            self.mining_queue.append({"MANUAL": 1})
+            self._enqueue_request({"MANUAL": 1})
 
         self.logger.info("Miner forced start.")
 
@@ -184,7 +378,7 @@ class MinerBot(BaseAgent):
 
     def get_inventory_statistics(self):
         """
-        Calculates aggregate statistics for the current inventory using functional paradigm.
+        Calculates aggregate statistics for the current inventory as a fold over its counts.
 
         Returns:
             tuple: (total_item_count, distinct_item_types)
@@ -192,23 +386,24 @@ class MinerBot(BaseAgent):
         if not self.inventory:
             return 0, 0
 
-        # Functional reduction to get total item count
-        total_items = reduce(lambda acc, count: acc + count, self.inventory.values(), 0)
+        # Functional reduction to get total item count; sum is the builtin
+        # fold for addition, so no Python-level lambda call per item
+        total_items = sum(self.inventory.values())
         return total_items, len(self.inventory)
 
     def get_additional_status(self):
         """Overrides BaseAgent status to add miner info."""
-        strat = (
-            self.selected_strategy.__class__.__name__
-            if self.selected_strategy
-            else "None"
-        )
+        if self.selected_strategy:
+            strat = self.selected_strategy.__class__.__name__
+        else:
+            strat = "auto" if self.strategy_auto else "None"
         total_items, _ = self.get_inventory_statistics()
 
         return {
             "strategy": strat,
             "queue_length": len(self.mining_queue),
-            "inventory": str(self.inventory),
+            # A plain snapshot; ChatBot formats it only when it posts the report
+            "inventory": dict(self.inventory),
             "total_items_mined": total_items,
         }
 
@@ -236,16 +431,72 @@ class MinerBot(BaseAgent):
         filtered_reqs = reqs
 
         if filtered_reqs:
-            self.mining_queue.append(filtered_reqs)
+            self._enqueue_request(
+                filtered_reqs,
+                message.payload.get("priority"),
+                message.payload.get("job_id"),
+            )
         elif reqs:
             self.logger.info("All requirements were delegated to other bots.")
 
+    def _enqueue_request(self, reqs, priority=None, job_id=None):
+        """
+        Queues a bill of materials for mining.
+
+        Only requests carrying the requester's job id are reordered: the
+        delivery echoes the id, so the requester can credit the right job
+        however the queue was served. Everything else stays FIFO.
+
+        Args:
+            reqs (dict): Item name -> quantity.
+            priority (float): Optional explicit priority, lower first; defaults
+                to the total quantity so small orders are not stuck behind
+                large ones. Ignored without a job_id.
+            job_id: Optional requester job id, echoed in the inventory.v1 delivery.
+        """
+        if job_id is None:
+            priority = 0
+        else:
+            priority = self._coerce_priority(priority, job_id)
+            if priority is None:
+                priority = sum(reqs.values())
+        with self._queue_lock:
+            heapq.heappush(
+                self.mining_queue, (priority, next(self._request_seq), reqs, job_id)
+            )
+            self._queue_version += 1
+
+    def _coerce_priority(self, priority, job_id):
+        """
+        Converts a payload priority to a finite float, so every heap key
+        compares with every other.
+
+        Returns:
+            float: The priority, or None if it was absent or invalid.
+        """
+        if priority is None:
+            return None
+        try:
+            value = float(priority)
+        except (TypeError, ValueError):
+            value = math.nan
+        if not math.isfinite(value):
+            self.logger.warning(f"Ignoring invalid priority {priority!r} for job {job_id}.")
+            return None
+        return value
+
     def perceive(self):
         pass
 
+    def _queue_head(self):
+        """Returns the next mining_queue entry, or None if the queue is empty."""
+        with self._queue_lock:
+            return self.mining_queue[0] if self.mining_queue else None
+
     def decide(self):
-        if self.mining_queue:
-            if self.selected_strategy:
+        head = self._queue_head()
+        if head is not None:
+            if self._strategy_for(head[2]):
                 return "mine"
             else:
                 return "wait_for_strategy"
@@ -260,31 +511,60 @@ class MinerBot(BaseAgent):
     def act(self):
         decision = self.decide()
         if decision == "mine":
-            self.mine()
+            self._submit_mine()
         elif decision == "wait_for_strategy":
-            if self.mc:
-                # Announce once every few seconds
-                now = time.time()
-                # Use getattr to initialize last_announce if not present
-                if not hasattr(self, "_last_announce"):
-                    self._last_announce = 0
-
-                if now - self._last_announce > 15:
-                    msg = f"MinerBot: Waiting for strategy. Type 'mine <{', '.join(self.strategy_map.keys())}>' to start."
-                    self.mc.postToChat(msg)
-                    self._last_announce = now
-
-            self.logger.info("Waiting for mining strategy selection...")
-            time.sleep(2)
+            # Announce once every few seconds; on_set_strategy wakes the loop
+            now = time.time()
+            if now - self._last_announce > 15:
+                if self.mc:
+                    self.mc.postToChat(self._wait_msg)
+                self.logger.info("Waiting for mining strategy selection...")
+                self._last_announce = now
         elif decision == "deposit":
             self.deposit_items()
         elif decision == "free_mine":
-            self.free_mine()
+            self._submit_mine(self.free_mine)
+
+    def _submit_mine(self, job=None):
+        """
+        Starts a mining job on the worker unless one is still running.
+
+        Args:
+            job (Callable): The job to run; defaults to mine().
+        """
+        if self._mining_job is not None and not self._mining_job.done():
+            return
+        try:
+            self._mining_job = self._mining_pool.submit(job or self.mine)
+        except RuntimeError:  # Worker shut down by a stop
+            return
+        self._mining_job.add_done_callback(self._on_mining_done)
+
+    def _on_mining_done(self, future):
+        """Surfaces a crashed mine() job the way the run loop would."""
+        e = future.exception()
+        if e is not None:
+            self.transition_state(AgentState.ERROR, f"Crash in mining job: {str(e)}")
+            self.logger.error(f"Agent {self.name} encountered an error: {e}")
+            self.handle_error(e)
+
+    def _get_player_pos(self):
+        """
+        Returns the player's tile position, re-queried at most every
+        _player_pos_ttl seconds.
+
+        Returns:
+            Vec3: The cached or freshly fetched tile position.
+        """
+        now = time.monotonic()
+        if self._player_pos is None or now - self._player_pos_ts > self._player_pos_ttl:
+            self._player_pos = self.mc.player.getTilePos()
+            self._player_pos_ts = now
+        return self._player_pos
 
     def _check_pause(self):
         """Checks and handles agent pause state."""
-        while self.state == AgentState.PAUSED:
-            time.sleep(1)
+        self.wait_while_paused()
         if self.state == AgentState.STOPPED:
             raise InterruptedError("Stopped")
 
@@ -295,7 +575,7 @@ class MinerBot(BaseAgent):
 
         if self.mc:
             try:
-                pos = self.mc.player.getTilePos()
+                pos = self._get_player_pos()
                 # Place a chest at player's feet (or next to)
                 # self.mc.setBlock(pos.x, pos.y, pos.z, 54) # 54 is Chest
                 # Actually, let's just claim we gave it to them, or put in a chest at offset
@@ -303,12 +583,14 @@ class MinerBot(BaseAgent):
                 self.mc.setBlock(chest_pos[0], chest_pos[1], chest_pos[2], 54)
                 
                 # We can't fill it with MCPI, so we just clear inventory and notify
-                self.mc.postToChat(f"MinerBot: Deposited {dict(self.inventory)} in chest at {chest_pos}.")
+                self.mc.queue_chat(f"MinerBot: Deposited {dict(self.inventory)} in chest at {chest_pos}.")
+                self.mc.flush()
             except Exception as e:
                 self.logger.error(f"Failed to post chat/block: {e}")
 
         # Clear inventory
         self.inventory.clear()
+        self._inventory_changed()
         time.sleep(2) # Simulation delay
 
     def free_mine(self):
@@ -320,8 +602,8 @@ class MinerBot(BaseAgent):
             time.sleep(1)
             return
 
-        # Default to Grid strategy if none selected
-        if not self.selected_strategy:
+        # Default to Grid strategy if none selected (auto mode keeps its pick)
+        if not self.selected_strategy and not self.strategy_auto:
             if "grid" in self.strategy_map:
                 self.selected_strategy = self.strategy_map["grid"]
             else:
@@ -331,7 +613,7 @@ class MinerBot(BaseAgent):
 
         # Calculate target: Player + 3 blocks forward
         try:
-            pos = self.mc.player.getTilePos()
+            pos = self._get_player_pos()
             direction = self.mc.player.getDirection()
             
             # Target is 3 blocks away
@@ -341,13 +623,16 @@ class MinerBot(BaseAgent):
             
             self.logger.info(f"Free mining at {target} (Player at {pos})")
             
-            # Execute ONE cycle of the strategy
-            loot = self.selected_strategy.execute(self, start_loc=target)
+            # Execute ONE cycle of the strategy, then send its block edits at once
+            try:
+                loot = self._strategy_for({}).execute(self, start_loc=target)
+            finally:
+                self.mc.flush()
             
             if loot:
                 self.logger.info(f"Free mine yield: {loot}")
-                for item, count in loot.items():
-                    self.inventory[item] = self.inventory.get(item, 0) + count
+                self.inventory.update(loot)
+                self._inventory_changed()
             
             time.sleep(1)
 
@@ -364,65 +649,110 @@ class MinerBot(BaseAgent):
         Handles errors by ensuring all acquired locks are released.
         """
         self.logger.error(f"MinerBot error handler caught: {error}")
-        if self.locked_sectors:
-            self.logger.warning(f"Releasing {len(self.locked_sectors)} locks due to error.")
-            for sector in list(self.locked_sectors):
-                self._publish_lock_event("lock.release", sector)
-                self.locked_sectors.remove(sector)
+        released = self._release_all_sectors()
+        if released:
+            self.logger.warning(f"Releasing {len(released)} locks due to error.")
+            self._publish_lock_event_bulk(LOCK_RELEASE, released)
             self.logger.info("All locks released.")
 
-    def _requirements_met(self, reqs):
-        """Checks if the current inventory meets the requirements, considering crafting."""
+    def _inventory_changed(self):
+        """Invalidates the _shortfall memo after any inventory mutation."""
+        self._inv_version += 1
+
+    def _shortfall(self, reqs):
+        """
+        Compares a request against the inventory, treating STONE and
+        COBBLESTONE as one interchangeable pool.
 
-        # Calculate total available of each item including what can be crafted
-        available = self.inventory.copy()
+        The result is memoized until the inventory changes or another
+        request is checked, since the mining loop asks repeatedly.
 
-        # Aggregate Interchangeable Blocks
-        # Combine STONE and COBBLESTONE into "STONE" bucket for checking
-        # But wait, requirements might ask for COBBLESTONE explicitly.
-        # Let's just treat them as one pool.
-        stone_pool = available.get("STONE", 0) + available.get("COBBLESTONE", 0)
+        Args:
+            reqs (dict): Item name -> quantity.
+
+        Returns:
+            tuple: (missing, stone_pool) where missing maps each short item
+                to the quantity still needed.
+        """
+        cached = self._req_cache
+        if (
+            cached is not None
+            and cached[0] == self._inv_version
+            and cached[1] is reqs
+        ):
+            return cached[2]
+
+        available = self.inventory
+        stone_pool = available["STONE"] + available["COBBLESTONE"]
 
-        # Check raw numbers first
         missing = {}
         for item, count in reqs.items():
-            current = available.get(item, 0)
-
-            # Special Handling for Stone/Cobble
             if item in ["STONE", "COBBLESTONE"]:
                 current = stone_pool
-
+            else:
+                current = available[item]  # Counter lookups default to 0
             if current < count:
                 missing[item] = count - current
 
+        result = (missing, stone_pool)
+        self._req_cache = (self._inv_version, reqs, result)
+        return result
+
+    def _requirements_met(self, reqs):
+        """Checks if the current inventory meets the requirements."""
+        missing, _ = self._shortfall(reqs)
+        return not missing
+
+    def _step_requirements(self, reqs):
+        """
+        One requirements check per mining attempt: crafts if that can close
+        the gap, and otherwise reports what still has to be mined.
+
+        Args:
+            reqs (dict): Item name -> quantity.
+
+        Returns:
+            tuple: ("met" or "mine", missing) with missing as from _shortfall.
+        """
+        missing, _ = self._shortfall(reqs)
         if not missing:
-            return True
+            return "met", missing
 
-        # Try to satisfy missing items via crafting
-        for item, amount_needed in missing.items():
-            if item in CRAFTING_RECIPES:
-                # Basic check if it's craftable (doesn't check ingredient inventory strictly here)
-                return False 
-        
-        return False
+        # Try to craft first (e.g. if we mined Wood, make Planks); only worth
+        # a pass when something missing has a recipe
+        if any(item in CRAFTING_RECIPES for item in missing) and self._try_craft(reqs):
+            missing, _ = self._shortfall(reqs)
+            if not missing:
+                return "met", missing
+
+        return "mine", missing
 
     def _try_craft(self, reqs):
-        """Attempts to craft items to fulfill requirements."""
+        """
+        Attempts to craft items to fulfill requirements.
+
+        Returns:
+            bool: True if anything was crafted.
+        """
         self.logger.info("Attempting to craft missing items...")
+        crafted = False
 
+        # inventory is a Counter: absent items read as 0 with a single lookup
+        inventory = self.inventory
         for item, count in reqs.items():
-            if self.inventory.get(item, 0) >= count:
+            have = inventory[item]
+            if have >= count:
                 continue
 
             if item in CRAFTING_RECIPES:
                 recipe = CRAFTING_RECIPES[item]
-                needed = count - self.inventory.get(item, 0)
+                needed = count - have
 
                 # Check ingredients
                 can_craft = True
                 for ingred, qty in recipe.items():
                     ingredient_needed = needed * qty
-                    if self.inventory.get(ingred, 0) < ingredient_needed:
+                    if inventory[ingred] < ingredient_needed:
                         can_craft = False
                         break
 
@@ -430,17 +760,25 @@ class MinerBot(BaseAgent):
                     self.logger.info(f"Crafting {needed} {item} from {recipe}")
                     # Consume ingredients
                     for ingred, qty in recipe.items():
-                        self.inventory[ingred] -= needed * qty
+                        inventory[ingred] -= needed * qty
 
                     # Add product
-                    self.inventory[item] = self.inventory.get(item, 0) + needed
+                    inventory[item] += needed
+                    self._inventory_changed()
+                    crafted = True
                     time.sleep(1)  # Simulation time
 
+        return crafted
+
     def mine(self):
         if not self.mc:
             return
 
-        req = self.mining_queue[0]
+        entry = self._queue_head()
+        if entry is None:
+            return
+        req = entry[2]
+        job_id = entry[3]
         self.logger.info(f"Processing mining request: {req}")
 
         # Define a mining location
@@ -448,7 +786,7 @@ class MinerBot(BaseAgent):
         # or just offset from the current position to avoid digging under self.
         # But wait, we want to simulate an autonomous agent.
         # Let's try to mine at (x+5, z+5) from current pos.
-        pos = self.mc.player.getTilePos()
+        pos = self._get_player_pos()
 
         # Better yet: Create a "Quarry" location offset from the player
         # so we don't fall into our own hole.
@@ -463,32 +801,39 @@ class MinerBot(BaseAgent):
         # But for now, we enforce local consistency so THIS miner doesn't dig in its own prior hole.
 
         sector = (mining_loc[0] // 16, mining_loc[2] // 16)
+        sector_key = _pack_sector(*sector)
 
         # Check existing locks (Local)
-        if sector in self.locked_sectors:
+        if sector_key in self.locked_sectors:
             self.logger.warning(
                 f"Sector {sector} is already locked by this agent. Shifting quarry site."
             )
             # Try shifting to next sector
             mining_loc = (pos.x + 26, pos.y, pos.z + 10)
             sector = (mining_loc[0] // 16, mining_loc[2] // 16)
+            sector_key = _pack_sector(*sector)
 
-        if sector in self.locked_sectors:
+        if sector_key in self.locked_sectors:
             self.logger.warning(
                 "Alternative sector also locked. Aborting mine cycle to find new spot."
             )
             return
         
         # Check Global Locks
-        if sector in self.global_locks:
+        if sector_key in self.global_locks:
             self.logger.warning(
                 f"Sector {sector} is globally locked by another MinerBot. Aborting."
             )
             return
 
+        # Claim atomically; a concurrent claim or release may have landed
+        # since the checks above
+        if not self._claim_sector(sector_key):
+            self.logger.warning(f"Sector {sector} was claimed concurrently. Aborting.")
+            return
+
         # Announce Lock to other agents
-        self.locked_sectors.add(sector)
-        self._publish_lock_event("lock.acquire", sector)
+        self._publish_lock_event(LOCK_ACQUIRE, sector_key)
         self.logger.info(f"Locked sector {sector} for mining at {mining_loc}")
 
         try:
@@ -496,19 +841,18 @@ class MinerBot(BaseAgent):
             max_attempts = 10
             attempts = 0
 
-            while not self._requirements_met(req) and attempts < max_attempts:
+            while attempts < max_attempts:
                 # Force delivery check
                 if self.force_delivery:
                     break
 
-                # Try to craft first (e.g. if we mined Wood, make Planks)
-                self._try_craft(req)
-                if self._requirements_met(req):
+                # Craft if that is enough, otherwise mine what is missing
+                status, _ = self._step_requirements(req)
+                if status == "met":
                     break
 
-                # Check for Pause/Stop
-                while self.state == AgentState.PAUSED:
-                    time.sleep(1)
+                # Check for Pause/Stop; blocks until resumed, without polling
+                self.wait_while_paused()
 
                 if self.state == AgentState.STOPPED:
                     self.logger.info("Mining operation stopped by command.")
@@ -516,27 +860,27 @@ class MinerBot(BaseAgent):
 
                 attempts += 1
                 self.logger.info(
-                    f"Mining attempt {attempts}/{max_attempts}. Inventory: {self.inventory}"
+                    f"Mining attempt {attempts}/{max_attempts}. Inventory: {dict(self.inventory)}"
                 )
 
-                # Execute the selected strategy
-                if not self.selected_strategy:
+                # Execute the selected (or material-matched) strategy
+                strategy = self._strategy_for(req)
+                if not strategy:
                     self.logger.warning("No strategy selected!")
                     break
 
-                strategy = self.selected_strategy
-
-                # Execute returns the loot dict
+                # Execute returns the loot dict; its block edits are buffered
+                # until the end of this attempt
                 loot = strategy.execute(self, start_loc=mining_loc)
 
                 if loot:
                     # Merge loot into inventory
-                    for item, count in loot.items():
-                        self.inventory[item] = self.inventory.get(item, 0) + count
+                    self.inventory.update(loot)
+                    self._inventory_changed()
 
                     if self.mc and str(loot) != "{}":
-                        self.mc.postToChat(
-                            f"MinerBot: Mined {loot}. Total: {self.inventory}"
+                        self.mc.queue_chat(
+                            f"MinerBot: Mined {loot}. Total: {dict(self.inventory)}"
                         )
 
                     # Move the mining site slightly for next attempt.
@@ -554,39 +898,35 @@ class MinerBot(BaseAgent):
                     )
                     mining_loc = (mining_loc[0] + 8, mining_loc[1], mining_loc[2])
 
-                # Check again if we can craft now
-                self._try_craft(req)
+                # One write for this attempt's block edits and chat, before
+                # the next attempt reads the world again
+                self.mc.flush()
 
                 # Simulate move delay or cooldown
                 time.sleep(1)
 
+            # Last attempt's loot may now be craftable into what is missing
+            status, missing = self._step_requirements(req)
+
             # --- SIMULATION FALLBACK START ---
-            if not self._requirements_met(req) and not self.force_delivery:
+            if status != "met" and not self.force_delivery:
                 self.logger.warning(
                     f"Failed to fulfill BOM naturally after {max_attempts} attempts. Simulating resource acquisition."
                 )
                 if self.mc:
-                    self.mc.postToChat("MinerBot: Simulating resources (Creative Mode fallback).")
+                    self.mc.queue_chat("MinerBot: Simulating resources (Creative Mode fallback).")
                 
-                # Artificially fill the inventory with the required missing items
-                missing_items = {}
-                available = self.inventory.copy() # Re-calc what we have
-                stone_pool = available.get("STONE", 0) + available.get("COBBLESTONE", 0)
-
-                for item, count in req.items():
-                    current = available.get(item, 0)
-                    if item in ["STONE", "COBBLESTONE"]:
-                        current = stone_pool
-                    
-                    if current < count:
-                        missing_qty = count - current
-                        # Inject into inventory
-                        # For stone/cobble, just inject COBBLESTONE as it's easier to verify
-                        target_item = item
-                        if item == "STONE": target_item = "COBBLESTONE"
-                        
-                        self.inventory[target_item] = self.inventory.get(target_item, 0) + missing_qty
-                        self.logger.info(f"Simulated finding {missing_qty} {target_item}")
+                # Artificially fill the inventory with the required missing items,
+                # reusing the shortfall computed just above
+                for item, missing_qty in missing.items():
+                    # Inject into inventory
+                    # For stone/cobble, just inject COBBLESTONE as it's easier to verify
+                    target_item = item
+                    if item == "STONE": target_item = "COBBLESTONE"
+
+                    self.inventory[target_item] += missing_qty
+                    self.logger.info(f"Simulated finding {missing_qty} {target_item}")
+                self._inventory_changed()
 
             # --- SIMULATION FALLBACK END ---
 
@@ -595,7 +935,7 @@ class MinerBot(BaseAgent):
                 self.force_delivery = False  # Reset flag
 
                 if self.mc:
-                    self.mc.postToChat("MinerBot: Delivering materials.")
+                    self.mc.queue_chat("MinerBot: Delivering materials.")
 
                 # Deduct from inventory (simulate handing it over)
                 for item, count in req.items():
@@ -603,7 +943,7 @@ class MinerBot(BaseAgent):
                     if item in ["STONE", "COBBLESTONE"]:
                         deducted = 0
                         # Try taking from specific item first
-                        have = self.inventory.get(item, 0)
+                        have = self.inventory[item]
                         to_take = min(have, count)
                         if to_take > 0:
                             self.inventory[item] -= to_take
@@ -615,25 +955,45 @@ class MinerBot(BaseAgent):
                             sibling = (
                                 "STONE" if item == "COBBLESTONE" else "COBBLESTONE"
                             )
-                            self.inventory[sibling] = (
-                                self.inventory.get(sibling, 0) - remaining
-                            )
-                    else:
-                        # Standard deduction
-                        self.inventory[item] = self.inventory.get(item, 0) - count
+                            self.inventory[sibling] -= remaining
+
+                # Standard deduction for everything outside the stone pool
+                self.inventory.subtract(
+                    {
+                        item: count
+                        for item, count in req.items()
+                        if item not in ["STONE", "COBBLESTONE"]
+                    }
+                )
+                self._inventory_changed()
 
-                # Notify completion
+                # Notify completion; the job id tells BuilderBot which job
+                # this was, since the queue may not be served in its order
+                payload = {"inventory": req}
+                if job_id is not None:
+                    payload["job_id"] = job_id
                 msg = Message(
                     type="inventory.v1",
                     source=self.name,
                     target="BuilderBot",
-                    payload={"inventory": req},
+                    payload=payload,
                 )
                 if self.bus:
+                    # Non-blocking: the bus only enqueues, delivery is async
                     self.bus.publish(msg)
 
-                # Complete the request
-                self.mining_queue.pop(0)
+                # Complete the request, matched by its seq
+                with self._queue_lock:
+                    if self.mining_queue and self.mining_queue[0][1] == entry[1]:
+                        heapq.heappop(self.mining_queue)
+                    else:
+                        # A higher-priority request arrived while mining this one
+                        self.mining_queue = [
+                            queued for queued in self.mining_queue
+                            if queued[1] != entry[1]
+                        ]
+                        heapq.heapify(self.mining_queue)
+                    self._queue_version += 1
             else:
                 self.logger.warning(
                     f"Failed to fulfill BOM after {max_attempts} attempts. Missing items."
@@ -645,7 +1005,12 @@ class MinerBot(BaseAgent):
             else:
                  self.logger.error(f"Mining failed: {e}")
         finally:
-            if sector in self.locked_sectors:
-                self.locked_sectors.remove(sector)
-                self._publish_lock_event("lock.release", sector)
+            # Anything still buffered (chat, an interrupted attempt's edits)
+            # lands before the sector is released
+            try:
+                self.mc.flush()
+            except Exception as e:
+                self.logger.error(f"Failed to flush Minecraft writes: {e}")
+            if self._release_sector(sector_key):
+                self._publish_lock_event(LOCK_RELEASE, sector_key)
                 self.logger.info(f"Unlocked sector {sector}")
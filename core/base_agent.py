@@ -1,12 +1,15 @@
 from abc import ABC, abstractmethod
 import time
 import logging
-import json
 import os
 import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Optional, Dict, Any
 from core.fsm import AgentState
-from core.messaging import MessageBus, Message
+from core.messaging import MessageBus, Message, dumps_json, loads_json
+
+# One thread writes every agent's checkpoints, off the agents' own threads
+_CHECKPOINT_WRITER = ThreadPoolExecutor(max_workers=1, thread_name_prefix="checkpoint")
 
 
 class BaseAgent(ABC):
@@ -16,24 +19,63 @@ class BaseAgent(ABC):
     Manages the agent's lifecycle (FSM), message bus connection, and the main execution loop.
     """
 
+    # Slotted so subclasses that declare their own __slots__ (ChatBot,
+    # ExplorerBot) carry no per-instance __dict__; the others still get one
+    __slots__ = (
+        "name",
+        "state",
+        "logger",
+        "bus",
+        "_name_lc",
+        "_checkpoint_path",
+        "_state_lock",
+        "_resume_event",
+        "_wake",
+        "_tick_interval",
+        "_last_checkpoint",
+        "_checkpoint_lock",
+        "_pending_checkpoint",
+        "_checkpoint_future",
+    )
+
     def __init__(self, name: str, message_bus: Optional[MessageBus] = None):
         self.name = name
         self.state = AgentState.IDLE
         self.logger = logging.getLogger(name)
         self.bus = message_bus
+        # Lower-cased once for topic names and the checkpoint file name
+        self._name_lc = name.lower()  # e.g. "minerbot"
+        self._checkpoint_path = f"checkpoints/{self._name_lc}_checkpoint.json"
         self._state_lock = threading.Lock()
+        # Set whenever the agent is not PAUSED, so paused work can block on it
+        self._resume_event = threading.Event()
+        self._resume_event.set()
+        # Set on state changes and bus deliveries so _run_loop wakes early;
+        # the loop's wait timeouts are only a cadence/watchdog
+        self._wake = threading.Event()
+        self._tick_interval = 0.05
+        # (state name, encoded custom data) of the last checkpoint queued
+        self._last_checkpoint: Optional[tuple] = None
+        # Encoded snapshot waiting for the writer thread, and the writer task
+        # draining this agent's snapshots (None when idle)
+        self._checkpoint_lock = threading.Lock()
+        self._pending_checkpoint: Optional[bytes] = None
+        self._checkpoint_future: Optional[Future] = None
 
         if self.bus:
-            self.bus.subscribe("control.agent.pause", self.on_pause_command)
-            self.bus.subscribe("control.agent.resume", self.on_resume_command)
-            self.bus.subscribe("control.agent.stop", self.on_stop_command)
-            self.bus.subscribe("control.agent.status.request", self.on_status_request)
-
-            # Targeted commands
-            target_name = self.name.lower()  # e.g. "minerbot"
-            self.bus.subscribe(f"control.{target_name}.pause", self.on_pause_command)
-            self.bus.subscribe(f"control.{target_name}.resume", self.on_resume_command)
-            self.bus.subscribe(f"control.{target_name}.stop", self.on_stop_command)
+            # Broadcast and targeted (e.g. "control.minerbot.pause") commands
+            target_name = self._name_lc
+            self.bus.subscribe_many(
+                [
+                    ("control.agent.pause", self.on_pause_command),
+                    ("control.agent.resume", self.on_resume_command),
+                    ("control.agent.stop", self.on_stop_command),
+                    ("control.agent.status.request", self.on_status_request),
+                    (f"control.{target_name}.pause", self.on_pause_command),
+                    (f"control.{target_name}.resume", self.on_resume_command),
+                    (f"control.{target_name}.stop", self.on_stop_command),
+                ]
+            )
 
     def transition_state(self, new_state: AgentState, reason: str):
         """
@@ -46,35 +88,64 @@ class BaseAgent(ABC):
         """
         Transition state logic with thread safety and notifications.
         """
+        # Lock-free fast path: redundant transitions (the common case for
+        # repeated RUNNING/PAUSED commands) never touch the lock
+        if self.state == new_state:
+            return
+
+        # Only the compare-and-swap and the bus notification stay under the
+        # lock, so state_change events keep the order of the swaps
         with self._state_lock:
-            if self.state != new_state:
-                previous_state = self.state
-                self.state = new_state
-
-                # Structured Log
-                log_payload = {
-                    "event": "state_transition",
-                    "timestamp": time.time(),
-                    "agent": self.name,
-                    "previous_state": previous_state.name,
-                    "new_state": new_state.name,
-                    "reason": reason,
-                }
-                self.logger.info(f"State Transition: {log_payload}")
-
-                # Notification
-                if self.bus:
-                    msg = Message(
-                        type="agent.state_change.v1",
-                        source=self.name,
-                        target="all",
-                        payload={
-                            "previous_state": previous_state.name,
-                            "new_state": new_state.name,
-                            "reason": reason,
-                        },
-                    )
-                    self.bus.publish(msg)
+            previous_state = self.state
+            if previous_state == new_state:
+                return
+            self.state = new_state
+            self._sync_resume_event()
+            self._wake.set()
+
+            if self.bus:
+                msg = Message(
+                    type="agent.state_change.v1",
+                    source=self.name,
+                    target="all",
+                    payload={
+                        "previous_state": previous_state.name,
+                        "new_state": new_state.name,
+                        "reason": reason,
+                    },
+                )
+                self.bus.publish(msg)
+
+        # Structured Log, only built when INFO is actually emitted
+        if self.logger.isEnabledFor(logging.INFO):
+            log_payload = {
+                "event": "state_transition",
+                "timestamp": time.time(),
+                "agent": self.name,
+                "previous_state": previous_state.name,
+                "new_state": new_state.name,
+                "reason": reason,
+            }
+            self.logger.info("State Transition: %s", log_payload)
+
+    def _sync_resume_event(self):
+        """Keeps _resume_event in line with the current state."""
+        if self.state == AgentState.PAUSED:
+            self._resume_event.clear()
+        else:
+            self._resume_event.set()
+
+    def wake(self):
+        """Cuts the run loop's current wait short so it ticks immediately."""
+        self._wake.set()
+
+    def wait_while_paused(self):
+        """
+        Blocks while the agent is PAUSED, waking as soon as it is resumed or
+        stopped instead of polling.
+        """
+        while self.state == AgentState.PAUSED:
+            self._resume_event.wait(1.0)
 
     def on_status_request(self, message: Message):
         """Responds with the current status."""
@@ -117,7 +188,7 @@ class BaseAgent(ABC):
     def stop(self):
         """Stops the agent."""
         self.transition_state(AgentState.STOPPED, "Agent received stop command")
-        self.save_checkpoint()
+        self.save_checkpoint(wait=True)
 
     def pause(self):
         """Pauses the agent."""
@@ -130,36 +201,90 @@ class BaseAgent(ABC):
         if self.state == AgentState.PAUSED:
             self.transition_state(AgentState.RUNNING, "Agent received resume command")
 
-    def save_checkpoint(self):
-        """Serializes current state to a JSON file."""
+    def save_checkpoint(self, wait: bool = False):
+        """
+        Serializes current state to a JSON file.
+
+        The snapshot is taken and encoded on the caller's thread; the disk
+        write happens on the shared checkpoint writer thread. A snapshot
+        queued while a write is pending replaces it, so only the newest one
+        reaches disk.
+
+        Args:
+            wait (bool): Block until the snapshot has been written.
+        """
+        path = self._checkpoint_path
         try:
+            custom_data = self._get_checkpoint_data()
+
+            # Skip the write when nothing but the timestamp would change,
+            # e.g. when an agent is paused and resumed repeatedly
+            fingerprint = (self.state.name, dumps_json(custom_data))
+            if fingerprint == self._last_checkpoint and os.path.exists(path):
+                self.logger.debug("Checkpoint unchanged, keeping %s", path)
+                return
+
             data = {
                 "state": self.state.name,
                 "timestamp": time.time(),
-                "custom_data": self._get_checkpoint_data(),
+                "custom_data": custom_data,
             }
+            payload = dumps_json(data, indent=True)
+        except Exception as e:
+            self.logger.error(f"Failed to save checkpoint: {e}")
+            return
 
-            # Ensure checkpoints_dir exists
-            if not os.path.exists("checkpoints"):
-                os.makedirs("checkpoints")
+        with self._checkpoint_lock:
+            self._last_checkpoint = fingerprint
+            self._pending_checkpoint = payload
+            if self._checkpoint_future is None:
+                self._checkpoint_future = _CHECKPOINT_WRITER.submit(
+                    self._flush_checkpoints
+                )
+            future = self._checkpoint_future
+
+        if wait:
+            future.result()
+
+    def _flush_checkpoints(self):
+        """Writer thread: writes pending snapshots until none is left."""
+        path = self._checkpoint_path
+        while True:
+            with self._checkpoint_lock:
+                payload = self._pending_checkpoint
+                self._pending_checkpoint = None
+                if payload is None:
+                    self._checkpoint_future = None
+                    return
 
-            path = f"checkpoints/{self.name.lower()}_checkpoint.json"
-            with open(path, "w") as f:
-                json.dump(data, f, indent=4)
-            self.logger.info(f"Checkpoint saved to {path}")
+            try:
+                # Ensure checkpoints_dir exists
+                os.makedirs("checkpoints", exist_ok=True)
+
+                # Write once to a temp file, then swap it in so a crash
+                # mid-write never leaves a torn checkpoint behind
+                tmp_path = path + ".tmp"
+                with open(tmp_path, "wb") as f:
+                    f.write(payload)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, path)
+                self.logger.info("Checkpoint saved to %s", path)
 
-        except Exception as e:
-            self.logger.error(f"Failed to save checkpoint: {e}")
+            except Exception as e:
+                # Forget the fingerprint so the next save retries the write
+                self._last_checkpoint = None
+                self.logger.error(f"Failed to save checkpoint: {e}")
 
     def load_checkpoint(self):
         """Restores state from a JSON file if available."""
-        path = f"checkpoints/{self.name.lower()}_checkpoint.json"
+        path = self._checkpoint_path
         if not os.path.exists(path):
             return
 
         try:
-            with open(path, "r") as f:
-                data = json.load(f)
+            with open(path, "rb") as f:
+                data = loads_json(f.read())
 
             self.logger.info(
                 f"Loading checkpoint from {path} (Timestamp: {data.get('timestamp')})"
@@ -175,6 +300,7 @@ class BaseAgent(ABC):
                 if saved_state_name in ["RUNNING", "IDLE", "PAUSED"]:
                     try:
                         self.state = AgentState[saved_state_name]
+                        self._sync_resume_event()
                         self.logger.info(f"Restored state to {self.state.name}")
                     except KeyError:
                         self.logger.warning(f"Unknown state in checkpoint: {saved_state_name}")
@@ -202,14 +328,17 @@ class BaseAgent(ABC):
                 if self.state == AgentState.RUNNING:
                     self.perceive()
                     self.decide()
-                    self.act()
-                elif self.state == AgentState.PAUSED:
-                    time.sleep(0.1)  # Sleep to prevent busy waiting
-                elif self.state == AgentState.IDLE:
-                    time.sleep(0.1)
+                    if self.act():
+                        # act() reported progress: tick again without waiting
+                        self._wake.clear()
+                        continue
+                    timeout = self._tick_interval
+                else:
+                    # IDLE/PAUSED: nothing to do until a transition wakes us
+                    timeout = 1.0
 
-                # Small delay to prevent CPU hogging
-                time.sleep(0.05)
+                self._wake.wait(timeout)
+                self._wake.clear()
 
         except Exception as e:
             self.transition_state(AgentState.ERROR, f"Crash in run loop: {str(e)}")
@@ -228,7 +357,13 @@ class BaseAgent(ABC):
 
     @abstractmethod
     def act(self):
-        """Execute actions based on decisions."""
+        """
+        Execute actions based on decisions.
+
+        Returns:
+            bool: Truthy if work was done and the loop should tick again
+                immediately; falsy (the default) waits for the next tick.
+        """
         pass
 
     def handle_error(self, error: Exception):
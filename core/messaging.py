@@ -1,14 +1,82 @@
 import json
 import time
 import logging
+import queue
 import threading
+from collections import deque
 from concurrent.futures import ThreadPoolExecutor
-from datetime import datetime, timezone
-from dataclasses import dataclass, field, asdict
-from typing import Any, Dict, List, Callable
+from datetime import datetime
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, Callable, Iterable, Optional, Tuple
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; the stdlib json module is the fallback
+    orjson = None
 
-@dataclass
+# Published messages the bus keeps for inspection; older ones are dropped
+HISTORY_LIMIT = 10_000
+
+# Delivery attempts per subscriber, the pause between them, and the run time
+# after which a callback is reported as slow
+DISPATCH_MAX_ATTEMPTS = 3
+DISPATCH_RETRY_BACKOFF = 0.1
+DISPATCH_SOFT_TIMEOUT = 5
+
+# Worker threads in each agent's own delivery pool; more than one so that a
+# stop/cancel command can run while a long handler (e.g. a scan) is busy
+AGENT_DISPATCH_WORKERS = 4
+
+
+def dumps_json(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serializes obj to UTF-8 JSON bytes, with orjson when it is installed.
+
+    Args:
+        obj: The JSON-compatible value to serialize.
+        indent (bool): Pretty-print with two-space indentation.
+
+    Returns:
+        bytes: The encoded document.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None).encode("utf-8")
+
+
+def loads_json(data) -> Any:
+    """Parses a JSON document from str or bytes, with orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# (whole second, its "YYYY-MM-DDTHH:MM:SS" text) for the last timestamp made;
+# one tuple so concurrent publishers never see a mismatched pair
+_timestamp_second = (0, "")
+
+
+def utc_timestamp() -> str:
+    """
+    Returns the current UTC time in ISO 8601 form, as datetime.isoformat does.
+
+    The date/time prefix is only reformatted when the second changes.
+
+    Returns:
+        str: e.g. "2024-01-01T12:00:00.123456+00:00".
+    """
+    global _timestamp_second
+    sec, us = divmod(time.time_ns() // 1000, 1_000_000)
+    cached_sec, prefix = _timestamp_second
+    if sec != cached_sec:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec))
+        _timestamp_second = (sec, prefix)
+    return f"{prefix}.{us:06d}+00:00"
+
+
+# Slotted: the bus keeps up to HISTORY_LIMIT of these alive, and a per-instance
+# __dict__ would roughly double what each one costs
+@dataclass(slots=True)
 class Message:
     """
     Represents a standard message in the multi-agent system.
@@ -27,65 +95,84 @@ class Message:
     source: str
     target: str
     payload: Dict[str, Any]
-    timestamp: str = field(
-        default_factory=lambda: datetime.now(timezone.utc).isoformat()
-    )
+    timestamp: str = field(default_factory=utc_timestamp)
     status: str = "new"
     context: Dict[str, Any] = field(default_factory=dict)
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns the fields as a new dict, sharing payload and context."""
+        # A shallow dict of the fields: asdict() would deep-copy payload and
+        # context only for the copy to be thrown away after encoding
+        return {
+            "type": self.type,
+            "source": self.source,
+            "target": self.target,
+            "payload": self.payload,
+            "timestamp": self.timestamp,
+            "status": self.status,
+            "context": self.context,
+        }
+
     def to_json(self) -> str:
         """Converts the message to a JSON string."""
-        return json.dumps(asdict(self))
+        return dumps_json(self.to_dict()).decode("utf-8")
 
     @classmethod
     def from_json(cls, json_str: str) -> "Message":
         """Creates a Message instance from a JSON string."""
-        data = json.loads(json_str)
+        data = loads_json(json_str)
         return cls(**data)
 
 
+# (field, accepted type, description) for MessageValidator's type checks,
+# in the order they are reported
+_FIELD_TYPES = (
+    ("type", str, "a string"),
+    ("source", str, "a string"),
+    ("target", str, "a string"),
+    ("payload", dict, "a dictionary"),
+    ("timestamp", str, "a string"),
+)
+
+
 class MessageValidator:
     """Helper class for validating message structure."""
 
-    REQUIRED_FIELDS = {
-        "type",
-        "source",
-        "target",
-        "timestamp",
-        "payload",
-        "status",
-        "context",
-    }
+    REQUIRED_FIELDS = frozenset(
+        {
+            "type",
+            "source",
+            "target",
+            "timestamp",
+            "payload",
+            "status",
+            "context",
+        }
+    )
 
     @staticmethod
     def validate(message_data: Dict[str, Any]) -> bool:
         """
         Validates that the message dictionary contains all required fields and correct types.
         """
-        # Check presence
-        missing_fields = MessageValidator.REQUIRED_FIELDS - message_data.keys()
-        if missing_fields:
+        # Check presence; the set difference is only built to report a failure
+        if not message_data.keys() >= MessageValidator.REQUIRED_FIELDS:
+            missing_fields = MessageValidator.REQUIRED_FIELDS - message_data.keys()
             raise ValueError(f"Message missing required fields: {missing_fields}")
 
         # Strict Type Validation
-        if not isinstance(message_data.get("type"), str):
-            raise ValueError("Field 'type' must be a string")
-        if not isinstance(message_data.get("source"), str):
-            raise ValueError("Field 'source' must be a string")
-        if not isinstance(message_data.get("target"), str):
-            raise ValueError("Field 'target' must be a string")
-        if not isinstance(message_data.get("payload"), dict):
-            raise ValueError("Field 'payload' must be a dictionary")
+        for name, expected, label in _FIELD_TYPES:
+            if not isinstance(message_data[name], expected):
+                raise ValueError(f"Field '{name}' must be {label}")
 
         # Timestamp Validation (ISO 8601 UTC)
-        ts = message_data.get("timestamp")
-        if not isinstance(ts, str):
-            raise ValueError("Field 'timestamp' must be a string")
+        ts = message_data["timestamp"]
         try:
             # Validate it's parseable
             # Handle 'Z' for UTC which fromisoformat doesn't support < 3.11
-            ts_clean = ts.replace("Z", "+00:00")
-            dt = datetime.fromisoformat(ts_clean)
+            if ts.endswith("Z"):
+                ts = ts[:-1] + "+00:00"
+            dt = datetime.fromisoformat(ts)
             # strictly enforce UTC info exists
             if dt.tzinfo is None:
                 raise ValueError("Timestamp must include timezone information (UTC)")
@@ -100,114 +187,283 @@ class MessageValidator:
         Validates a JSON string against the schema.
         """
         try:
-            data = json.loads(json_str)
+            data = loads_json(json_str)
             return MessageValidator.validate(data)
-        except json.JSONDecodeError:
+        except json.JSONDecodeError:  # orjson's decode error subclasses it
             raise ValueError("Invalid JSON string")
 
 
+# (excluded source or None, callback wrapper) as stored per message type
+_Subscription = Tuple[Optional[str], Callable[[Message], None]]
+
+
 class MessageBus:
     """
     A simple Publish-Subscribe message bus for agent communication.
     """
 
     def __init__(self):
-        self._subscribers: Dict[str, List[Callable[[Message], None]]] = {}
-        self._history: List[Message] = []
+        # Copy-on-write: subscribe() swaps in new tuples (and a new prefix
+        # dict) under _subscribe_lock, so publish() reads them without locking
+        self._subscribers: Dict[str, Tuple[_Subscription, ...]] = {}
+        # Prefix subscriptions registered as "some.prefix.*" -> keyed by "some.prefix."
+        self._prefix_subscribers: Dict[str, Tuple[_Subscription, ...]] = {}
+        self._subscribe_lock = threading.Lock()
+        self._history: Deque[Message] = deque(maxlen=HISTORY_LIMIT)
         self.logger = logging.getLogger("MessageBus")
+        # Callbacks of plain functions share this pool; each agent gets its
+        # own, so one agent's slow handlers cannot starve another's
         self._executor = ThreadPoolExecutor(max_workers=10)
+        self._agent_executors: Dict[str, ThreadPoolExecutor] = {}
+        self._wrapper_executors: Dict[Callable, ThreadPoolExecutor] = {}
+
+        # publish() only enqueues; this thread fans messages out to the pool
+        self._outbox: queue.SimpleQueue = queue.SimpleQueue()
+        self._fan_out_thread = threading.Thread(
+            target=self._fan_out_loop, name="MessageBus-dispatch", daemon=True
+        )
+        self._fan_out_thread.start()
+
+        # Failed deliveries wait out their backoff here instead of in a worker;
+        # (message, error) pairs that used up every attempt end in _dead_letters
+        self._retries: queue.SimpleQueue = queue.SimpleQueue()
+        self._dead_letters: Deque[Tuple[Message, Exception]] = deque(maxlen=HISTORY_LIMIT)
+        self._retry_thread = threading.Thread(
+            target=self._retry_loop, name="MessageBus-retry", daemon=True
+        )
+        self._retry_thread.start()
+        self._closed = False
+
+    def shutdown(self, timeout: float = 1.0):
+        """
+        Stops the dispatcher and retry threads and the delivery pools.
+
+        Messages already handed to the dispatcher are still fanned out;
+        anything published afterwards is only recorded in the history.
+        Deliveries that are running finish, but queued ones are dropped.
+        Calling it again does nothing.
 
-    def subscribe(self, message_type: str, callback: Callable[[Message], None]):
+        Args:
+            timeout (float): Seconds to wait for each bus thread to exit.
+        """
+        with self._subscribe_lock:
+            if self._closed:
+                return
+            self._closed = True
+            executors = [self._executor, *self._agent_executors.values()]
+
+        self._outbox.put_nowait(None)
+        self._fan_out_thread.join(timeout)
+        self._retries.put(None)
+        self._retry_thread.join(timeout)
+        for executor in executors:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def subscribe(
+        self,
+        message_type: str,
+        callback: Callable[[Message], None],
+        exclude_source: Optional[str] = None,
+    ):
         """
         Subscribes a callback function to a specific message type.
 
+        A type ending in ".*" (e.g. "control.builderbot.*") subscribes to every
+        message type starting with that prefix.
+
         Args:
             message_type (str): The type of message to listen for.
             callback (Callable): The function to call when a message is received.
+            exclude_source (str): Optional sender name whose messages this
+                subscription never receives, e.g. the subscriber's own.
+        """
+        self.subscribe_many([(message_type, callback)], exclude_source)
+
+    def subscribe_many(
+        self,
+        pairs: Iterable[Tuple[str, Callable[[Message], None]]],
+        exclude_source: Optional[str] = None,
+    ):
         """
-        if message_type not in self._subscribers:
-            self._subscribers[message_type] = []
+        Subscribes several (message type, callback) pairs at once.
+
+        Behaves like one subscribe() call per pair, but registers them all
+        under a single acquisition of the registry lock.
+
+        Args:
+            pairs (Iterable): (message_type, callback) tuples, as for subscribe().
+            exclude_source (str): Optional sender name excluded for every pair.
+        """
+        wrapped = [
+            (message_type, ((exclude_source, self._wrap(callback)),))
+            for message_type, callback in pairs
+        ]
+        with self._subscribe_lock:
+            prefixes = None
+            for message_type, entry in wrapped:
+                if message_type.endswith(".*"):
+                    if prefixes is None:
+                        prefixes = dict(self._prefix_subscribers)
+                    key = message_type[:-1]
+                    prefixes[key] = prefixes.get(key, ()) + entry
+                else:
+                    subscribers = self._subscribers.get(message_type, ())
+                    self._subscribers[message_type] = subscribers + entry
+            if prefixes is not None:
+                self._prefix_subscribers = prefixes
+        for message_type, _ in wrapped:
+            self.logger.debug("Subscribed to %s", message_type)
+
+    def _wrap(self, callback: Callable[[Message], None]) -> Callable[[Message], None]:
+        """Builds the receiver-side wrapper the bus stores for a callback."""
+        # Agents expose wake() so a delivery ends their idle wait early
+        wake = getattr(getattr(callback, "__self__", None), "wake", None)
+
+        # Identify the subscriber once for clearer logs
+        subscriber_name = "Unknown"
+        if hasattr(callback, "__self__"):
+            subscriber_name = callback.__self__.__class__.__name__
+        elif hasattr(callback, "__name__"):
+            subscriber_name = callback.__name__
+
+        logger = self.logger
 
         # Receiver-side logging wrapper
         def wrapper(msg: Message):
-            # Attempt to identify the subscriber for clearer logs
-            subscriber_name = "Unknown"
-            if hasattr(callback, "__self__"):
-                subscriber_name = callback.__self__.__class__.__name__
-            elif hasattr(callback, "__name__"):
-                subscriber_name = callback.__name__
-
-            self.logger.debug(
-                f"[{subscriber_name}] Received {msg.type} from {msg.source}"
-            )
+            logger.debug("[%s] Received %s from %s", subscriber_name, msg.type, msg.source)
             callback(msg)
+            if wake is not None:
+                wake()
 
-        self._subscribers[message_type].append(wrapper)
-        self.logger.debug(f"Subscribed to {message_type}")
+        owner_name = getattr(getattr(callback, "__self__", None), "name", None)
+        if isinstance(owner_name, str):
+            with self._subscribe_lock:
+                executor = self._agent_executors.get(owner_name)
+                if executor is None:
+                    executor = ThreadPoolExecutor(
+                        max_workers=AGENT_DISPATCH_WORKERS,
+                        thread_name_prefix=f"bus-{owner_name}",
+                    )
+                    self._agent_executors[owner_name] = executor
+                self._wrapper_executors[wrapper] = executor
+
+        return wrapper
 
     def publish(self, message: Message):
         """
         Publishes a message to all subscribers of its type asynchronously.
 
+        Subscribers are resolved here, so only those registered at publish
+        time receive the message, minus any excluding its source. Validation,
+        logging and executor submission happen on the bus's dispatcher
+        thread, and the caller returns after enqueueing.
+
         Args:
             message (Message): The message to publish.
         """
         self._history.append(message)
-        self.logger.info(f"Message published: {message.type} from {message.source}")
+        if self._closed:
+            # Nothing drains the outbox after shutdown(); history only
+            return
 
-        if message.type in self._subscribers:
-            for callback in self._subscribers[message.type]:
-                self._executor.submit(self._dispatch, callback, message)
+        source = message.source
+        callbacks = [
+            callback
+            for excluded, callback in self._subscribers.get(message.type, ())
+            if excluded != source
+        ]
+        for prefix, prefix_callbacks in self._prefix_subscribers.items():
+            if message.type.startswith(prefix):
+                callbacks.extend(
+                    callback
+                    for excluded, callback in prefix_callbacks
+                    if excluded != source
+                )
 
-    def _dispatch(self, callback: Callable[[Message], None], message: Message):
+        self._outbox.put_nowait((message, callbacks))
+
+    def _fan_out_loop(self):
+        """Dispatcher thread: hands each queued message to its subscribers."""
+        while True:
+            item = self._outbox.get()
+            if item is None:  # shutdown() sentinel
+                return
+            message, callbacks = item
+            # Validated once here rather than once per subscriber in _dispatch
+            try:
+                MessageValidator.validate(message.to_dict())
+            except ValueError as e:
+                self.logger.error(f"Message validation failed: {e}. Dropping message.")
+                continue
+
+            try:
+                self.logger.info(
+                    "Message published: %s from %s", message.type, message.source
+                )
+                # One task per subscriber, not one per message: handlers such
+                # as ExplorerBot.on_start_scan run for a whole scan, and must
+                # not hold back the other subscribers of the same message
+                for callback in callbacks:
+                    self._submit(callback, message)
+            except Exception as e:
+                self.logger.error(f"Failed to dispatch {message.type}: {e}")
+
+    def _submit(
+        self, callback: Callable[[Message], None], message: Message, attempt: int = 0
+    ):
+        """Schedules one delivery on the pool of the callback's owning agent."""
+        executor = self._wrapper_executors.get(callback, self._executor)
+        executor.submit(self._dispatch, callback, message, attempt)
+
+    def _dispatch(
+        self, callback: Callable[[Message], None], message: Message, attempt: int = 0
+    ):
         """
         Internal worker to execute callbacks with retry and timeout logic.
+
+        A failed callback is not retried in place: it is handed to the retry
+        thread, so the pool worker is free again as soon as the call returns.
+
+        Args:
+            callback (Callable): The subscriber wrapper to run.
+            message (Message): The message being delivered.
+            attempt (int): Zero-based attempt number for this delivery.
         """
-        # Validate message before processing
+        # Timeouts are soft: Python threads cannot be killed, so a slow
+        # callback is measured and reported rather than interrupted
         try:
-            MessageValidator.validate(message.__dict__)
-        except ValueError as e:
-            self.logger.error(f"Message validation failed: {e}. Dropping message.")
-            return
+            start_time = time.time()
+            callback(message)
+            elapsed = time.time() - start_time
 
-        # Reliability Mechanism: Retry Loop with Timeouts
-        max_retries = 3
-        timeout_seconds = 5
-        
-        for attempt in range(max_retries):
+            if elapsed > DISPATCH_SOFT_TIMEOUT:
+                self.logger.warning(f"Callback for {message.type} took {elapsed:.2f}s, exceeding soft timeout of {DISPATCH_SOFT_TIMEOUT}s.")
+        except Exception as e:
+            if attempt < DISPATCH_MAX_ATTEMPTS - 1:
+                self.logger.warning(
+                    f"Retry {attempt+1}/{DISPATCH_MAX_ATTEMPTS} for {message.type}: {e}"
+                )
+                self._retries.put(
+                    (time.monotonic() + DISPATCH_RETRY_BACKOFF, callback, message, attempt + 1)
+                )
+            else:
+                self.logger.error(
+                    f"Error processing message {message.type} after {DISPATCH_MAX_ATTEMPTS} attempts: {e}"
+                )
+                self._dead_letters.append((message, e))
+
+    def _retry_loop(self):
+        """Retry thread: re-submits failed deliveries once their backoff ends."""
+        while True:
+            item = self._retries.get()
+            if item is None:  # shutdown() sentinel
+                return
+            due, callback, message, attempt = item
+            # Every entry has the same backoff, so the queue is ordered by due time
+            delay = due - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
             try:
-                # Use a separate thread so we can enforce timeout on the callback execution
-                # Note: This increases thread usage but ensures a hanging callback doesn't block the worker indefinitely.
-                # In a pure async system, we'd use asyncio.wait_for. With Threads, it's trickier.
-                # A simpler approach for this architecture is to trust the callback but catch errors.
-                # However, the spec requires "timeout mechanism".
-                
-                # We will wrap the callback execution in a Future-like wait if feasible, 
-                # or just measure time and log warnings if it's slow, but 'timeout' implies interrupting.
-                # Given Python threads are hard to kill, we might just fail the dispatch if it takes too long conceptually?
-                # Actually, standard practice in ThreadPoolExecutor is that the *dispatch* is already async.
-                # But if we want to timeout the *execution* of a single callback, we need another layer or 
-                # we just accept that we can't kill it but we stop waiting for it.
-                
-                # Let's try running the callback directly and assume well-behaved agents, 
-                # but if we really strictly need timeouts, we'd spawn a daemon thread.
-                # For this implementation compliance:
-                
-                start_time = time.time()
-                callback(message)
-                elapsed = time.time() - start_time
-                
-                if elapsed > timeout_seconds:
-                    self.logger.warning(f"Callback for {message.type} took {elapsed:.2f}s, exceeding soft timeout of {timeout_seconds}s.")
-                
-                break  # Success
+                self._submit(callback, message, attempt)
             except Exception as e:
-                if attempt < max_retries - 1:
-                    self.logger.warning(
-                        f"Retry {attempt+1}/{max_retries} for {message.type}: {e}"
-                    )
-                    time.sleep(0.1)  # Brief backoff
-                else:
-                    self.logger.error(
-                        f"Error processing message {message.type} after {max_retries} attempts: {e}"
-                    )
+                self.logger.error(f"Failed to retry {message.type}: {e}")
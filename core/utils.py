@@ -1,11 +1,16 @@
 import importlib
 import pkgutil
-import inspect
 import time
 import functools
 import logging
-from typing import List, Type, Any
+import threading
+import weakref
+from itertools import repeat
+from typing import Any, Dict, Iterable, List, Tuple, Type
 import mcpi.block as block
+from mcpi.connection import Connection, RequestError
+from mcpi.minecraft import intFloor
+from mcpi.util import flatten_parameters_to_bytestring
 
 # Simple mapping for common blocks
 BLOCK_ID_MAP = {
@@ -46,29 +51,177 @@ def get_block_name(block_id: int) -> str:
     return BLOCK_ID_MAP.get(block_id, "UNKNOWN")
 
 
+def get_block_names(block_ids: Iterable[int]) -> List[str]:
+    """
+    Returns the names of many blocks at once, e.g. a whole getBlocks cuboid.
+
+    Args:
+        block_ids: Block IDs in any order.
+
+    Returns:
+        The matching names in the same order, "UNKNOWN" for unmapped IDs.
+    """
+    # map() with a bound dict.get keeps the per-ID loop in C
+    return list(map(BLOCK_ID_MAP.get, block_ids, repeat("UNKNOWN")))
+
+
+# mcpi connection -> lock held by any caller that writes to it while another
+# thread may be waiting on a reply (mcpi's _send drains unread replies first)
+_CONNECTION_LOCKS = weakref.WeakKeyDictionary()
+_CONNECTION_LOCKS_GUARD = threading.Lock()
+
+
+def connection_lock(conn: Connection) -> threading.RLock:
+    """
+    Returns the lock that serializes requests on one mcpi connection.
+
+    Args:
+        conn: The Minecraft connection (``mc.conn``).
+
+    Returns:
+        The same re-entrant lock for every call with this connection.
+    """
+    with _CONNECTION_LOCKS_GUARD:
+        lock = _CONNECTION_LOCKS.get(conn)
+        if lock is None:
+            lock = _CONNECTION_LOCKS[conn] = threading.RLock()
+        return lock
+
+
+def pipeline_requests(
+    conn: Connection, command: bytes, arg_tuples: Iterable[Tuple[Any, ...]]
+) -> List[str]:
+    """
+    Sends one mcpi request per argument tuple in a single socket write, then
+    reads the replies in order. This trades N round-trips for one.
+
+    Only for commands that answer with exactly one line (getBlock, getHeight);
+    fire-and-forget commands like setBlock would leave the reads hanging.
+
+    The batch holds connection_lock(conn) from the write to the last reply, so
+    other threads using the connection must take it too.
+
+    Args:
+        conn: The Minecraft connection (``mc.conn``).
+        command: The protocol command, e.g. b"world.getHeight".
+        arg_tuples: One tuple of call arguments per request.
+
+    Returns:
+        The raw reply line for each request, in request order.
+    """
+    arg_tuples = list(arg_tuples)
+    if not arg_tuples:
+        return []
+
+    frames = b"".join(
+        command + b"(" + flatten_parameters_to_bytestring(args) + b")\n"
+        for args in arg_tuples
+    )
+    with connection_lock(conn):
+        conn._send(frames)
+
+        # One reader for all replies; mcpi's receive() builds a new buffered
+        # reader per call, which would swallow the lines queued behind it.
+        reader = conn.socket.makefile("r")
+        try:
+            replies = [reader.readline().rstrip("\n") for _ in arg_tuples]
+        finally:
+            reader.close()
+
+    if Connection.RequestFailed in replies:
+        raise RequestError(f"{command.decode()} failed in pipelined batch")
+    return replies
+
+
+class BatchedMinecraft:
+    """
+    Minecraft facade that buffers setBlock/setBlocks (and chat posts queued
+    with queue_chat) and writes them to the socket in one send on flush().
+    Every other attribute passes through to the wrapped connection unchanged.
+
+    Buffered writes are not ordered before reads: flush before reading back
+    a block the current batch has set.
+    """
+
+    def __init__(self, mc, max_pending: int = 512):
+        """
+        Args:
+            mc: The mcpi Minecraft instance to wrap.
+            max_pending: Writes buffered before an automatic flush.
+        """
+        self._mc = mc
+        self._pending: List[bytes] = []
+        self._max_pending = max_pending
+
+    def __getattr__(self, name):
+        return getattr(self._mc, name)
+
+    def setBlock(self, *args):
+        """Queues a setBlock (x,y,z,id,[data])."""
+        self._queue(b"world.setBlock", intFloor(args))
+
+    def setBlocks(self, *args):
+        """Queues a setBlocks (x0,y0,z0,x1,y1,z1,id,[data])."""
+        self._queue(b"world.setBlocks", intFloor(args))
+
+    def queue_chat(self, msg: str):
+        """Queues a chat.post to go out with the next flush."""
+        self._queue(b"chat.post", (msg,))
+
+    def _queue(self, command: bytes, args: Iterable[Any]):
+        self._pending.append(
+            command + b"(" + flatten_parameters_to_bytestring(args) + b")\n"
+        )
+        if len(self._pending) >= self._max_pending:
+            self.flush()
+
+    def flush(self) -> int:
+        """
+        Writes all buffered block changes in a single socket send.
+
+        Returns:
+            The number of requests written.
+        """
+        pending, self._pending = self._pending, []
+        if pending:
+            # None of the buffered commands get a reply, so nothing is read back
+            self._mc.conn._send(b"".join(pending))
+        return len(pending)
+
+
 def log_execution(func):
     """Decorator to log the execution time of a method."""
+    logger = logging.getLogger(func.__module__)
 
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        logger = logging.getLogger(func.__module__)
-        start_time = time.time()
+        # Only time the call when the debug line would actually be emitted
+        timed = logger.isEnabledFor(logging.DEBUG)
+        start_time = time.perf_counter() if timed else 0.0
         try:
             result = func(*args, **kwargs)
-            duration = time.time() - start_time
-            logger.debug(f"{func.__name__} executed in {duration:.4f}s")
-            return result
         except Exception as e:
             logger.error(f"Error in {func.__name__}: {e}")
             raise e
+        if timed:
+            duration = time.perf_counter() - start_time
+            logger.debug(f"{func.__name__} executed in {duration:.4f}s")
+        return result
 
     return wrapper
 
 
+# (package name, base class) -> classes found by a successful load_classes scan
+_CLASS_CACHE: Dict[Tuple[str, Type[Any]], Tuple[Type[Any], ...]] = {}
+
+
 def load_classes(package_name: str, base_class: Type[Any]) -> List[Type[Any]]:
     """
     Dynamically loads classes from a package that inherit from a base class.
 
+    The package walk runs once per (package, base class) until it succeeds;
+    later calls return a fresh list of the same classes.
+
     Args:
         package_name: The name of the package to scan (e.g., 'agents').
         base_class: The class that discovered classes must inherit from.
@@ -76,7 +229,13 @@ def load_classes(package_name: str, base_class: Type[Any]) -> List[Type[Any]]:
     Returns:
         A list of discovered classes.
     """
+    key = (package_name, base_class)
+    cached = _CLASS_CACHE.get(key)
+    if cached is not None:
+        return list(cached)
+
     classes = []
+    failed = False
     try:
         package = importlib.import_module(package_name)
     except ImportError as e:
@@ -91,14 +250,21 @@ def load_classes(package_name: str, base_class: Type[Any]) -> List[Type[Any]]:
         for _, name, _ in pkgutil.iter_modules(path, prefix):
             try:
                 module = importlib.import_module(name)
-                for name, obj in inspect.getmembers(module):
+                # Only classes defined in the module itself; imported names
+                # would otherwise be collected once per importing module
+                for obj in vars(module).values():
                     if (
-                        inspect.isclass(obj)
+                        isinstance(obj, type)
+                        and obj.__module__ == name
                         and issubclass(obj, base_class)
                         and obj is not base_class
                     ):
                         classes.append(obj)
             except Exception as e:
                 print(f"Error loading module {name}: {e}")
+                failed = True
 
+    # A module that failed to import is retried on the next call
+    if not failed:
+        _CLASS_CACHE[key] = tuple(classes)
     return classes
@@ -1,25 +1,68 @@
+import argparse
+import queue
 import time
 import logging
-import threading
+from logging.handlers import QueueHandler, QueueListener
+from concurrent.futures import ThreadPoolExecutor
 from core.messaging import MessageBus
 from core.base_agent import BaseAgent
 from core.utils import load_classes
 
+try:
+    import gil_load
+except ImportError:  # Optional profiler, only needed for --gil-report
+    gil_load = None
 
-def main():
+
+def _log_agent_exit(logger, name, future):
+    """Reports an agent whose start() raised; the pool would otherwise hide it."""
+    if not future.cancelled() and future.exception() is not None:
+        logger.error(f"Agent {name} exited with an error: {future.exception()}")
+
+
+def main(argv=None):
     """
     Main entry point for the Minecraft Multi-Agent System.
 
     Initializes the logging system, creates the central message bus,
     dynamically discovers and loads agent classes, and starts each agent
-    in its own thread.
+    on its own worker of a shared thread pool.
+
+    Args:
+        argv (list): Command line arguments; defaults to sys.argv[1:].
     """
+    parser = argparse.ArgumentParser(description="Minecraft Multi-Agent System")
+    parser.add_argument(
+        "--gil-report",
+        action="store_true",
+        help="sample GIL contention with gil_load and log a summary on shutdown",
+    )
+    args = parser.parse_args(argv)
+
     logging.basicConfig(
         level=logging.INFO,
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
     )
+    # Agent threads only enqueue log records; one listener thread formats and
+    # writes them, so threads never queue up on the stream handler's lock
+    root = logging.getLogger()
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *root.handlers, respect_handler_level=True)
+    root.handlers = [QueueHandler(log_queue)]
+    listener.start()
+
     logger = logging.getLogger("Main")
 
+    gil_report = False
+    if args.gil_report:
+        if gil_load is None:
+            logger.warning("--gil-report needs the gil_load package; not profiling.")
+        else:
+            # Must run before the agent threads exist so they are all sampled
+            gil_load.init()
+            gil_load.start(av_sample_interval=0.1)
+            gil_report = True
+
     logger.info("Initializing Minecraft Multi-Agent System...")
 
     bus = MessageBus()
@@ -31,6 +74,12 @@ def main():
     if not agent_classes:
         logger.warning("No agents found in 'agents' directory.")
 
+    # One worker per agent: each start() runs that agent's loop until it stops.
+    # Pool workers are joined on shutdown, so loops get to exit cleanly.
+    executor = ThreadPoolExecutor(
+        max_workers=max(1, len(agent_classes)), thread_name_prefix="agent"
+    )
+
     for agent_cls in agent_classes:
         try:
             # Instantiate agent with the bus
@@ -38,8 +87,10 @@ def main():
             agents.append(agent)
             logger.info(f"Loaded agent: {agent.name}")
 
-            t = threading.Thread(target=agent.start, daemon=True)
-            t.start()
+            future = executor.submit(agent.start)
+            future.add_done_callback(
+                lambda f, name=agent.name: _log_agent_exit(logger, name, f)
+            )
 
         except Exception as e:
             logger.error(f"Failed to load/start agent {agent_cls.__name__}: {e}")
@@ -52,6 +103,12 @@ def main():
         logger.info("Shutting down...")
         for agent in agents:
             agent.stop()
+        executor.shutdown(wait=True, cancel_futures=True)
+        bus.shutdown()
+        if gil_report:
+            gil_load.stop()
+            logger.info(f"GIL contention: {gil_load.format(gil_load.get())}")
+        listener.stop()
 
 
 if __name__ == "__main__":
@@ -10,6 +10,14 @@ class MiningStrategy(ABC):
         """
         pass
 
+    def supported_materials(self):
+        """
+        Materials this strategy is the preferred choice for.
+        Used to pick a strategy per request in "auto" mode.
+        :return: Iterable of material names; empty for general-purpose strategies.
+        """
+        return ()
+
 
 class BuildingStrategy(ABC):
     @abstractmethod
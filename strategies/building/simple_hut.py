@@ -4,10 +4,27 @@ from core.messaging import Message
 import mcpi.block as block
 import time
 
+# (dx, dz, block id) for one 5x5 wall ring: only the edges of the square
+WALL_CELLS = tuple(
+    (dx, dz, block.WOOD_PLANKS.id)
+    for dx in range(5)
+    for dz in range(5)
+    if dx == 0 or dx == 4 or dz == 0 or dz == 4
+)
+# The same ring with the front door (dx=2, dz=0) carved out as air
+DOOR_LAYER_CELLS = tuple(
+    (dx, dz, block.AIR.id if (dx, dz) == (2, 0) else block_id)
+    for dx, dz, block_id in WALL_CELLS
+)
+
 
 class SimpleHutStrategy(BuildingStrategy):
     """A strategy for building a simple small hut."""
 
+    # 5x5 floor = 25 blocks
+    # Walls: 5*4 perimeter * 3 height = 60 blocks - door (2) = 58
+    BOM = {"COBBLESTONE": 25, "WOOD_PLANKS": 58}
+
     def _check_pause(self, agent):
         """Helper to pause execution if agent is paused."""
         while agent.state == AgentState.PAUSED:
@@ -17,9 +34,7 @@ class SimpleHutStrategy(BuildingStrategy):
 
     def get_bom(self):
         """Returns the Bill of Materials needed for the hut."""
-        # 5x5 floor = 25 blocks
-        # Walls: 5*4 perimeter * 3 height = 60 blocks - door (2) = 58
-        return {"COBBLESTONE": 25, "WOOD_PLANKS": 58}
+        return dict(self.BOM)
 
     def execute(self, agent, location):
         """Builds the hut at the specified location."""
@@ -35,6 +50,8 @@ class SimpleHutStrategy(BuildingStrategy):
         # Let's build ON TOP for safety.
 
         agent.logger.info(f"Building Simple Hut at {x}, {y}, {z}")
+        # Optional pause per layer, for watching the build (see BuilderBot)
+        delay = getattr(agent, "build_delay", 0.0)
 
         # Floor (5x5) centered on x,z
         # Let's say x,z is the center
@@ -42,17 +59,15 @@ class SimpleHutStrategy(BuildingStrategy):
         start_z = z - 2
         floor_y = y
 
-        mc = agent.mc
-
         # Build Floor
         agent.logger.info("Building floor...")
-        for dx in range(5):
-            for dz in range(5):
-                # Use agent.place_block for logging compliance
-                agent.place_block(
-                    start_x + dx, floor_y, start_z + dz, block.COBBLESTONE.id
-                )
-                time.sleep(0.1)  # Cool effect
+        # place_blocks_bulk logs every block for compliance, then sends the
+        # layer as cuboid setBlocks calls
+        agent.place_blocks_bulk(
+            (start_x + dx, floor_y, start_z + dz, block.COBBLESTONE.id)
+            for dx in range(5)
+            for dz in range(5)
+        )
 
         # Build Walls
         agent.logger.info("Building walls...")
@@ -76,26 +91,15 @@ class SimpleHutStrategy(BuildingStrategy):
                     )
                     agent.bus.publish(msg)
 
-                for dx in range(5):
-                    for dz in range(5):
-                        # Only edges
-                        if dx == 0 or dx == 4 or dz == 0 or dz == 4:
-                            # Leave door gap at one side
-                            if dx == 2 and dz == 0 and dy < 3:  # Front door
-                                agent.place_block(
-                                    start_x + dx,
-                                    floor_y + dy,
-                                    start_z + dz,
-                                    block.AIR.id,
-                                )
-                            else:
-                                agent.place_block(
-                                    start_x + dx,
-                                    floor_y + dy,
-                                    start_z + dz,
-                                    block.WOOD_PLANKS.id,
-                                )
-                time.sleep(1.0)
+                wall_y = floor_y + dy
+                # Leave door gap at one side (the bottom two layers)
+                cells = DOOR_LAYER_CELLS if dy < 3 else WALL_CELLS
+                agent.place_blocks_bulk(
+                    (start_x + dx, wall_y, start_z + dz, block_id)
+                    for dx, dz, block_id in cells
+                )
+                if delay:
+                    time.sleep(delay)
 
             # Build Roof (Pyramid)
             agent.logger.info("Building roof...")
@@ -109,22 +113,19 @@ class SimpleHutStrategy(BuildingStrategy):
                 width = 5 - (i * 2)
                 current_y = roof_y + i
                 start_off = i
-                for r_dx in range(width):
-                    for r_dz in range(width):
-                        # Logging compliance
-                        agent.place_block(
-                            start_x + start_off + r_dx,
-                            current_y,
-                            start_z + start_off + r_dz,
-                            block.WOOD.id,
-                        )
-                        mc.setBlock(
-                            start_x + start_off + r_dx,
-                            current_y,
-                            start_z + start_off + r_dz,
-                            block.WOOD.id,
-                        )
-                time.sleep(1.0)
+                # One solid square: a single setBlocks once coalesced
+                agent.place_blocks_bulk(
+                    (
+                        start_x + start_off + r_dx,
+                        current_y,
+                        start_z + start_off + r_dz,
+                        block.WOOD.id,
+                    )
+                    for r_dx in range(width)
+                    for r_dz in range(width)
+                )
+                if delay:
+                    time.sleep(delay)
 
         except InterruptedError:
             agent.logger.info("Build interrupted.")
@@ -3,15 +3,22 @@ from core.fsm import AgentState
 import mcpi.block as block
 import time
 
+# (dx, dz) offsets of one 3x3 hollow ring around the tower's axis
+RING_CELLS = tuple(
+    (dx, dz) for dx in range(-1, 2) for dz in range(-1, 2) if dx or dz  # skip center
+)
+
 
 class StoneTowerStrategy(BuildingStrategy):
     """Builds a simple vertical stone tower."""
 
+    # 3x3 base, 10 high = 9*10 = 90 blocks (hollow? let's do solid for simplicity or hollow)
+    # Hollow: 8 blocks per ring * 10 rings = 80 blocks.
+    BOM = {"STONE": 80, "TORCH": 4}
+
     def get_bom(self):
         """Returns the Bill of Materials needed for the tower."""
-        # 3x3 base, 10 high = 9*10 = 90 blocks (hollow? let's do solid for simplicity or hollow)
-        # Hollow: 8 blocks per ring * 10 rings = 80 blocks.
-        return {"STONE": 80, "TORCH": 4}
+        return dict(self.BOM)
 
     def execute(self, agent, location):
         """Executes the building strategy at the given location."""
@@ -20,6 +27,8 @@ class StoneTowerStrategy(BuildingStrategy):
 
         x, z, y = location
         agent.logger.info(f"Building Stone Tower at {x}, {y}, {z}")
+        # Optional pause per layer, for watching the build (see BuilderBot)
+        delay = getattr(agent, "build_delay", 0.0)
 
         # Build 10 layers high
         for i in range(10):
@@ -30,15 +39,13 @@ class StoneTowerStrategy(BuildingStrategy):
                 return
 
             current_y = y + i
-            # 3x3 hollow square
-            for dx in range(-1, 2):
-                for dz in range(-1, 2):
-                    # skip center
-                    if dx == 0 and dz == 0:
-                        continue
-                    agent.place_block(x + dx, current_y, z + dz, block.STONE.id)
-
-            time.sleep(0.5)
+            # 3x3 hollow square, sent as one ring of setBlocks strips
+            agent.place_blocks_bulk(
+                (x + dx, current_y, z + dz, block.STONE.id) for dx, dz in RING_CELLS
+            )
+
+            if delay:
+                time.sleep(delay)
 
         # Add torches on top
         agent.place_block(x, y + 10, z, block.TORCH.id)
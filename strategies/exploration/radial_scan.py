@@ -1,4 +1,12 @@
+from itertools import repeat
+import time
+
 from strategies import ExplorationStrategy
+from core.utils import connection_lock, pipeline_requests
+
+# Seconds a sampled surface height is reused by later scans before it is
+# queried again (builds change the terrain they stand on)
+HEIGHT_CACHE_TTL = 10.0
 
 
 class RadialScan(ExplorationStrategy):
@@ -8,6 +16,10 @@ class RadialScan(ExplorationStrategy):
     This strategy finds flat spots where the terrain height is level with the agent's current position.
     """
 
+    def __init__(self):
+        # (x, z) -> (sampled_at, height) for the cells of the last scan
+        self._heights = {}
+
     def execute(self, agent):
         """
         Executes the radial scan.
@@ -26,7 +38,9 @@ class RadialScan(ExplorationStrategy):
         # Determine scan center
         center_pos = getattr(agent, "scan_target", None)
         if not center_pos:
-            center_pos = agent.mc.player.getTilePos()
+            # Other threads may be posting chat on this connection
+            with connection_lock(agent.mc.conn):
+                center_pos = agent.mc.player.getTilePos()
 
         # Determine scan range
         scan_range = getattr(agent, "scan_range", 10)
@@ -44,15 +58,43 @@ class RadialScan(ExplorationStrategy):
             for z in range(-scan_range, scan_range)
         ]
 
-        # Functional Programming: Use map() to transform coordinates to (x, z, height)
-        def get_terrain_data(c):
-            return (c[0], c[1], agent.mc.getHeight(c[0], c[1]))
+        # A spot is flat when its surface is within one block of the centre's
+        lowest, highest = pos.y - 1, pos.y + 1
+        conn = agent.mc.conn
+
+        # Cells the previous scan sampled recently are reused, so a rescan of
+        # an overlapping area only queries the strip it has not seen
+        now = time.monotonic()
+        cutoff = now - HEIGHT_CACHE_TTL
+        cached = self._heights
+        heights = {}
+
+        # A whole chunk's missing getHeight requests go out in one pipelined
+        # write; the flat spots are then picked out with map/filter
+        def get_flat_spots(chunk):
+            missing = []
+            for cell in chunk:
+                entry = cached.get(cell)
+                if entry is not None and entry[0] > cutoff:
+                    heights[cell] = entry
+                else:
+                    missing.append(cell)
+            if missing:
+                replies = pipeline_requests(conn, b"world.getHeight", missing)
+                heights.update(zip(missing, zip(repeat(now), map(int, replies))))
+
+            terrain = zip(chunk, map(lambda cell: heights[cell][1], chunk))
+            return [
+                (x, z, h)
+                for (x, z), h in filter(lambda p: lowest <= p[1] <= highest, terrain)
+            ]
 
         flat_spots = []
         batch_size = 20 # Small batches for responsiveness
+        # Shared by every partial update and the final result; read-only
+        center = {"x": pos.x, "y": pos.y, "z": pos.z}
         
         from core.messaging import Message
-        import time
 
         total_batches = len(coords) // batch_size + 1
         
@@ -60,13 +102,12 @@ class RadialScan(ExplorationStrategy):
             # Interruption Check
             if getattr(agent, "_cancel_scan", False):
                 agent.logger.info("Radial Scan cancelled by agent.")
+                self._heights = heights
                 return None
 
             chunk = coords[i : i + batch_size]
             
-            # Apply functional transformations on the chunk
-            chunk_data = list(map(get_terrain_data, chunk))
-            chunk_flat = list(filter(lambda d: abs(d[2] - pos.y) <= 1, chunk_data))
+            chunk_flat = get_flat_spots(chunk)
             flat_spots.extend(chunk_flat)
 
             # Periodic Update (every 5 batches ~100 blocks)
@@ -74,7 +115,7 @@ class RadialScan(ExplorationStrategy):
                 if agent.bus:
                      # Helper to publish partial
                      payload = {
-                        "center": {"x": pos.x, "y": pos.y, "z": pos.z},
+                        "center": center,
                         "flat_spots": chunk_flat, # Only new ones
                         "status": "partial",
                         "timestamp": time.time()
@@ -82,10 +123,13 @@ class RadialScan(ExplorationStrategy):
                      msg = Message(type="map.v1", source=agent.name, target="all", payload=payload)
                      agent.bus.publish(msg)
 
+        # Only this scan's cells are kept, which bounds the cache to one area
+        self._heights = heights
+
         agent.logger.info(f"Radial Scan complete. Found {len(flat_spots)} spots.")
 
         return {
-            "center": {"x": pos.x, "y": pos.y, "z": pos.z},
+            "center": center,
             "flat_spots": flat_spots, # Full list
             "status": "complete"
         }
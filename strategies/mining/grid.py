@@ -1,7 +1,6 @@
 from strategies import MiningStrategy
-from core.utils import get_block_name
+from core.utils import get_block_names
 from core.fsm import AgentState
-import time
 
 
 class GridSearch(MiningStrategy):
@@ -13,11 +12,14 @@ class GridSearch(MiningStrategy):
 
     def _check_pause(self, agent):
         """Helper to pause execution if agent is paused."""
-        while agent.state == AgentState.PAUSED:
-            time.sleep(1)
+        agent.wait_while_paused()
         if agent.state == AgentState.STOPPED:
             raise InterruptedError("Agent stopped")
 
+    def supported_materials(self):
+        # Shallow 3x3 dig: best for surface materials
+        return ("STONE", "COBBLESTONE", "DIRT", "GRASS", "SAND", "GRAVEL")
+
     def execute(self, agent, start_loc=None):
         """
         Executes the grid mining strategy.
@@ -40,13 +42,38 @@ class GridSearch(MiningStrategy):
             start_x, y, start_z = pos.x, pos.y, pos.z
 
         loot = {}
+        mc = agent.mc
 
         # 3x3 Grid (Radius 1), Depth 15
         radius = 1
         max_depth = 15
+        width = 2 * radius + 1
+        bottom_y = y - max_depth + 1
+
+        # One cuboid read for the whole dig. It comes back y-major (bottom
+        # layer first), then x, then z; mining only clears cells already read.
+        ids = list(
+            mc.getBlocks(
+                start_x - radius, bottom_y, start_z - radius,
+                start_x + radius, y, start_z + radius,
+            )
+        )
+        names = get_block_names(ids)
+        layer = width * width
+
+        # Column being cleared as (x, z, top y, lowest y so far), written as
+        # one setBlocks run when it ends
+        run = None
+
+        def write_run():
+            if run:
+                run_x, run_z, top, low = run
+                mc.setBlocks(run_x, low, run_z, run_x, top, run_z, 0)  # Set to Air
+
         try:
             for x_offset in range(-radius, radius + 1):
                 for z_offset in range(-radius, radius + 1):
+                    column = (x_offset + radius) * width + (z_offset + radius)
                     for depth in range(max_depth):
                         self._check_pause(agent)
 
@@ -54,20 +81,24 @@ class GridSearch(MiningStrategy):
                         target_z = start_z + z_offset
                         target_y = y - depth
 
-                        block_id = agent.mc.getBlock(target_x, target_y, target_z)
+                        index = (target_y - bottom_y) * layer + column
 
                         # If it's not Air (0) or Bedrock (7), mine it
-                        if block_id not in [0, 7]:
-                            block_name = get_block_name(block_id)
+                        if ids[index] not in (0, 7):
+                            block_name = names[index]
                             loot[block_name] = loot.get(block_name, 0) + 1
-                            agent.mc.setBlock(
-                                target_x, target_y, target_z, 0
-                            )  # Set to Air
+                            if run and run[3] == target_y + 1 and run[:2] == (target_x, target_z):
+                                run = (target_x, target_z, run[2], target_y)
+                            else:
+                                write_run()
+                                run = (target_x, target_z, target_y, target_y)
                             # agent.logger.info(f"Mined {block_name}")
 
         except InterruptedError:
             agent.logger.info("Strategy execution interrupted.")
             return loot
+        finally:
+            write_run()
 
         agent.logger.info(f"Grid Search complete. Yield: {loot}")
         return loot
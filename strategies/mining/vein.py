@@ -3,16 +3,26 @@ import mcpi.block as block
 from core.fsm import AgentState
 import time
 
+# The 6 face neighbours in push order: the stack pops them +x, -x, +y, -y,
+# +z, -z, the order the recursive walk visited them in
+_NEIGHBOR_OFFSETS = (
+    (0, 0, -1),
+    (0, 0, 1),
+    (0, -1, 0),
+    (0, 1, 0),
+    (-1, 0, 0),
+    (1, 0, 0),
+)
+
 
 class VeinMiner(MiningStrategy):
     """
-    Mines an entire vein of ore by recursively checking neighbors.
+    Mines an entire vein of ore by walking connected neighbors.
     """
 
     def _check_pause(self, agent):
         """Helper to pause execution if agent is paused."""
-        while agent.state == AgentState.PAUSED:
-            time.sleep(1)
+        agent.wait_while_paused()
         if agent.state == AgentState.STOPPED:
             raise InterruptedError("Agent stopped")
 
@@ -60,47 +70,61 @@ class VeinMiner(MiningStrategy):
 
     def _mine_vein(self, agent, x, y, z, target_id, visited):
         """
-        Recursive function to mine connected blocks of the same ID.
-        """
-        self._check_pause(agent)
-
-        loot = {}
-        if (x, y, z) in visited:
-            return loot
+        Mines every block of target_id connected to (x, y, z).
 
-        visited.add((x, y, z))
-
-        # Verify block is still the target (it might have changed or we might have drifted)
-        current_id = agent.mc.getBlock(x, y, z)
-        if current_id != target_id:
-            return loot
-
-        # Mine the block
-        agent.mc.setBlock(x, y, z, block.AIR.id)
-        agent.logger.info(f"Mined ore at {x}, {y}, {z}")
+        Walks the vein depth-first with an explicit stack, in the same order
+        the recursive version did, so deep veins cannot hit the recursion limit.
+        """
+        get_blocks = agent.mc.getBlocks
+        set_block = agent.mc.setBlock
+        air_id = block.AIR.id
+
+        # (x, y, z) -> block id, filled a 3x3x3 cube per getBlocks call so the
+        # neighbours of a mined block are usually known without another RPC
+        ids = {}
+
+        mined = 0
+        stack = [(x, y, z)]
+        while stack:
+            self._check_pause(agent)
+
+            pos = stack.pop()
+            if pos in visited:
+                continue
+            visited.add(pos)
+
+            x, y, z = pos
+            if pos not in ids:
+                # getBlocks returns the cuboid y-major, then x, then z. Only
+                # unknown cells are filled: our own setBlocks may still be
+                # buffered and not yet visible to the server.
+                cube = iter(get_blocks(x - 1, y - 1, z - 1, x + 1, y + 1, z + 1))
+                for cy in (y - 1, y, y + 1):
+                    for cx in (x - 1, x, x + 1):
+                        for cz in (z - 1, z, z + 1):
+                            ids.setdefault((cx, cy, cz), next(cube))
+
+            # Verify block is still the target (it might have changed or we might have drifted)
+            if ids[pos] != target_id:
+                continue
+
+            # Mine the block
+            set_block(x, y, z, air_id)
+            ids[pos] = air_id
+            agent.logger.info(f"Mined ore at {x}, {y}, {z}")
+            mined += 1
+
+            time.sleep(0.5)
+
+            # Check neighbors (Standard 6 directions); known non-ore cells
+            # are skipped
+            for dx, dy, dz in _NEIGHBOR_OFFSETS:
+                n = (x + dx, y + dy, z + dz)
+                if ids.get(n, target_id) == target_id and n not in visited:
+                    stack.append(n)
 
         # Only counting the target ore for simplicity
         # We need to map ID to name for loot
         # Assuming we don't have access to get_block_name easily here unless we import it
         # Since this file didn't have it imported, let's just use string key "ORE" for now or fix imports
-        loot["ORE"] = 1
-
-        time.sleep(0.5)
-
-        # Check neighbors (Standard 6 directions)
-        neighbors = [
-            (x + 1, y, z),
-            (x - 1, y, z),
-            (x, y + 1, z),
-            (x, y - 1, z),
-            (x, y, z + 1),
-            (x, y, z - 1),
-        ]
-
-        for nx, ny, nz in neighbors:
-            if agent.mc.getBlock(nx, ny, nz) == target_id:
-                res = self._mine_vein(agent, nx, ny, nz, target_id, visited)
-                for k, v in res.items():
-                    loot[k] = loot.get(k, 0) + v
-
-        return loot
+        return {"ORE": mined} if mined else {}
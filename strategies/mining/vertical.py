@@ -13,11 +13,14 @@ class VerticalSearch(MiningStrategy):
 
     def _check_pause(self, agent):
         """Helper to pause execution if agent is paused."""
-        while agent.state == AgentState.PAUSED:
-            time.sleep(1)
+        agent.wait_while_paused()
         if agent.state == AgentState.STOPPED:
             raise InterruptedError("Agent stopped")
 
+    def supported_materials(self):
+        # Deep shaft down to bedrock passes through the ore layers
+        return ("COAL_ORE", "IRON_ORE", "GOLD_ORE", "DIAMOND_ORE")
+
     def execute(self, agent, start_loc=None):
         """
         Executes the vertical mining strategy.
@@ -41,13 +44,26 @@ class VerticalSearch(MiningStrategy):
 
         loot = {}
         max_depth = 50
+        delay = getattr(agent, "dig_delay", 0.0)
+
+        # The whole shaft in one getBlocks read, bottom block first; digging
+        # only clears blocks that have already been read
+        column = list(
+            agent.mc.getBlocks(
+                start_x, y - max_depth + 1, start_z, start_x, y, start_z
+            )
+        )
+
+        # Lowest block dug so far; the shaft from there up is cleared with one
+        # setBlocks (re-setting air in between is a no-op)
+        lowest = None
 
         try:
             for depth in range(max_depth):
                 self._check_pause(agent)
                 target_y = y - depth
 
-                block_id = agent.mc.getBlock(start_x, target_y, start_z)
+                block_id = column[-1 - depth]
 
                 if block_id == 7:  # Bedrock
                     agent.logger.info("Hit Bedrock. Stopping.")
@@ -56,13 +72,17 @@ class VerticalSearch(MiningStrategy):
                 if block_id != 0:
                     block_name = get_block_name(block_id)
                     loot[block_name] = loot.get(block_name, 0) + 1
-                    agent.mc.setBlock(start_x, target_y, start_z, 0)
+                    lowest = target_y
 
-                time.sleep(0.5)
+                if delay:
+                    time.sleep(delay)
 
         except InterruptedError:
             agent.logger.info("Strategy execution interrupted.")
             return loot
+        finally:
+            if lowest is not None:
+                agent.mc.setBlocks(start_x, lowest, start_z, start_x, y, start_z, 0)
 
         agent.logger.info(f"Vertical Search complete. Yield: {loot}")
         return loot
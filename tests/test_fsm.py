@@ -13,13 +13,24 @@ class MockFsmAgent(BaseAgent):
     def act(self): pass
 
 
-class TestFSM(unittest.TestCase):
+class TestFSMSharedAgent(unittest.TestCase):
+    """Tests that leave no subscribers or overrides behind share one agent."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.bus = MessageBus()
+        cls.agent = MockFsmAgent("SharedAgent", cls.bus)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.bus.shutdown()
+
     def setUp(self):
-        self.bus = MessageBus()
-        self.agent = MockFsmAgent("TestAgent", self.bus)
+        self.agent.transition_state(AgentState.IDLE, "Reset for test")
 
     def test_initial_state(self):
         """Test that a new agent starts in IDLE state."""
+        self.assertEqual(MockFsmAgent("FreshAgent").state, AgentState.IDLE)
         self.assertEqual(self.agent.state, AgentState.IDLE)
 
     def test_valid_transition(self):
@@ -27,19 +38,29 @@ class TestFSM(unittest.TestCase):
         self.agent.transition_state(AgentState.RUNNING, "Starting up")
         self.assertEqual(self.agent.state, AgentState.RUNNING)
 
+
+class TestFSM(unittest.TestCase):
+    def setUp(self):
+        self.bus = MessageBus()
+        self.addCleanup(self.bus.shutdown)
+        self.agent = MockFsmAgent("TestAgent", self.bus)
+        # Set by on_change callbacks so tests wait for delivery, not a fixed sleep
+        self.changed = threading.Event()
+
     def test_state_change_event(self):
         """Test that a transition publishes the correct event."""
         # Create a subscriber to verify the message
         received = []
         def on_change(msg):
             received.append(msg)
+            self.changed.set()
         
         self.bus.subscribe("agent.state_change.v1", on_change)
 
         self.agent.transition_state(AgentState.PAUSED, "Pausing for test")
         
         # Allow async bus to process
-        time.sleep(0.1)
+        self.assertTrue(self.changed.wait(1.0))
         
         self.assertEqual(len(received), 1)
         msg = received[0]
@@ -55,12 +76,13 @@ class TestFSM(unittest.TestCase):
         received = []
         def on_change(msg):
             received.append(msg)
+            self.changed.set()
         self.bus.subscribe("agent.state_change.v1", on_change)
         
         # Redundant transition
         self.agent.transition_state(AgentState.RUNNING, "Redundant start")
         
-        time.sleep(0.1)
+        self.assertFalse(self.changed.wait(0.05))
         self.assertEqual(len(received), 0, "Should not publish event if state is unchanged")
 
     def test_thread_safety(self):
@@ -70,9 +92,11 @@ class TestFSM(unittest.TestCase):
         # but mostly we want to ensure no crash and final state is valid.
         
         def task():
+            running, idle = AgentState.RUNNING, AgentState.IDLE
+            transition = self.agent.transition_state
             for _ in range(100):
-                self.agent.transition_state(AgentState.RUNNING, "Stress test")
-                self.agent.transition_state(AgentState.IDLE, "Stress test")
+                transition(running, "Stress test")
+                transition(idle, "Stress test")
 
         threads = [threading.Thread(target=task) for _ in range(5)]
         for t in threads: t.start()
@@ -81,5 +105,113 @@ class TestFSM(unittest.TestCase):
         # Just ensure we verify it's a valid enum
         self.assertIsInstance(self.agent.state, AgentState)
 
+    def test_transition_throughput(self):
+        """Test that every one of a long run of real transitions publishes exactly one event."""
+        for _ in range(500):
+            self.agent.transition_state(AgentState.RUNNING, "Throughput")
+            self.agent.transition_state(AgentState.RUNNING, "Redundant")
+            self.agent.transition_state(AgentState.IDLE, "Throughput")
+
+        events = [
+            m.payload for m in self.bus._history if m.type == "agent.state_change.v1"
+        ]
+        self.assertEqual(len(events), 1000)
+        self.assertEqual({e["reason"] for e in events}, {"Throughput"})
+        self.assertEqual(self.agent.state, AgentState.IDLE)
+
+    def test_transition_lock_orders_events(self):
+        """Test that simultaneous transitions publish an unbroken chain of state changes."""
+        barrier = threading.Barrier(2)
+
+        def task():
+            barrier.wait()
+            for _ in range(10):
+                self.agent.transition_state(AgentState.RUNNING, "Contended")
+                self.agent.transition_state(AgentState.IDLE, "Contended")
+
+        threads = [threading.Thread(target=task) for _ in range(2)]
+        for t in threads: t.start()
+        for t in threads: t.join()
+
+        # History is appended under the agent's lock, so each event picks up
+        # exactly where the previous one left off
+        events = [
+            m.payload for m in self.bus._history if m.type == "agent.state_change.v1"
+        ]
+        self.assertTrue(events)
+        self.assertEqual(events[0]["previous_state"], "IDLE")
+        for before, after in zip(events, events[1:]):
+            self.assertEqual(after["previous_state"], before["new_state"])
+        self.assertEqual(events[-1]["new_state"], self.agent.state.name)
+
+    def test_slotted_subclass_has_no_dict(self):
+        """Test that BaseAgent's slots let a slotted subclass drop __dict__."""
+        class SlottedAgent(BaseAgent):
+            __slots__ = ()
+            def perceive(self): pass
+            def decide(self): pass
+            def act(self): pass
+
+        agent = SlottedAgent("Slotted", self.bus)
+        self.assertFalse(hasattr(agent, "__dict__"))
+        agent.transition_state(AgentState.RUNNING, "Start")
+        self.assertEqual(agent.state, AgentState.RUNNING)
+
+    def test_wait_while_paused_wakes_on_resume(self):
+        """Test that a paused waiter returns promptly once the agent resumes."""
+        self.agent.transition_state(AgentState.RUNNING, "Start")
+        self.agent.transition_state(AgentState.PAUSED, "Pause")
+
+        timer = threading.Timer(
+            0.1, self.agent.transition_state, (AgentState.RUNNING, "Resume")
+        )
+        timer.start()
+        start = time.time()
+        self.agent.wait_while_paused()
+        elapsed = time.time() - start
+        timer.join()
+
+        self.assertEqual(self.agent.state, AgentState.RUNNING)
+        self.assertLess(elapsed, 0.5)
+
+    def test_run_loop_wakes_on_transition(self):
+        """Test that an idle run loop ticks and exits promptly on state changes."""
+        ticked = threading.Event()
+        self.agent.act = ticked.set
+
+        loop = threading.Thread(target=self.agent._run_loop)
+        loop.start()
+        time.sleep(0.1)  # Let the loop settle into its idle wait
+
+        start = time.time()
+        self.agent.transition_state(AgentState.RUNNING, "Start")
+        self.assertTrue(ticked.wait(0.5))
+        self.agent.transition_state(AgentState.STOPPED, "Stop")
+        loop.join(0.5)
+
+        self.assertFalse(loop.is_alive())
+        self.assertLess(time.time() - start, 0.5)
+
+    def test_run_loop_skips_wait_after_progress(self):
+        """Test that a tick whose act() reports progress is not rate-limited."""
+        ticks = []
+
+        def busy_act():
+            ticks.append(1)
+            if len(ticks) >= 50:
+                self.agent.transition_state(AgentState.STOPPED, "Done")
+            return True
+
+        self.agent.act = busy_act
+        self.agent.transition_state(AgentState.RUNNING, "Start")
+
+        start = time.time()
+        self.agent._run_loop()
+
+        self.assertEqual(len(ticks), 50)
+        # 50 ticks at the 50 ms idle cadence would take 2.5 s
+        self.assertLess(time.time() - start, 0.5)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,4 +1,7 @@
+import threading
+import time
 import unittest
+from collections import deque
 from core.messaging import MessageBus, Message, MessageValidator
 from core.base_agent import BaseAgent
 
@@ -6,12 +9,15 @@ from core.base_agent import BaseAgent
 class MockAgent(BaseAgent):
     def __init__(self, name, bus):
         super().__init__(name, bus)
-        self.received_messages = []
+        # deque appends stay atomic when bus workers deliver concurrently
+        self.received_messages = deque()
+        self.received = threading.Event()
         if self.bus:
             self.bus.subscribe("test.topic", self.on_message)
 
     def on_message(self, message):
         self.received_messages.append(message)
+        self.received.set()
 
     def perceive(self):
         pass
@@ -23,10 +29,29 @@ class MockAgent(BaseAgent):
         pass
 
 
+class SignalingDeque(deque):
+    """deque that sets an event on every append, so tests can wait for one."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.appended = threading.Event()
+
+    def append(self, item):
+        super().append(item)
+        self.appended.set()
+
+
 class TestIntegration(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Read-only broadcast shared by tests that only count deliveries
+        cls.canonical_msg = Message(
+            type="test.topic", source="sender", target="all", payload={}
+        )
+
     def setUp(self):
         self.bus = MessageBus()
-        import time 
+        self.addCleanup(self.bus.shutdown)
 
     def test_pub_sub(self):
         """Test the publish-subscribe mechanism."""
@@ -42,8 +67,7 @@ class TestIntegration(unittest.TestCase):
         self.bus.publish(msg)
         
         # Wait for async dispatch
-        import time
-        time.sleep(0.1)
+        self.assertTrue(agent.received.wait(1.0))
 
         self.assertEqual(len(agent.received_messages), 1)
         self.assertEqual(agent.received_messages[0].payload["info"], "hello")
@@ -53,17 +77,121 @@ class TestIntegration(unittest.TestCase):
         agent1 = MockAgent("agent1", self.bus)
         agent2 = MockAgent("agent2", self.bus)
 
-        msg = Message(type="test.topic", source="sender", target="all", payload={})
-
-        self.bus.publish(msg)
+        self.bus.publish(self.canonical_msg)
         
         # Wait for async dispatch
-        import time
-        time.sleep(0.1)
+        self.assertTrue(agent1.received.wait(1.0))
+        self.assertTrue(agent2.received.wait(1.0))
 
         self.assertEqual(len(agent1.received_messages), 1)
         self.assertEqual(len(agent2.received_messages), 1)
 
+    def test_prefix_subscription(self):
+        """Test that a 'prefix.*' subscriber receives every matching type."""
+        received = SignalingDeque()
+        self.bus.subscribe("control.testbot.*", received.append)
+
+        # Non-matching types are filtered inside publish(), so once the
+        # matching message has arrived nothing else can follow
+        self.bus.publish(Message(type="control.testbot.build", source="s", target="t", payload={}))
+        self.bus.publish(Message(type="control.otherbot.build", source="s", target="t", payload={}))
+
+        self.assertTrue(received.appended.wait(1.0))
+
+        self.assertEqual([m.type for m in received], ["control.testbot.build"])
+
+    def test_exclude_source_subscription(self):
+        """Test that a subscriber never receives messages from its excluded source."""
+        received = SignalingDeque()
+        self.bus.subscribe("test.lock", received.append, exclude_source="me")
+
+        # Excluded sources are filtered inside publish(), like unmatched types
+        self.bus.publish(Message(type="test.lock", source="me", target="all", payload={}))
+        self.bus.publish(Message(type="test.lock", source="peer", target="all", payload={}))
+
+        self.assertTrue(received.appended.wait(1.0))
+
+        self.assertEqual([m.source for m in received], ["peer"])
+
+    def test_publish_does_not_wait_for_subscribers(self):
+        """Test that publish returns before a slow subscriber finishes."""
+        release = threading.Event()
+        done = SignalingDeque()
+
+        def slow(msg):
+            release.wait(1)
+            done.append(msg)
+
+        self.bus.subscribe("test.slow", slow)
+
+        start = time.time()
+        self.bus.publish(Message(type="test.slow", source="s", target="t", payload={}))
+        self.assertLess(time.time() - start, 0.5)
+        self.assertEqual(len(done), 0)
+
+        release.set()
+        self.assertTrue(done.appended.wait(1.0))
+        self.assertEqual(len(done), 1)
+
+    def test_failed_callback_is_retried_then_dead_lettered(self):
+        """Test that a failing subscriber is retried off-worker, then dead-lettered."""
+        from core import messaging
+
+        calls = []
+
+        def flaky(msg):
+            calls.append(msg)
+            raise RuntimeError("boom")
+
+        self.bus._dead_letters = SignalingDeque(maxlen=messaging.HISTORY_LIMIT)
+        self.bus.subscribe("test.flaky", flaky)
+        self.bus.publish(Message(type="test.flaky", source="s", target="t", payload={}))
+
+        self.assertTrue(self.bus._dead_letters.appended.wait(1.0))
+
+        self.assertEqual(len(calls), messaging.DISPATCH_MAX_ATTEMPTS)
+        self.assertEqual(len(self.bus._dead_letters), 1)
+        self.assertEqual(self.bus._dead_letters[0][0].type, "test.flaky")
+
+    def test_history_is_bounded(self):
+        """Test that the bus only retains the most recent messages."""
+        from core import messaging
+
+        for i in range(messaging.HISTORY_LIMIT + 5):
+            self.bus.publish(Message(type="test.history", source="s", target="t", payload={"i": i}))
+
+        self.assertEqual(len(self.bus._history), messaging.HISTORY_LIMIT)
+        self.assertEqual(self.bus._history[0].payload["i"], 5)
+
+    def test_default_timestamp_is_utc_iso8601(self):
+        """Test that the cached timestamp factory yields an aware UTC time."""
+        from datetime import datetime, timezone
+
+        msg = Message(type="test.ts", source="s", target="t", payload={})
+        parsed = datetime.fromisoformat(msg.timestamp)
+
+        self.assertEqual(parsed.utcoffset(), timezone.utc.utcoffset(None))
+        self.assertLess(abs((datetime.now(timezone.utc) - parsed).total_seconds()), 1)
+        self.assertTrue(MessageValidator.validate(msg.to_dict()))
+
+    def test_shutdown_stops_bus_threads(self):
+        """Test that shutdown() ends the dispatcher and retry threads, and is idempotent."""
+        self.bus.shutdown()
+        self.bus.shutdown()
+
+        self.assertFalse(self.bus._fan_out_thread.is_alive())
+        self.assertFalse(self.bus._retry_thread.is_alive())
+
+    def test_publish_after_shutdown_is_history_only(self):
+        """Test that messages published after shutdown() are recorded but never queued."""
+        self.bus.subscribe("test.late", lambda msg: None)
+        self.bus.shutdown()
+
+        self.bus.publish(Message(type="test.late", source="s", target="t", payload={}))
+
+        self.assertEqual(self.bus._history[-1].type, "test.late")
+        self.assertTrue(self.bus._outbox.empty())
+
     def test_message_validation_rejection(self):
         """Test that the validator rejects messages with missing fields."""
         invalid_data = {
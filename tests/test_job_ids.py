@@ -0,0 +1,101 @@
+import threading
+import unittest
+from types import SimpleNamespace
+from core.messaging import Message, MessageBus
+from agents.builder_bot import BuilderBot
+from agents.miner_bot import MinerBot
+
+
+def requirements(reqs, job_id):
+    return Message(
+        type="materials.requirements.v1",
+        source="BuilderBot",
+        target="MinerBot",
+        payload={"requirements": reqs, "job_id": job_id},
+    )
+
+
+class FakeMinecraft:
+    """Answers the calls mine() makes before its first strategy attempt."""
+
+    def __init__(self):
+        self.player = SimpleNamespace(getTilePos=lambda: SimpleNamespace(x=0, y=64, z=0))
+
+    def queue_chat(self, text):
+        pass
+
+    def postToChat(self, text):
+        pass
+
+    def flush(self):
+        pass
+
+
+class TestMinerBotJobs(unittest.TestCase):
+    def setUp(self):
+        self.bus = MessageBus()
+        self.addCleanup(self.bus.shutdown)
+        self.bot = MinerBot("MinerBot", self.bus)
+
+    def test_small_request_overtakes_large_one(self):
+        """Test that a smaller request with a job id is served before a larger, older one."""
+        self.bot.on_requirements_received(requirements({"STONE": 64}, 1))
+        self.bot.on_requirements_received(requirements({"STONE": 4}, 2))
+
+        self.assertEqual(self.bot._queue_head()[3], 2)
+
+    def test_delivery_echoes_job_id(self):
+        """Test that the inventory.v1 delivery names the job it was mined for."""
+        delivered = []
+        received = threading.Event()
+
+        def on_inventory(msg):
+            delivered.append(msg.payload)
+            received.set()
+
+        self.bus.subscribe("inventory.v1", on_inventory)
+        self.bot.mc = FakeMinecraft()
+        self.bot.inventory.update({"STONE": 4})
+        self.bot.on_requirements_received(requirements({"STONE": 4}, 7))
+
+        self.bot.mine()
+
+        self.assertTrue(received.wait(timeout=5))
+        self.assertEqual(delivered[0]["job_id"], 7)
+        self.assertIsNone(self.bot._queue_head())
+
+
+class TestBuilderBotJobs(unittest.TestCase):
+    def setUp(self):
+        self.bus = MessageBus()
+        self.addCleanup(self.bus.shutdown)
+        self.bot = BuilderBot("BuilderBot", self.bus)
+        self.bot.selected_strategy_key = next(iter(self.bot.strategy_map))
+
+    def queue_build(self, site):
+        self.bot._store_scan_results([site])
+        self.bot.on_build_command(None)
+        return self.bot._pending_index[tuple(site)]
+
+    def test_delivery_credits_the_named_job(self):
+        """Test that a delivery naming a job completes that job, not the oldest one."""
+        first = self.queue_build((0, 0, 64))
+        second = self.queue_build((32, 32, 64))
+
+        self.bot.on_inventory_received(
+            Message(
+                type="inventory.v1",
+                source="MinerBot",
+                target="BuilderBot",
+                payload={"inventory": dict(second.bom), "job_id": second.job_id},
+            )
+        )
+
+        self.assertEqual(second.status, "READY_TO_BUILD")
+        self.assertEqual(first.status, "waiting_for_materials")
+        self.assertFalse(first.collected)
+        self.assertIs(self.bot._next_ready_job(), second)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+from core.messaging import MessageBus
+from agents.lumber_bot import LumberBot, WOOD_ID
+
+
+class FakeMinecraft:
+    """Answers the calls harvest_wood makes with one trunk next to the player."""
+
+    def __init__(self, trunks=1):
+        self.trunks = trunks
+        self.cuboids = []
+        self.player = SimpleNamespace(getTilePos=lambda: SimpleNamespace(x=0, y=64, z=0))
+
+    def getBlocks(self, *coords):
+        self.cuboids.append(coords)
+        return [WOOD_ID] * self.trunks + [0] * 100
+
+
+class TestLumberBotAct(unittest.TestCase):
+    def setUp(self):
+        self.bus = MessageBus()
+        self.addCleanup(self.bus.shutdown)
+        self.bot = LumberBot("LumberBot", self.bus)
+        self.bot.mc = FakeMinecraft()
+        self.bot._ground_level = lambda x0, z0, width: 63
+
+    def chop_one(self, x, y, z):
+        self.bot.wood_inventory += 1
+
+    def test_act_reports_progress_while_wood_is_still_needed(self):
+        """Test that act() asks for an immediate rescan after chopping short of the request."""
+        self.bot.pending_req = 5
+
+        with mock.patch.object(self.bot, "_chop_tree", self.chop_one):
+            self.assertTrue(self.bot.act())
+
+        self.assertEqual(self.bot.wood_inventory, 1)
+
+    def test_act_reports_no_progress_once_request_is_met(self):
+        """Test that act() lets the loop wait once the request has been delivered."""
+        self.bot.pending_req = 1
+
+        with mock.patch.object(self.bot, "_chop_tree", self.chop_one), mock.patch.object(
+            self.bot, "_deliver_wood"
+        ) as deliver:
+            self.assertFalse(self.bot.act())
+
+        deliver.assert_called_once()
+
+    def test_act_reports_no_progress_without_trees(self):
+        """Test that a scan that finds no trees does not skip the tick wait."""
+        self.bot.mc = FakeMinecraft(trunks=0)
+        self.bot.pending_req = 5
+        # Cut the rescan back-off short
+        self.bot._wake_event.set()
+
+        self.assertFalse(self.bot.act())
+
+
+    def test_scan_covers_ten_layers_above_ground(self):
+        """Test that the tree scan reads ten layers, starting just above the ground."""
+        self.bot.pending_req = 5
+
+        with mock.patch.object(self.bot, "_chop_tree", self.chop_one):
+            self.bot.act()
+
+        _, y0, _, _, y1, _ = self.bot.mc.cuboids[0]
+        self.assertEqual((y0, y1), (64, 73))
+
+
+if __name__ == "__main__":
+    unittest.main()
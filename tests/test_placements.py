@@ -0,0 +1,67 @@
+import unittest
+from agents.builder_bot import BuilderBot
+
+
+def expand(boxes):
+    """Replays setBlocks boxes into a {(x, y, z): (block_id, meta)} world."""
+    world = {}
+    for x1, y1, z1, x2, y2, z2, block_id, meta in boxes:
+        for x in range(x1, x2 + 1):
+            for y in range(y1, y2 + 1):
+                for z in range(z1, z2 + 1):
+                    world[(x, y, z)] = (block_id, meta)
+    return world
+
+
+class TestCoalescePlacements(unittest.TestCase):
+    def test_solid_square_is_one_box(self):
+        """Test that a uniform square collapses into a single setBlocks box."""
+        placements = [(x, 5, z, 4, 0) for x in range(3) for z in range(3)]
+
+        boxes = BuilderBot._coalesce_placements(placements)
+
+        self.assertEqual(boxes, [(0, 5, 0, 2, 5, 2, 4, 0)])
+
+    def test_ring_covers_exactly_its_cells(self):
+        """Test that a hollow ring is covered without filling its centre."""
+        placements = [
+            (x, 0, z, 1, 0)
+            for x in range(5)
+            for z in range(5)
+            if x in (0, 4) or z in (0, 4)
+        ]
+
+        boxes = BuilderBot._coalesce_placements(placements)
+
+        self.assertEqual(expand(boxes), {(x, y, z): (1, 0) for x, y, z, _, _ in placements})
+        self.assertLess(len(boxes), len(placements))
+
+    def test_later_placement_overwrites_earlier(self):
+        """Test that the last placement at a coordinate wins, meta included."""
+        placements = [
+            (0, 0, 0, 4, 0),
+            (1, 0, 0, 4, 0),
+            (0, 0, 0, 17, 2),
+            (1, 0, 0, 17, 2),
+            (2, 0, 0, 4, 0),
+        ]
+
+        world = expand(BuilderBot._coalesce_placements(placements))
+
+        self.assertEqual(
+            world,
+            {(0, 0, 0): (17, 2), (1, 0, 0): (17, 2), (2, 0, 0): (4, 0)},
+        )
+
+    def test_layers_and_gaps_stay_separate(self):
+        """Test that boxes never span different y levels or non-adjacent rows."""
+        placements = [(0, 0, 0, 4, 0), (0, 1, 0, 4, 0), (0, 0, 2, 4, 0)]
+
+        boxes = BuilderBot._coalesce_placements(placements)
+
+        self.assertEqual(len(boxes), 3)
+        self.assertEqual(expand(boxes), {(x, y, z): (4, 0) for x, y, z, _, _ in placements})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,149 @@
+import io
+import threading
+import unittest
+from types import SimpleNamespace
+from mcpi.connection import Connection, RequestError
+from core.utils import BatchedMinecraft, connection_lock, pipeline_requests
+
+
+class FakeConnection:
+    """Records raw writes and answers reads from a canned reply buffer."""
+
+    def __init__(self, replies=""):
+        self.sent = []
+        self.replies = replies
+        self.socket = self
+
+    def _send(self, data):
+        self.sent.append(data)
+
+    def makefile(self, mode):
+        return io.StringIO(self.replies)
+
+
+class TestPipelineRequests(unittest.TestCase):
+    def test_requests_share_one_write_and_replies_keep_order(self):
+        """Test that every request goes out in one write and replies map back in order."""
+        conn = FakeConnection("64\n70\n-3\n")
+
+        replies = pipeline_requests(conn, b"world.getHeight", [(1, 2), (3, 4), (5, 6)])
+
+        self.assertEqual(
+            conn.sent,
+            [b"world.getHeight(1,2)\nworld.getHeight(3,4)\nworld.getHeight(5,6)\n"],
+        )
+        self.assertEqual(replies, ["64", "70", "-3"])
+
+    def test_empty_batch_sends_nothing(self):
+        """Test that an empty batch neither writes nor reads."""
+        conn = FakeConnection()
+
+        self.assertEqual(pipeline_requests(conn, b"world.getBlock", []), [])
+        self.assertEqual(conn.sent, [])
+
+    def test_failed_reply_raises(self):
+        """Test that a Fail line anywhere in the batch raises RequestError."""
+        conn = FakeConnection(f"1\n{Connection.RequestFailed}\n")
+
+        with self.assertRaises(RequestError):
+            pipeline_requests(conn, b"world.getBlock", [(0, 0, 0), (1, 1, 1)])
+
+
+class BlockingReader:
+    """Reply reader whose first readline waits until the test releases it."""
+
+    def __init__(self, reading, release):
+        self.reading = reading
+        self.release = release
+
+    def readline(self):
+        self.reading.set()
+        self.release.wait(timeout=5)
+        return "64\n"
+
+    def close(self):
+        pass
+
+
+class TestConnectionLock(unittest.TestCase):
+    def test_chat_post_waits_for_pipelined_replies(self):
+        """Test that a chat post from another thread is written only after the batch's replies are read."""
+        conn = FakeConnection()
+        reading, release = threading.Event(), threading.Event()
+        conn.makefile = lambda mode: BlockingReader(reading, release)
+        replies = []
+
+        def scan():
+            replies.extend(pipeline_requests(conn, b"world.getHeight", [(0, 0)] * 3))
+
+        def post_chat():
+            with connection_lock(conn):
+                conn._send(b"chat.post(Scan queued.)\n")
+
+        scanner = threading.Thread(target=scan)
+        scanner.start()
+        self.assertTrue(reading.wait(timeout=5))
+        poster = threading.Thread(target=post_chat)
+        poster.start()
+        poster.join(timeout=0.1)
+
+        # The post is held back while replies are still unread
+        self.assertTrue(poster.is_alive())
+        self.assertEqual(len(conn.sent), 1)
+
+        release.set()
+        scanner.join(timeout=5)
+        poster.join(timeout=5)
+
+        self.assertEqual(replies, ["64", "64", "64"])
+        self.assertEqual(conn.sent[1], b"chat.post(Scan queued.)\n")
+
+
+class TestBatchedMinecraft(unittest.TestCase):
+    def setUp(self):
+        self.conn = FakeConnection()
+        self.mc = BatchedMinecraft(
+            SimpleNamespace(conn=self.conn, getBlock=lambda x, y, z: 7), max_pending=4
+        )
+
+    def test_writes_wait_for_flush_and_go_out_in_order(self):
+        """Test that buffered writes are sent in one write, in call order, on flush."""
+        self.mc.setBlock(1.7, 2, 3, 4)
+        self.mc.setBlocks(0, 0, 0, 1, 1, 1, 0)
+        self.mc.queue_chat("done")
+        self.assertEqual(self.conn.sent, [])
+
+        self.assertEqual(self.mc.flush(), 3)
+        self.assertEqual(
+            self.conn.sent,
+            [
+                b"world.setBlock(1,2,3,4)\n"
+                b"world.setBlocks(0,0,0,1,1,1,0)\n"
+                b"chat.post(done)\n"
+            ],
+        )
+
+    def test_empty_flush_sends_nothing(self):
+        """Test that flushing an empty buffer does not touch the socket."""
+        self.assertEqual(self.mc.flush(), 0)
+        self.assertEqual(self.conn.sent, [])
+
+    def test_full_buffer_flushes_automatically(self):
+        """Test that reaching max_pending sends the buffer without an explicit flush."""
+        for x in range(5):
+            self.mc.setBlock(x, 0, 0, 1)
+
+        self.assertEqual(len(self.conn.sent), 1)
+        self.assertEqual(self.conn.sent[0].count(b"\n"), 4)
+        self.assertEqual(self.mc.flush(), 1)
+
+    def test_reads_pass_through_unbuffered(self):
+        """Test that non-write calls reach the wrapped Minecraft directly."""
+        self.mc.setBlock(0, 0, 0, 1)
+
+        self.assertEqual(self.mc.getBlock(0, 0, 0), 7)
+        self.assertEqual(self.conn.sent, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
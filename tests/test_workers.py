@@ -0,0 +1,71 @@
+import unittest
+from unittest import mock
+from core.fsm import AgentState
+from core.messaging import MessageBus
+from agents.chat_bot import ChatBot
+from agents.miner_bot import MinerBot
+
+
+class TestChatBotWorker(unittest.TestCase):
+    def setUp(self):
+        self.bus = MessageBus()
+        self.addCleanup(self.bus.shutdown)
+        self.bot = ChatBot("ChatBot", self.bus)
+
+    def test_stop_shuts_down_connection_worker(self):
+        """Test that stopping ChatBot shuts down its Minecraft call worker."""
+        self.bot.transition_state(AgentState.STOPPED, "test")
+
+        self.assertTrue(self.bot._mc_pool._shutdown)
+
+    def test_calls_after_stop_are_dropped(self):
+        """Test that a chat call queued after a stop is dropped instead of raising."""
+        self.bot.transition_state(AgentState.STOPPED, "test")
+
+        self.assertIsNone(self.bot._submit(print, "late"))
+
+
+class TestMinerBotWorker(unittest.TestCase):
+    def setUp(self):
+        self.bus = MessageBus()
+        self.addCleanup(self.bus.shutdown)
+        self.bot = MinerBot("MinerBot", self.bus)
+
+    def test_stop_shuts_down_mining_worker(self):
+        """Test that stopping MinerBot shuts down its mining worker."""
+        self.bot.transition_state(AgentState.STOPPED, "test")
+
+        self.assertTrue(self.bot._mining_pool._shutdown)
+
+    def test_mine_after_stop_is_not_submitted(self):
+        """Test that no mining job is started once the worker is shut down."""
+        self.bot.transition_state(AgentState.STOPPED, "test")
+
+        self.bot._submit_mine()
+
+        self.assertIsNone(self.bot._mining_job)
+
+    def test_free_mine_runs_on_mining_worker(self):
+        """Test that free mining runs on the mining worker, not the agent thread."""
+        self.bot.auto_mine = True
+        self.bot.mc = None
+
+        self.bot.act()
+
+        self.assertIsNotNone(self.bot._mining_job)
+        self.bot._mining_job.result(timeout=5)
+
+    def test_waiting_for_strategy_does_not_block_the_loop(self):
+        """Test that act() returns at once while no mining strategy is selected."""
+        self.bot.mc = None
+        self.bot._enqueue_request({"STONE": 1})
+
+        with mock.patch("agents.miner_bot.time.sleep") as sleep:
+            self.assertFalse(self.bot.act())
+
+        sleep.assert_not_called()
+        self.assertIsNone(self.bot._mining_job)
+
+
+if __name__ == "__main__":
+    unittest.main()